@@ -1,16 +1,1844 @@
 import tkinter as tk
 from tkinter import colorchooser, font, ttk
-from PIL import ImageGrab, Image, ImageChops
+from PIL import ImageGrab, Image, ImageChops, ImageDraw, ImageFont, ImageTk
 from skimage.metrics import structural_similarity as ssim
+from skimage.measure import label as label_regions, regionprops
 from deep_translator import GoogleTranslator, DeeplTranslator, BaiduTranslator
 import os
 import sys
 import re
+import hashlib
+import hmac
+import secrets
+import argparse
+import io
+import json
+import mmap
+import struct
+import zlib
+import random
+import urllib.request
+import socket
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import shutil
+import subprocess
 import easyocr
 import numpy as np
 import time
 import threading
 import logging
+import gc
+import tracemalloc
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+class TextBlocks:
+    """Compact structure-of-arrays storage for OCR text blocks
+    
+    Polygons are kept as an (N, 4, 2) array of corner points in the order
+    top-left, top-right, bottom-right, bottom-left. Texts are interned in a
+    shared string table and referenced by index. Axis-aligned bounds and the
+    rotated text size are derived for the whole batch at once.
+    """
+    
+    def __init__(self, polygons=None, text_index=None, confidence=None, strings=None, line_height=None):
+        self.polygons = np.zeros((0, 4, 2), dtype=np.float32) if polygons is None else np.asarray(polygons, dtype=np.float32).reshape(-1, 4, 2)
+        self.text_index = np.zeros(0, dtype=np.int32) if text_index is None else np.asarray(text_index, dtype=np.int32)
+        self.confidence = np.zeros(0, dtype=np.float32) if confidence is None else np.asarray(confidence, dtype=np.float32)
+        self.strings = [] if strings is None else strings
+        self.update_geometry()
+        
+        # Height of a single text line; differs from text_height for merged paragraphs
+        self.line_height = self.text_height if line_height is None else np.asarray(line_height, dtype=np.float32)
+    
+    @classmethod
+    def from_ocr_results(cls, results, offset_x=0, offset_y=0, scale=1.0):
+        """Build blocks from EasyOCR (bbox, text, prob) results, mapping coordinates back"""
+        if not results:
+            return cls()
+        
+        polygons = np.array([bbox for bbox, _, _ in results], dtype=np.float32).reshape(-1, 4, 2)
+        polygons = polygons / scale + np.array([offset_x, offset_y], dtype=np.float32)
+        
+        # Intern the strings so repeated texts share one entry
+        lookup = {}
+        text_index = [lookup.setdefault(text, len(lookup)) for _, text, _ in results]
+        strings = sorted(lookup, key=lookup.get)
+        
+        confidence = [prob for _, _, prob in results]
+        return cls(polygons, text_index, confidence, strings)
+    
+    @classmethod
+    def from_rects(cls, rects, texts, confidence):
+        """Build blocks from axis-aligned (x, y, width, height) rectangles"""
+        rects = np.asarray(rects, dtype=np.float32).reshape(-1, 4)
+        x0, y0 = rects[:, 0], rects[:, 1]
+        x1, y1 = x0 + rects[:, 2], y0 + rects[:, 3]
+        polygons = np.stack([np.stack([x0, y0], 1), np.stack([x1, y0], 1),
+                             np.stack([x1, y1], 1), np.stack([x0, y1], 1)], axis=1)
+        return cls(polygons, np.arange(len(texts)), confidence, list(texts))
+    
+    def update_geometry(self):
+        """Compute axis-aligned bounds and rotated text size for all polygons"""
+        points = self.polygons
+        
+        # Axis-aligned bounds hold the whole quadrilateral, even when skewed
+        mins = np.floor(points.min(axis=1))
+        maxs = np.ceil(points.max(axis=1))
+        self.bounds = np.concatenate((mins, maxs - mins), axis=1).astype(np.int32).reshape(-1, 4)
+        
+        # Rotated size along the text direction, averaged over opposite edges
+        top = points[:, 1] - points[:, 0]
+        bottom = points[:, 2] - points[:, 3]
+        left = points[:, 3] - points[:, 0]
+        right = points[:, 2] - points[:, 1]
+        self.text_width = (np.hypot(top[:, 0], top[:, 1]) + np.hypot(bottom[:, 0], bottom[:, 1])) / 2
+        self.text_height = (np.hypot(left[:, 0], left[:, 1]) + np.hypot(right[:, 0], right[:, 1])) / 2
+        self.angle = np.degrees(np.arctan2(top[:, 1], top[:, 0]))
+    
+    @property
+    def x(self):
+        return self.bounds[:, 0]
+    
+    @property
+    def y(self):
+        return self.bounds[:, 1]
+    
+    @property
+    def width(self):
+        return self.bounds[:, 2]
+    
+    @property
+    def height(self):
+        return self.bounds[:, 3]
+    
+    @property
+    def texts(self):
+        """List of block texts in block order"""
+        strings = self.strings
+        return [strings[i] for i in self.text_index.tolist()]
+    
+    def has_text(self):
+        """Boolean mask of blocks whose text is not blank"""
+        non_blank = np.array([bool(text.strip()) for text in self.strings], dtype=bool)
+        return non_blank[self.text_index] if non_blank.size else np.zeros(len(self), dtype=bool)
+    
+    def select(self, indices):
+        """Return a subset of the blocks from an index array or boolean mask"""
+        return TextBlocks(self.polygons[indices], self.text_index[indices],
+                          self.confidence[indices], self.strings, self.line_height[indices])
+    
+    @classmethod
+    def concat(cls, blocks):
+        """Join several block sets into one, in order"""
+        blocks = [b for b in blocks if len(b)]
+        if not blocks:
+            return cls()
+        
+        texts = [text for b in blocks for text in b.texts]
+        return cls(np.concatenate([b.polygons for b in blocks]), np.arange(len(texts)),
+                   np.concatenate([b.confidence for b in blocks]), texts,
+                   np.concatenate([b.line_height for b in blocks]))
+    
+    def shifted(self, dx, dy):
+        """Return the same blocks moved by an offset"""
+        return TextBlocks(self.polygons + np.array([dx, dy], dtype=np.float32), self.text_index,
+                          self.confidence, self.strings, self.line_height)
+    
+    def with_texts(self, texts):
+        """Return the same blocks with replaced texts"""
+        return TextBlocks(self.polygons, np.arange(len(texts)), self.confidence,
+                          list(texts), self.line_height)
+    
+    def combine(self, groups, separator=" "):
+        """Combine groups of block indices into one block per group"""
+        polygons = []
+        texts = []
+        confidence = []
+        line_height = []
+        
+        for group in groups:
+            members = [self.strings[self.text_index[i]] for i in group]
+            
+            if len(group) == 1:
+                # Single blocks keep their original (possibly rotated) polygon
+                polygons.append(self.polygons[group[0]])
+            else:
+                points = self.polygons[group].reshape(-1, 2)
+                x0, y0 = points.min(axis=0)
+                x1, y1 = points.max(axis=0)
+                polygons.append(np.array([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], dtype=np.float32))
+            
+            # Join texts, repairing words hyphenated across lines
+            text = ""
+            for member in members:
+                if text.endswith("-") and member[:1].islower():
+                    text = text[:-1] + member
+                elif text:
+                    text += separator + member
+                else:
+                    text = member
+            texts.append(text)
+            
+            # Weight confidence by text length
+            lengths = np.array([max(len(member), 1) for member in members], dtype=np.float32)
+            confidence.append(float(np.dot(self.confidence[group], lengths) / lengths.sum()))
+            line_height.append(float(np.median(self.line_height[group])))
+        
+        return TextBlocks(np.array(polygons, dtype=np.float32), np.arange(len(texts)), confidence, texts, line_height)
+    
+    def __len__(self):
+        return len(self.text_index)
+    
+    def __getitem__(self, i):
+        """Return a dict view of one block for per-block consumers"""
+        x, y, width, height = self.bounds[i].tolist()
+        return {
+            "text": self.strings[self.text_index[i]],
+            "x": x,
+            "y": y,
+            "width": width,
+            "height": height,
+            "confidence": float(self.confidence[i])
+        }
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class TranslationMemory:
+    """Local translation memory with a glossary and trigram fuzzy matching
+    
+    Numbers and glossary terms are replaced by numbered slots, so lines like
+    "You have 3 potions" and "You have 4 potions" share one entry. Entries
+    are indexed by character trigrams per language pair for fuzzy lookups.
+    """
+    
+    NUMBER_PATTERN = re.compile(r'\d+(?:[.,]\d+)*')
+    SLOT_PATTERN = re.compile(r'\{(\d+)\}')
+    
+    def __init__(self, max_entries=5000, min_similarity=0.9):
+        self.max_entries = max_entries
+        self.min_similarity = min_similarity
+        self.entries = OrderedDict()  # (source, target, key) -> translated template
+        self.trigram_index = {}  # (source, target, trigram) -> set of keys
+        self.trigram_counts = {}  # (source, target, key) -> number of trigrams
+        self.glossary = {}  # source term -> target term
+        self.lookup_terms = {}  # lower-cased term -> glossary term
+        self.glossary_pattern = None
+        self.target_pattern = None
+        self.slot_pattern = self.NUMBER_PATTERN
+        self.hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+    
+    def load_glossary(self, path):
+        """Load "source = target" pairs from a UTF-8 text file"""
+        glossary = {}
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                source_term, sep, target_term = line.partition('=') if '=' in line else line.partition('\t')
+                if sep and source_term.strip():
+                    glossary[source_term.strip()] = target_term.strip()
+        
+        self.set_glossary(glossary)
+        return len(glossary)
+    
+    def set_glossary(self, glossary):
+        """Replace the glossary and invalidate entries templated with old terms"""
+        with self.lock:
+            self.glossary = dict(glossary)
+            self.lookup_terms = {term.lower(): term for term in self.glossary}
+            
+            # Longest terms first so multi-word names win over their parts
+            terms = sorted(self.glossary, key=len, reverse=True)
+            self.glossary_pattern = re.compile(
+                r'\b(' + '|'.join(re.escape(term) for term in terms) + r')\b', re.IGNORECASE
+            ) if terms else None
+            
+            # Target terms are protected when enforcing the glossary after translation
+            targets = sorted({term for term in self.glossary.values() if term}, key=len, reverse=True)
+            self.target_pattern = re.compile(
+                '(' + '|'.join(re.escape(term) for term in targets) + ')'
+            ) if targets else None
+            
+            # One pass over glossary terms and numbers, so slots never overlap
+            self.slot_pattern = re.compile(
+                self.glossary_pattern.pattern + '|' + self.NUMBER_PATTERN.pattern, re.IGNORECASE
+            ) if terms else self.NUMBER_PATTERN
+            
+            self.entries.clear()
+            self.trigram_index.clear()
+            self.trigram_counts.clear()
+    
+    def apply_glossary(self, text):
+        """Replace glossary terms in source text before translation"""
+        if not self.glossary_pattern:
+            return text
+        return self.glossary_pattern.sub(lambda m: self.glossary[self.lookup_terms[m.group(0).lower()]], text)
+    
+    def enforce_glossary(self, text):
+        """Replace glossary source terms that survived translation"""
+        if not self.glossary_pattern or not self.target_pattern:
+            return self.apply_glossary(text)
+        
+        # Leave target terms alone, even when they contain a source term
+        parts = self.target_pattern.split(text)
+        return "".join(part if i % 2 else self.apply_glossary(part) for i, part in enumerate(parts))
+    
+    def make_template(self, text):
+        """Normalize text and replace numbers and glossary terms with slots"""
+        values = []
+        
+        def slot(match):
+            term = self.lookup_terms.get(match.group(0).lower())
+            # Glossary terms are filled with their target term, numbers with themselves
+            values.append(self.glossary[term] if term is not None else match.group(0))
+            return '{%d}' % (len(values) - 1)
+        
+        normalized = self.slot_pattern.sub(slot, ' '.join(text.split()))
+        return normalized.lower(), values
+    
+    def fill_template(self, template, values):
+        """Fill numbered slots in a translated template"""
+        return self.SLOT_PATTERN.sub(
+            lambda m: values[int(m.group(1))] if int(m.group(1)) < len(values) else m.group(0), template)
+    
+    def trigrams(self, key):
+        """Character trigrams of a key, padded at the ends"""
+        padded = f"  {key} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+    
+    def lookup(self, text, source, target):
+        """Return a cached translation for text, or None on a miss"""
+        key, values = self.make_template(text)
+        
+        with self.lock:
+            entry_key = (source, target, key)
+            template = self.entries.get(entry_key)
+            
+            if template is not None:
+                self.entries.move_to_end(entry_key)
+                self.hits += 1
+                return self.fill_template(template, values)
+            
+            # Translations that did not keep every slot value were stored untemplated
+            literal_key = (source, target, ' '.join(text.split()).lower())
+            if values and literal_key in self.entries:
+                self.entries.move_to_end(literal_key)
+                self.hits += 1
+                return self.entries[literal_key]
+            
+            # Fuzzy match: count shared trigrams per candidate key
+            key_trigrams = self.trigrams(key)
+            shared = Counter()
+            for trigram in key_trigrams:
+                shared.update(self.trigram_index.get((source, target, trigram), ()))
+            
+            best_key = None
+            best_score = self.min_similarity
+            min_shared = self.min_similarity * len(key_trigrams) / 2
+            for candidate, count in shared.items():
+                if count < min_shared:
+                    continue
+                # Dice coefficient over trigram sets
+                score = 2.0 * count / (len(key_trigrams) + self.trigram_counts[(source, target, candidate)])
+                if score >= best_score and candidate.count('{') == key.count('{'):
+                    best_key, best_score = candidate, score
+            
+            if best_key is not None:
+                self.entries.move_to_end((source, target, best_key))
+                self.fuzzy_hits += 1
+                return self.fill_template(self.entries[(source, target, best_key)], values)
+            
+            self.misses += 1
+            return None
+    
+    def store(self, text, translated, source, target):
+        """Store a translation, templating slots found in both texts"""
+        if not translated:
+            return
+        
+        key, values = self.make_template(text)
+        template = self.make_translated_template(translated, values)
+        if template is None:
+            # Some slot value is missing from the translation; store it untemplated
+            key, template = ' '.join(text.split()).lower(), translated
+        
+        with self.lock:
+            entry_key = (source, target, key)
+            if entry_key not in self.entries:
+                key_trigrams = self.trigrams(key)
+                for trigram in key_trigrams:
+                    self.trigram_index.setdefault((source, target, trigram), set()).add(key)
+                self.trigram_counts[entry_key] = len(key_trigrams)
+            self.entries[entry_key] = template
+            self.entries.move_to_end(entry_key)
+            
+            while len(self.entries) > self.max_entries:
+                self.evict_oldest()
+    
+    def make_translated_template(self, translated, values):
+        """Replace each slot value in a translation with its slot, or return None if one is missing
+        
+        All values are replaced in a single pass, so digits inside slots that were already
+        inserted are never matched again.
+        """
+        if not values:
+            return translated
+        
+        # Longest values first; numbers must not match inside longer numbers
+        distinct = sorted(set(values), key=len, reverse=True)
+        pattern = re.compile(r'(?<![\d.,])(' + '|'.join(re.escape(value) for value in distinct) + r')(?![\d])')
+        unused = list(range(len(values)))
+        
+        def slot(match):
+            for i in unused:
+                if values[i] == match.group(0):
+                    unused.remove(i)
+                    return '{%d}' % i
+            return match.group(0)
+        
+        template = pattern.sub(slot, translated)
+        return template if not unused else None
+    
+    def evict_oldest(self):
+        """Remove the least recently used entry and its trigram postings"""
+        (source, target, key), _ = self.entries.popitem(last=False)
+        del self.trigram_counts[(source, target, key)]
+        for trigram in self.trigrams(key):
+            postings = self.trigram_index.get((source, target, trigram))
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self.trigram_index[(source, target, trigram)]
+    
+    def trim(self, max_entries):
+        """Evict least recently used entries until at most max_entries remain"""
+        with self.lock:
+            while len(self.entries) > max_entries:
+                self.evict_oldest()
+    
+    def stats_text(self):
+        """Short hit ratio summary for the UI"""
+        total = self.hits + self.fuzzy_hits + self.misses
+        ratio = (self.hits + self.fuzzy_hits) / total * 100 if total else 0.0
+        return f"TM hits: {self.hits + self.fuzzy_hits}/{total} ({ratio:.0f}%), fuzzy: {self.fuzzy_hits}"
+
+
+class TextStabilizer:
+    """Track text blocks across frames and vote on their text to absorb OCR jitter
+    
+    Blocks are matched to tracks by bounding box IoU and edit distance. Each
+    track keeps its recent readings and reports the majority text, so a
+    one-pixel shift or a flickering character does not count as new content.
+    New text in the same box starts a new track instead of being outvoted.
+    """
+    
+    def __init__(self, history=5, min_iou=0.5, max_edit_ratio=0.34, max_missed=2):
+        self.history = history
+        self.min_iou = min_iou
+        self.max_edit_ratio = max_edit_ratio
+        self.max_missed = max_missed
+        self.tracks = []  # {"rect", "votes", "text", "latest", "missed"}
+        self.last_signature = None
+    
+    @staticmethod
+    def edit_distance(a, b):
+        """Levenshtein distance between two strings"""
+        if len(a) < len(b):
+            a, b = b, a
+        previous = list(range(len(b) + 1))
+        for i, char_a in enumerate(a, 1):
+            current = [i]
+            for j, char_b in enumerate(b, 1):
+                current.append(min(previous[j] + 1, current[j - 1] + 1,
+                                   previous[j - 1] + (char_a != char_b)))
+            previous = current
+        return previous[-1]
+    
+    def edit_ratio(self, a, b):
+        """Edit distance relative to the longer string"""
+        longest = max(len(a), len(b))
+        return self.edit_distance(a, b) / longest if longest else 0.0
+    
+    def iou_matrix(self, track_rects, block_rects):
+        """Intersection over union of every track against every block"""
+        t = track_rects[:, None, :]
+        b = block_rects[None, :, :]
+        inter_w = np.clip(np.minimum(t[..., 0] + t[..., 2], b[..., 0] + b[..., 2]) - np.maximum(t[..., 0], b[..., 0]), 0, None)
+        inter_h = np.clip(np.minimum(t[..., 1] + t[..., 3], b[..., 1] + b[..., 3]) - np.maximum(t[..., 1], b[..., 1]), 0, None)
+        inter = inter_w * inter_h
+        union = t[..., 2] * t[..., 3] + b[..., 2] * b[..., 3] - inter
+        return inter / np.maximum(union, 1)
+    
+    def reset(self):
+        """Forget all tracks"""
+        self.tracks = []
+        self.last_signature = None
+    
+    def update(self, text_blocks):
+        """Add a frame of blocks; return whether the stable text changed and the stabilized blocks"""
+        texts = text_blocks.texts
+        block_rects = text_blocks.bounds.astype(np.float64)
+        
+        # Score candidate pairs by overlap and text similarity
+        pairs = []
+        if self.tracks and len(texts):
+            track_rects = np.array([track["rect"] for track in self.tracks], dtype=np.float64)
+            ious = self.iou_matrix(track_rects, block_rects)
+            for t, b in zip(*np.nonzero(ious >= 0.1)):
+                ratio = self.edit_ratio(self.tracks[t]["text"], texts[b])
+                # Overlap alone does not make a match: new dialogue often appears in the same box
+                if ratio <= self.max_edit_ratio:
+                    pairs.append((ious[t, b] + (1.0 - ratio), t, b))
+        
+        # Greedy one-to-one matching, best pairs first
+        matched_tracks = set()
+        matched_blocks = {}
+        for _, t, b in sorted(pairs, reverse=True):
+            if t not in matched_tracks and b not in matched_blocks:
+                matched_tracks.add(t)
+                matched_blocks[b] = t
+        
+        stabilized_texts = list(texts)
+        for b, t in matched_blocks.items():
+            track = self.tracks[t]
+            track["rect"] = block_rects[b].tolist()
+            track["votes"].append(texts[b])
+            track["latest"] = texts[b]
+            track["missed"] = 0
+            # Ties go to the older reading, which keeps the current text stable
+            track["text"] = Counter(track["votes"]).most_common(1)[0][0]
+            stabilized_texts[b] = track["text"]
+        
+        # Age out tracks that disappeared for a few frames
+        for t, track in enumerate(self.tracks):
+            if t not in matched_tracks:
+                track["missed"] += 1
+        tracks = [track for track in self.tracks if track["missed"] <= self.max_missed]
+        
+        # Start tracks for new blocks
+        for b, text in enumerate(texts):
+            if b not in matched_blocks:
+                tracks.append({
+                    "rect": block_rects[b].tolist(),
+                    "votes": deque([text], maxlen=self.history),
+                    "text": text,
+                    "latest": text,
+                    "missed": 0
+                })
+        self.tracks = tracks
+        
+        # Only the stable texts decide whether the content changed
+        signature = tuple(sorted(track["text"] for track in self.tracks))
+        changed = signature != self.last_signature
+        self.last_signature = signature
+        
+        return changed, text_blocks.with_texts(stabilized_texts)
+    
+    def settling(self):
+        """Check if any track's vote still differs from its latest reading"""
+        return any(track["text"] != track["latest"] for track in self.tracks)
+
+
+class OnnxModule:
+    """Stand-in for a torch module that runs an ONNX Runtime session"""
+    
+    def __init__(self, session):
+        self.session = session
+        self.input_name = session.get_inputs()[0].name
+    
+    def __call__(self, image, *args):
+        import torch
+        outputs = self.session.run(None, {self.input_name: image.cpu().numpy()})
+        tensors = tuple(torch.from_numpy(output) for output in outputs)
+        return tensors if len(tensors) > 1 else tensors[0]
+    
+    def eval(self):
+        return self
+    
+    def to(self, device):
+        return self
+
+
+class OnnxOcrBackend:
+    """Run EasyOCR's CRAFT detector and recognizer with ONNX Runtime on the CPU
+    
+    The networks are exported from the loaded EasyOCR reader once and cached
+    in model_dir, optionally with int8 dynamic quantization. install() swaps
+    the reader's networks for ONNX Runtime sessions, so readtext keeps its
+    output format.
+    """
+    
+    def __init__(self, reader, model_dir, quantize=False, num_threads=0):
+        self.reader = reader
+        self.model_dir = model_dir
+        self.quantize = quantize
+        self.num_threads = num_threads
+    
+    def model_path(self, name):
+        """Path of a cached model file for this reader's language model"""
+        model_lang = getattr(self.reader, 'model_lang', 'default')
+        suffix = "_int8" if self.quantize else ""
+        return os.path.join(self.model_dir, f"{name}_{model_lang}{suffix}.onnx")
+    
+    def export_models(self):
+        """Export the detector and recognizer to ONNX unless already cached"""
+        import torch
+        
+        os.makedirs(self.model_dir, exist_ok=True)
+        
+        # Unwrap DataParallel if the reader was created on a GPU
+        detector = getattr(self.reader.detector, 'module', self.reader.detector)
+        recognizer = getattr(self.reader.recognizer, 'module', self.reader.recognizer)
+        
+        class RecognizerExport(torch.nn.Module):
+            # The recognizer ignores its text input for CTC decoding
+            def __init__(self, model):
+                super().__init__()
+                self.model = model
+            
+            def forward(self, image):
+                return self.model(image, None)
+        
+        exports = [
+            ("detector", detector, torch.zeros(1, 3, 640, 640),
+             ["y", "feature"], {"image": {0: "batch", 2: "height", 3: "width"},
+                                "y": {0: "batch", 1: "out_height", 2: "out_width"},
+                                "feature": {0: "batch", 2: "out_height", 3: "out_width"}}),
+            ("recognizer", RecognizerExport(recognizer), torch.zeros(1, 1, 64, 256),
+             ["preds"], {"image": {0: "batch", 3: "width"}, "preds": {0: "batch", 1: "steps"}}),
+        ]
+        
+        for name, model, dummy_input, output_names, dynamic_axes in exports:
+            float_path = os.path.join(self.model_dir, os.path.basename(self.model_path(name)).replace("_int8", ""))
+            if not os.path.exists(float_path):
+                logging.info(f"Exporting OCR {name} to {float_path}")
+                model.eval()
+                with torch.no_grad():
+                    torch.onnx.export(model, dummy_input, float_path, input_names=["image"],
+                                      output_names=output_names, dynamic_axes=dynamic_axes,
+                                      opset_version=17)
+            
+            if self.quantize and not os.path.exists(self.model_path(name)):
+                from onnxruntime.quantization import quantize_dynamic, QuantType
+                logging.info(f"Quantizing OCR {name} to int8")
+                quantize_dynamic(float_path, self.model_path(name), weight_type=QuantType.QInt8)
+    
+    def create_session(self, name):
+        """Create a CPU inference session for a cached model"""
+        import onnxruntime as ort
+        
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if self.num_threads > 0:
+            options.intra_op_num_threads = self.num_threads
+        
+        return ort.InferenceSession(self.model_path(name), options, providers=["CPUExecutionProvider"])
+    
+    def install(self):
+        """Replace the reader's torch networks with ONNX Runtime sessions"""
+        self.export_models()
+        self.reader.detector = OnnxModule(self.create_session("detector"))
+        self.reader.recognizer = OnnxModule(self.create_session("recognizer"))
+        return self.reader
+
+
+class OcrEngine(ABC):
+    """Base class for OCR engines
+    
+    Engines return EasyOCR style results: a list of (bbox, text, prob) with
+    four corner points per bbox, so extract_text_with_positions works with
+    any of them.
+    """
+    
+    name = "OCR"
+    
+    def __init__(self, languages):
+        self.languages = languages
+    
+    @classmethod
+    def is_available(cls):
+        """Whether the engine can run on this machine"""
+        return True
+    
+    @classmethod
+    def supports(cls, languages):
+        """Whether the engine can recognize all of the given languages"""
+        return True
+    
+    @abstractmethod
+    def readtext(self, image):
+        """Recognize the text in an image array as (bbox, text, prob) results"""
+
+
+class EasyOcrEngine(OcrEngine):
+    """EasyOCR with the PyTorch or ONNX Runtime inference backend"""
+    
+    name = "EasyOCR"
+    
+    def __init__(self, languages, backend="PyTorch", model_dir=None, quantize=False, num_threads=0):
+        super().__init__(languages)
+        if backend == "ONNX Runtime":
+            # Dynamically quantized PyTorch modules cannot be exported; int8 is applied to the ONNX model instead
+            self.reader = easyocr.Reader(languages, gpu=False, quantize=False)
+        else:
+            self.reader = easyocr.Reader(languages)
+        
+        if backend == "ONNX Runtime":
+            try:
+                OnnxOcrBackend(self.reader, model_dir, quantize=quantize, num_threads=num_threads).install()
+                logging.info(f"OCR running on ONNX Runtime (int8: {quantize}, threads: {num_threads or 'auto'})")
+            except Exception as e:
+                # Keep the PyTorch networks if export or loading fails
+                logging.error(f"Error initializing ONNX Runtime OCR backend: {e}")
+    
+    def readtext(self, image):
+        return self.reader.readtext(image)
+
+
+class TesseractEngine(OcrEngine):
+    """Tesseract through the local command line binary, grouped into text lines"""
+    
+    name = "Tesseract"
+    
+    # ISO 639-1 codes to Tesseract traineddata names
+    LANGUAGE_CODES = {
+        'en': 'eng', 'de': 'deu', 'fr': 'fra', 'es': 'spa', 'it': 'ita', 'pt': 'por',
+        'nl': 'nld', 'pl': 'pol', 'tr': 'tur', 'ru': 'rus', 'ja': 'jpn', 'ko': 'kor',
+        'zh': 'chi_sim', 'sv': 'swe', 'da': 'dan', 'fi': 'fin', 'cs': 'ces', 'hu': 'hun'
+    }
+    
+    installed_languages = None
+    
+    @classmethod
+    def is_available(cls):
+        return shutil.which("tesseract") is not None
+    
+    @classmethod
+    def supports(cls, languages):
+        if cls.installed_languages is None:
+            try:
+                output = subprocess.run(["tesseract", "--list-langs"], capture_output=True,
+                                        text=True, timeout=10).stdout
+                cls.installed_languages = set(output.split()[1:])
+            except (OSError, subprocess.SubprocessError):
+                cls.installed_languages = set()
+        
+        return all(cls.LANGUAGE_CODES.get(lang) in cls.installed_languages for lang in languages)
+    
+    def readtext(self, image):
+        # Pass the frame as PNG on stdin and read word boxes as TSV
+        buffer = io.BytesIO()
+        Image.fromarray(image).save(buffer, format="PNG")
+        lang = "+".join(self.LANGUAGE_CODES[lang] for lang in self.languages)
+        output = subprocess.run(["tesseract", "stdin", "stdout", "-l", lang, "--psm", "11", "tsv"],
+                                input=buffer.getvalue(), capture_output=True, timeout=30).stdout
+        
+        # Group words into lines by (block, paragraph, line)
+        lines = OrderedDict()
+        for row in output.decode("utf-8", errors="replace").splitlines()[1:]:
+            fields = row.split("\t")
+            if len(fields) < 12 or fields[0] != "5" or not fields[11].strip():
+                continue
+            left, top, width, height = (int(value) for value in fields[6:10])
+            lines.setdefault(tuple(fields[1:5]), []).append((left, top, width, height, float(fields[10]), fields[11]))
+        
+        results = []
+        for words in lines.values():
+            x0 = min(word[0] for word in words)
+            y0 = min(word[1] for word in words)
+            x1 = max(word[0] + word[2] for word in words)
+            y1 = max(word[1] + word[3] for word in words)
+            text = " ".join(word[5] for word in words)
+            confidence = max(0.0, sum(word[4] for word in words) / len(words)) / 100
+            results.append(([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], text, confidence))
+        
+        return results
+
+
+class TranslationRouter:
+    """Route translation requests across providers with hedging and circuit breakers
+    
+    Each provider keeps a window of recent latencies and failures. A request
+    goes to the first provider whose breaker is closed; if it has not
+    answered by that provider's p95 latency, the same text is also sent to
+    the next provider and the first answer wins. Providers that fail
+    several times in a row are skipped until a cooldown has passed, after
+    which a single trial request decides whether they come back. The whole
+    request never takes longer than the latency budget, and a provider call
+    still running after the budget counts as a failure. Each call runs on its
+    own daemon thread, so calls that never return cannot starve the others.
+    """
+    
+    def __init__(self, latency_budget=5.0, hedge_delay=0.0, failure_threshold=3, cooldown=30.0):
+        self.latency_budget = latency_budget  # End-to-end seconds per request
+        self.hedge_delay = hedge_delay  # Seconds before hedging, 0 = provider p95
+        self.default_hedge_delay = 1.0  # Used until a provider has latency samples
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.providers = {}
+        self.lock = threading.Lock()
+    
+    def provider(self, name):
+        """Per-provider latency window, counters and breaker state"""
+        with self.lock:
+            if name not in self.providers:
+                self.providers[name] = {"latencies": deque(maxlen=200), "outcomes": deque(maxlen=200),
+                                        "consecutive_failures": 0, "opened_at": None, "trial": False,
+                                        "hedges": 0}
+            return self.providers[name]
+    
+    def percentile(self, name, q):
+        """Latency percentile in seconds, or None without samples"""
+        latencies = self.provider(name)["latencies"]
+        return float(np.percentile(latencies, q)) if latencies else None
+    
+    def is_available(self, name):
+        """Closed breakers pass; an open breaker lets one trial through after the cooldown"""
+        state = self.provider(name)
+        with self.lock:
+            if state["opened_at"] is None:
+                return True
+            if not state["trial"] and time.monotonic() - state["opened_at"] >= self.cooldown:
+                state["trial"] = True
+                return True
+            return False
+    
+    def record(self, name, latency, error):
+        """Update a provider's statistics and breaker after a request finished"""
+        state = self.provider(name)
+        with self.lock:
+            state["outcomes"].append(error is None)
+            if error is None:
+                state["latencies"].append(latency)
+                state["consecutive_failures"] = 0
+                state["opened_at"] = None
+                state["trial"] = False
+            else:
+                state["consecutive_failures"] += 1
+                if state["trial"] or state["consecutive_failures"] >= self.failure_threshold:
+                    if state["opened_at"] is None or state["trial"]:
+                        logging.warning(f"Translation provider {name} tripped after {error}")
+                    state["opened_at"] = time.monotonic()
+                    state["trial"] = False
+    
+    def submit(self, name, request):
+        """Run request(name) on its own thread, failing it if it outlives the latency budget"""
+        start = time.perf_counter()
+        future = Future()
+        settled = threading.Lock()
+        
+        def settle(result, error):
+            # The answer or the timeout, whichever comes first, decides the outcome
+            if not settled.acquire(blocking=False):
+                return
+            self.record(name, time.perf_counter() - start, error)
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+        
+        def call():
+            try:
+                result, error = request(name), None
+            except Exception as e:
+                result, error = None, e
+            timer.cancel()
+            settle(result, error)
+        
+        # Providers may set no timeout of their own, so a hung call would never be recorded otherwise
+        timer = threading.Timer(self.latency_budget, settle, args=(
+            None, TimeoutError(f"{name} did not answer within {self.latency_budget:.1f}s")))
+        timer.daemon = True
+        timer.start()
+        threading.Thread(target=call, name=f"route-{name}", daemon=True).start()
+        return future
+    
+    def translate(self, request, providers):
+        """Return request(provider) from the fastest healthy provider within the latency budget"""
+        deadline = time.perf_counter() + self.latency_budget
+        candidates = list(dict.fromkeys(providers))
+        
+        def next_available():
+            # Availability is checked only when a provider is about to be used, since it may claim a trial
+            while candidates:
+                name = candidates.pop(0)
+                if self.is_available(name):
+                    return name
+            return None
+        
+        newest = next_available()
+        if newest is None:
+            raise RuntimeError("All translation providers are unavailable")
+        pending = {self.submit(newest, request)}
+        last_error = None
+        
+        while True:
+            # Send to the next provider if nothing is in flight
+            if not pending:
+                newest = next_available()
+                if newest is None:
+                    raise last_error or RuntimeError("All translation providers failed")
+                pending.add(self.submit(newest, request))
+            
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise TimeoutError(f"Translation latency budget of {self.latency_budget:.1f}s exceeded")
+            
+            # Wait until the hedge point of the newest request, unless there is nobody to hedge to
+            timeout = min(remaining, self.hedge_after(newest)) if candidates else remaining
+            
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                last_error = future.exception()
+            
+            # Hedge: the request in flight is slow, send the same text to the next provider too
+            if not done and candidates:
+                hedge = next_available()
+                if hedge is not None:
+                    newest = hedge
+                    self.provider(newest)["hedges"] += 1
+                    pending.add(self.submit(newest, request))
+    
+    def hedge_after(self, name):
+        """Seconds to wait for a provider before sending a hedged request"""
+        if self.hedge_delay > 0:
+            return self.hedge_delay
+        p95 = self.percentile(name, 95)
+        return p95 if p95 is not None else self.default_hedge_delay
+    
+    def stats_text(self):
+        """One line per provider with latency percentiles, error rate and breaker state"""
+        lines = []
+        for name in list(self.providers):
+            state = self.provider(name)
+            outcomes = state["outcomes"]
+            error_rate = (1 - sum(outcomes) / len(outcomes)) * 100 if outcomes else 0.0
+            p50 = self.percentile(name, 50)
+            p95 = self.percentile(name, 95)
+            latency = f"p50 {p50 * 1000:.0f}ms p95 {p95 * 1000:.0f}ms" if p50 is not None else "no samples"
+            breaker = "open" if state["opened_at"] is not None else "closed"
+            lines.append(f"{name}: {latency}, errors {error_rate:.0f}%, hedges {state['hedges']}, {breaker}")
+        return "\n".join(lines)
+
+
+class TextHeatmap:
+    """Decaying grid of where text has been found in recent frames
+    
+    Each OCR pass decays the grid and adds heat to the cells covered by the
+    recognized blocks. Cells above a threshold form the hot regions that
+    routine frames are limited to; text in other places is picked up by
+    periodic full-frame scans.
+    """
+    
+    def __init__(self, cell=16, decay=0.95, threshold=0.2, padding=1, warmup=3):
+        self.cell = cell  # Grid cell size in pixels
+        self.decay = decay  # Heat kept per OCR pass
+        self.threshold = threshold
+        self.padding = padding  # Cells added around hot regions
+        self.warmup = warmup  # Full scans before regions are trusted
+        self.heat = None
+        self.size = None
+        self.full_scans = 0
+    
+    def reset(self, size=None):
+        """Forget all heat, optionally for a new frame size"""
+        self.size = size
+        self.heat = None if size is None else np.zeros((-(-size[1] // self.cell), -(-size[0] // self.cell)), dtype=np.float32)
+        self.full_scans = 0
+    
+    def is_ready(self, size):
+        """Whether enough full scans of a frame of this size have been seen"""
+        return self.size == size and self.full_scans >= self.warmup
+    
+    def add(self, text_blocks, size, full_scan):
+        """Decay the grid and add the blocks of one OCR pass"""
+        if self.size != size:
+            self.reset(size)
+        
+        self.heat *= self.decay
+        if full_scan:
+            self.full_scans += 1
+        
+        if text_blocks:
+            bounds = text_blocks.bounds.astype(np.int64)
+            rows, cols = self.heat.shape
+            x0 = np.clip(bounds[:, 0] // self.cell, 0, cols - 1)
+            y0 = np.clip(bounds[:, 1] // self.cell, 0, rows - 1)
+            x1 = np.clip((bounds[:, 0] + bounds[:, 2]) // self.cell, 0, cols - 1)
+            y1 = np.clip((bounds[:, 1] + bounds[:, 3]) // self.cell, 0, rows - 1)
+            for bx0, by0, bx1, by1 in zip(x0, y0, x1, y1):
+                self.heat[by0:by1 + 1, bx0:bx1 + 1] += 1.0
+    
+    def hot_regions(self):
+        """Pixel rectangles (x0, y0, x1, y1) around connected hot cells"""
+        if self.heat is None:
+            return []
+        
+        hot = self.heat >= self.threshold
+        if not hot.any():
+            return []
+        
+        # Grow the hot cells so text at the edge of a region is not cut off
+        if self.padding:
+            padded = np.pad(hot, self.padding)
+            grown = np.zeros_like(padded)
+            rows, cols = hot.shape
+            for dy in range(2 * self.padding + 1):
+                for dx in range(2 * self.padding + 1):
+                    grown[dy:dy + rows, dx:dx + cols] |= hot
+            hot = grown[self.padding:self.padding + rows, self.padding:self.padding + cols]
+        
+        width, height = self.size
+        regions = []
+        for region in regionprops(label_regions(hot, connectivity=2)):
+            row0, col0, row1, col1 = region.bbox
+            regions.append((col0 * self.cell, row0 * self.cell,
+                            min(width, col1 * self.cell), min(height, row1 * self.cell)))
+        return regions
+    
+    def bounding_box(self):
+        """One rectangle enclosing all hot regions, or None"""
+        regions = self.hot_regions()
+        if not regions:
+            return None
+        regions = np.array(regions)
+        return (int(regions[:, 0].min()), int(regions[:, 1].min()), int(regions[:, 2].max()), int(regions[:, 3].max()))
+    
+    def coverage(self, regions):
+        """Share of the frame covered by the given regions"""
+        if not self.size:
+            return 1.0
+        area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in regions)
+        return area / float(self.size[0] * self.size[1])
+
+
+class QualityController:
+    """Feedback controller that trades processing quality for bounded latency
+    
+    Every processed frame reports its end-to-end latency (capture, change
+    detection, OCR and drawing). When the smoothed latency stays above the
+    target the controller steps down one level at a time through cheaper
+    modes; when it stays well below the target it steps back up. Each level
+    includes the savings of the levels before it. Levels marked inactive
+    cannot lower the latency in the current configuration and are passed
+    over.
+    """
+    
+    LEVELS = ["full", "reduced scale", "no SSIM", "dirty regions", "cached translations", "frame skipping"]
+    
+    def __init__(self, target_ms=1000.0, down_after=2, up_after=5, headroom=0.6, smoothing=0.3):
+        self.target_ms = target_ms
+        self.down_after = down_after  # Consecutive slow frames before stepping down
+        self.up_after = up_after  # Consecutive fast frames before stepping up
+        self.headroom = headroom  # Step up only below this share of the target
+        self.smoothing = smoothing
+        self.enabled = True
+        self.inactive_levels = set()
+        self.reset()
+    
+    def reset(self):
+        """Return to full quality and forget the latency history"""
+        self.level = 0
+        self.latency = None
+        self.slow_frames = 0
+        self.fast_frames = 0
+    
+    def record(self, latency_ms):
+        """Add one frame's latency, returning the new level name if the level changed"""
+        if self.latency is None:
+            self.latency = latency_ms
+        else:
+            self.latency += self.smoothing * (latency_ms - self.latency)
+        
+        if not self.enabled:
+            return None
+        
+        if self.latency > self.target_ms:
+            self.slow_frames += 1
+            self.fast_frames = 0
+        elif self.latency < self.target_ms * self.headroom:
+            self.fast_frames += 1
+            self.slow_frames = 0
+        else:
+            self.slow_frames = self.fast_frames = 0
+        
+        previous = self.level
+        if self.slow_frames >= self.down_after:
+            self.level = self.next_level(1)
+        elif self.fast_frames >= self.up_after:
+            self.level = self.next_level(-1)
+        
+        if self.level == previous:
+            return None
+        
+        # Give the new level a few frames to show its effect; the average starts from the last frame
+        self.slow_frames = self.fast_frames = 0
+        self.latency = latency_ms
+        return self.LEVELS[self.level]
+    
+    def next_level(self, step):
+        """The nearest active level in the step direction, or the current one if there is none"""
+        level = self.level + step
+        while 0 < level < len(self.LEVELS) and self.LEVELS[level] in self.inactive_levels:
+            level += step
+        return level if 0 <= level < len(self.LEVELS) else self.level
+    
+    def at_least(self, name):
+        """Check if the current level includes the savings of the named level"""
+        return self.enabled and self.level >= self.LEVELS.index(name) and name not in self.inactive_levels
+    
+    def ocr_scale(self):
+        """Extra factor for the OCR input scale"""
+        return 0.75 if self.at_least("reduced scale") else 1.0
+    
+    def interval_factor(self):
+        """Multiplier for the capture interval; every other tick is skipped when frame skipping"""
+        return 2 if self.at_least("frame skipping") else 1
+    
+    def describe(self):
+        """Summary of the current level and latency"""
+        latency = f"{self.latency:.0f} ms" if self.latency is not None else "n/a"
+        level = self.LEVELS[self.level] if self.enabled else "off"
+        return f"Quality: {level} (latency {latency}, target {self.target_ms:.0f} ms)"
+
+
+class SamplingProfiler:
+    """Low-overhead statistical profiler for the running application threads
+    
+    A daemon thread periodically reads the current stacks of the selected
+    threads through sys._current_frames() and counts identical stacks. Nothing
+    is traced or instrumented, so the cost is bounded by the sampling rate
+    and is zero while the profiler is not running. Threads parked in a wait
+    count towards their thread's samples but not towards any function.
+    """
+    
+    # (file, function) of frames where a thread sits idle; the Tk main loop waits for events in C
+    IDLE_FRAMES = {("threading.py", "wait"), ("queue.py", "get"), ("__init__.py", "mainloop")}
+    
+    def __init__(self, interval=0.01):
+        self.interval = interval  # Seconds between samples
+        self.counts = Counter()  # (thread name, frame, ...) -> samples, root frame first
+        self.thread_samples = Counter()  # Thread name -> samples taken of that thread
+        self.samples = 0
+        self.elapsed = 0.0
+        self.stop_event = threading.Event()
+        self.thread = None
+    
+    def start(self, duration, on_finish=None, thread_ids=None):
+        """Sample for duration seconds in the background, then call on_finish(profiler)
+        
+        thread_ids returns the idents of the threads to sample; it is called on every
+        tick, so threads that start later are included. All threads are sampled if None.
+        """
+        self.counts.clear()
+        self.thread_samples.clear()
+        self.samples = 0
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, args=(duration, on_finish, thread_ids), daemon=True,
+                                       name="profiler")
+        self.thread.start()
+    
+    def stop(self):
+        """End sampling early"""
+        self.stop_event.set()
+    
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+    
+    @staticmethod
+    def frame_label(frame):
+        """Function name with file and first line, safe for the collapsed format"""
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+    
+    def run(self, duration, on_finish, thread_ids=None):
+        """Sampling loop"""
+        own_id = threading.get_ident()
+        start = time.perf_counter()
+        
+        while not self.stop_event.is_set() and time.perf_counter() - start < duration:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            selected = thread_ids() if thread_ids is not None else None
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or (selected is not None and thread_id not in selected):
+                    continue
+                name = names.get(thread_id, str(thread_id))
+                self.thread_samples[name] += 1
+                if (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in self.IDLE_FRAMES:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self.frame_label(frame))
+                    frame = frame.f_back
+                stack.append(name)
+                self.counts[tuple(reversed(stack))] += 1
+            self.samples += 1
+            self.stop_event.wait(self.interval)
+        
+        self.elapsed = time.perf_counter() - start
+        if on_finish is not None:
+            on_finish(self)
+    
+    def write_collapsed(self, path):
+        """Write stacks in the collapsed format used by flamegraph.pl and speedscope"""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+    
+    def write_speedscope(self, path):
+        """Write one sampled speedscope profile per thread"""
+        frame_ids = {}
+        profiles = {}
+        for stack, count in self.counts.items():
+            thread_name, frames = stack[0], stack[1:]
+            indices = [frame_ids.setdefault(label, len(frame_ids)) for label in frames]
+            profile = profiles.setdefault(thread_name, {"samples": [], "weights": []})
+            profile["samples"].append(indices)
+            profile["weights"].append(count * self.interval)
+        
+        document = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": [{"name": label} for label in frame_ids]},
+            "profiles": [{"type": "sampled", "name": name, "unit": "seconds", "startValue": 0,
+                          "endValue": sum(profile["weights"]), **profile}
+                         for name, profile in profiles.items()],
+            "exporter": "OverText",
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f)
+    
+    def top_functions(self, n=10):
+        """The n hottest functions, as (thread, label, self share, total share) of that thread's samples"""
+        own = Counter()
+        total = Counter()
+        for stack, count in self.counts.items():
+            thread_name = stack[0]
+            if len(stack) > 1:
+                own[thread_name, stack[-1]] += count
+            # Count recursive functions once per stack
+            for label in set(stack[1:]):
+                total[thread_name, label] += count
+        
+        # Each thread is normalized by its own samples, so shares stay within 100%
+        shares = [(thread_name, label, own[thread_name, label] / self.thread_samples[thread_name],
+                   count / self.thread_samples[thread_name])
+                  for (thread_name, label), count in total.items()]
+        return sorted(shares, key=lambda item: (item[2], item[3]), reverse=True)[:n]
+    
+    def summary_text(self, n=10):
+        """Short report of the hottest functions by self time"""
+        if not self.samples:
+            return "No samples"
+        threads = ", ".join(f"{name} {count}" for name, count in self.thread_samples.most_common())
+        lines = [f"{self.samples} samples in {self.elapsed:.1f}s ({threads})"]
+        for thread_name, label, own, total in self.top_functions(n):
+            lines.append(f"{own * 100:5.1f}% self {total * 100:5.1f}% total  {label} [{thread_name}]")
+        return "\n".join(lines)
+
+
+class SessionRecorder:
+    """Write captured frames to a compact, memory-mappable session file
+    
+    The file starts with a JSON header holding the OverText settings. Each
+    frame is either a keyframe (the whole RGB image) or a delta holding only
+    the tiles that changed, XORed against the previous frame so unchanged
+    pixels inside a tile compress to nothing. Every record is zlib
+    compressed. A trailing index of record offsets allows random access
+    through mmap without decoding the whole file.
+    """
+    
+    MAGIC = b"OTREC1\n"
+    INDEX_MAGIC = b"OTRECIDX"
+    RECORD = struct.Struct("<cdHHI")  # kind, timestamp, width, height, payload length
+    INDEX_ENTRY = struct.Struct("<Qdc")  # offset, timestamp, kind
+    TRAILER = struct.Struct("<QI8s")  # index offset, frame count, magic
+    TILE = 32
+    
+    def __init__(self, path, settings=None, keyframe_interval=300, compression=6):
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.compression = compression
+        self.lock = threading.Lock()
+        self.index = []
+        self.previous = None
+        self.start_time = time.time()
+        self.bytes_written = 0
+        
+        self.file = open(path, "wb")
+        header = json.dumps({"version": 1, "created": self.start_time, "tile": self.TILE,
+                             "settings": settings or {}}).encode("utf-8")
+        self.file.write(self.MAGIC + struct.pack("<I", len(header)) + header)
+    
+    @classmethod
+    def to_tiles(cls, frame):
+        """View an (H, W, 3) frame as a (rows, cols, TILE, TILE, 3) tile grid, zero padded"""
+        height, width = frame.shape[:2]
+        padded_height = -(-height // cls.TILE) * cls.TILE
+        padded_width = -(-width // cls.TILE) * cls.TILE
+        if (padded_height, padded_width) != (height, width):
+            frame = np.pad(frame, ((0, padded_height - height), (0, padded_width - width), (0, 0)))
+        return frame.reshape(padded_height // cls.TILE, cls.TILE, padded_width // cls.TILE, cls.TILE, 3).swapaxes(1, 2)
+    
+    def add_frame(self, image, timestamp=None):
+        """Append a captured frame as a keyframe or a changed-tile delta"""
+        frame = np.asarray(image.convert("RGB"))
+        timestamp = time.time() - self.start_time if timestamp is None else timestamp
+        height, width = frame.shape[:2]
+        
+        with self.lock:
+            if self.file is None:
+                return
+            
+            tiles = self.to_tiles(frame)
+            previous = self.previous
+            is_keyframe = (previous is None or previous.shape != tiles.shape
+                           or len(self.index) % self.keyframe_interval == 0)
+            
+            if is_keyframe:
+                kind = b"K"
+                payload = frame.tobytes()
+            else:
+                kind = b"D"
+                changed = np.flatnonzero((tiles != previous).any(axis=(2, 3, 4)))
+                tile_rows, tile_cols = tiles.shape[:2]
+                flat, flat_previous = tiles.reshape(tile_rows * tile_cols, -1), previous.reshape(tile_rows * tile_cols, -1)
+                payload = (struct.pack("<I", len(changed)) + changed.astype(np.uint32).tobytes()
+                           + (flat[changed] ^ flat_previous[changed]).tobytes())
+            
+            payload = zlib.compress(payload, self.compression)
+            offset = self.file.tell()
+            self.file.write(self.RECORD.pack(kind, timestamp, width, height, len(payload)))
+            self.file.write(payload)
+            self.index.append((offset, timestamp, kind))
+            self.bytes_written = offset + self.RECORD.size + len(payload)
+            self.previous = tiles.copy()
+    
+    def close(self):
+        """Write the frame index and close the file"""
+        with self.lock:
+            if self.file is None:
+                return
+            index_offset = self.file.tell()
+            for entry in self.index:
+                self.file.write(self.INDEX_ENTRY.pack(*entry))
+            self.file.write(self.TRAILER.pack(index_offset, len(self.index), self.INDEX_MAGIC))
+            self.file.close()
+            self.file = None
+            self.previous = None
+    
+    def stats_text(self):
+        """Short summary of the recording so far"""
+        return f"Recording: {len(self.index)} frames, {self.bytes_written / 1e6:.1f} MB"
+
+
+class SessionReader:
+    """Read frames back from a session file written by SessionRecorder"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic = SessionRecorder.MAGIC
+        if self.data[:len(magic)] != magic:
+            raise ValueError(f"{path} is not an OverText session recording")
+        header_length, = struct.unpack_from("<I", self.data, len(magic))
+        self.frames_start = len(magic) + 4 + header_length
+        self.header = json.loads(self.data[len(magic) + 4:self.frames_start].decode("utf-8"))
+        self.settings = self.header.get("settings", {})
+        self.index = self.read_index()
+    
+    def read_index(self):
+        """Load the trailing index, or rebuild it by scanning if the recording was cut short"""
+        trailer = SessionRecorder.TRAILER
+        if len(self.data) >= self.frames_start + trailer.size:
+            index_offset, count, magic = trailer.unpack_from(self.data, len(self.data) - trailer.size)
+            if magic == SessionRecorder.INDEX_MAGIC:
+                entry = SessionRecorder.INDEX_ENTRY
+                return [entry.unpack_from(self.data, index_offset + i * entry.size) for i in range(count)]
+        
+        index = []
+        offset = self.frames_start
+        record = SessionRecorder.RECORD
+        while offset + record.size <= len(self.data):
+            kind, timestamp, width, height, length = record.unpack_from(self.data, offset)
+            if kind not in (b"K", b"D") or offset + record.size + length > len(self.data):
+                break
+            index.append((offset, timestamp, kind))
+            offset += record.size + length
+        return index
+    
+    def __len__(self):
+        return len(self.index)
+    
+    def duration(self):
+        """Recorded time span in seconds"""
+        return self.index[-1][1] if self.index else 0.0
+    
+    def frames(self, start=0):
+        """Yield (timestamp, PIL image) from frame start on, decoding from the preceding keyframe"""
+        # Deltas only make sense relative to the frames before them
+        first = start
+        while first > 0 and self.index[first][2] != b"K":
+            first -= 1
+        
+        record = SessionRecorder.RECORD
+        tile = SessionRecorder.TILE
+        tiles = None
+        for position in range(first, len(self.index)):
+            offset = self.index[position][0]
+            kind, timestamp, width, height, length = record.unpack_from(self.data, offset)
+            payload = zlib.decompress(self.data[offset + record.size:offset + record.size + length])
+            
+            if kind == b"K":
+                frame = np.frombuffer(payload, dtype=np.uint8).reshape(height, width, 3)
+                tiles = SessionRecorder.to_tiles(frame).copy()
+            else:
+                count, = struct.unpack_from("<I", payload)
+                changed = np.frombuffer(payload, dtype=np.uint32, count=count, offset=4)
+                flat = tiles.reshape(tiles.shape[0] * tiles.shape[1], -1)
+                flat[changed] ^= np.frombuffer(payload, dtype=np.uint8, offset=4 + 4 * count).reshape(count, -1)
+            
+            if position >= start:
+                rows, cols = tiles.shape[:2]
+                frame = tiles.swapaxes(1, 2).reshape(rows * tile, cols * tile, 3)[:height, :width]
+                yield timestamp, Image.fromarray(np.ascontiguousarray(frame))
+    
+    def close(self):
+        """Release the memory map and file"""
+        self.data.close()
+        self.file.close()
+
+
+class BitmapRenderer:
+    """Offscreen overlay renderer that composites all blocks into one image
+    
+    Backgrounds and wrapped text are drawn with Pillow instead of creating
+    canvas items, so the cost of showing a frame does not grow with the
+    number of blocks. Changed areas are tracked as dirty rectangles and
+    only those are copied to the Tk photo image.
+    """
+    
+    FONT_FALLBACKS = [("DejaVuSans.ttf", "DejaVuSans-Bold.ttf"), ("arial.ttf", "arialbd.ttf")]
+    LINE_SPACING = 4
+    
+    def __init__(self, width=1, height=1, background="black"):
+        self.background = background
+        self.fonts = {}
+        self.lock = threading.Lock()
+        self.resize(width, height)
+    
+    def resize(self, width, height):
+        """Start over with a blank image of the given size"""
+        with self.lock:
+            # RGB is enough: Tk blends photo alpha only with the canvas below, which is black too
+            self.image = Image.new("RGB", (max(1, width), max(1, height)), self.background)
+            self.draw = ImageDraw.Draw(self.image)
+            self.dirty = [(0, 0, self.image.width, self.image.height)]
+    
+    def clear(self):
+        """Erase the whole image"""
+        with self.lock:
+            self.draw.rectangle((0, 0, self.image.width, self.image.height), fill=self.background)
+            self.dirty.append((0, 0, self.image.width, self.image.height))
+    
+    def shift(self, dx, dy):
+        """Move the whole image by an offset, filling the uncovered area with the background"""
+        with self.lock:
+            shifted = Image.new("RGB", self.image.size, self.background)
+            shifted.paste(self.image, (dx, dy))
+            self.image = shifted
+            self.draw = ImageDraw.Draw(shifted)
+            self.dirty.append((0, 0, self.image.width, self.image.height))
+    
+    def get_font(self, family, size_px, bold=False):
+        """Load a TrueType font for a Tk font family, cached by family, size and weight"""
+        key = (family, size_px, bold)
+        if key not in self.fonts:
+            # Tk families don't map to files, so try common file names before the fallbacks
+            base = family.replace(" ", "")
+            candidates = [f"{base}{'bd' if bold else ''}.ttf", f"{base}-Bold.ttf" if bold else f"{base}.ttf", family]
+            candidates += [bold_file if bold else regular for regular, bold_file in self.FONT_FALLBACKS]
+            
+            font_obj = None
+            for candidate in candidates:
+                try:
+                    font_obj = ImageFont.truetype(candidate, size_px)
+                    break
+                except OSError:
+                    continue
+            self.fonts[key] = font_obj or ImageFont.load_default(size_px)
+        return self.fonts[key]
+    
+    def wrap_text(self, text, max_width, font_obj, by_character=False):
+        """Split text into lines no wider than max_width"""
+        units = list(text) if by_character else text.split()
+        joiner = "" if by_character else " "
+        
+        # Measure each unit once and add up widths instead of re-measuring whole lines
+        space = font_obj.getlength(joiner) if joiner else 0.0
+        lines = []
+        current = []
+        line_width = 0.0
+        
+        for unit in units:
+            unit_width = font_obj.getlength(unit)
+            if current and line_width + space + unit_width > max_width:
+                lines.append(joiner.join(current))
+                current = []
+                line_width = 0.0
+            line_width += (space if current else 0.0) + unit_width
+            current.append(unit)
+        
+        if current:
+            lines.append(joiner.join(current))
+        return lines
+    
+    def draw_block(self, x, y, width, height, text, font_obj, fill, background="black", by_character=False):
+        """Draw one block's background and wrapped text"""
+        # Degenerate OCR boxes have nothing to draw; Pillow rejects inverted rectangles
+        if width <= 0 or height <= 0:
+            return (x, y, x, y)
+        
+        with self.lock:
+            self.draw.rectangle((x, y, x + width - 1, y + height - 1), fill=background)
+            box = (x, y, x + width, y + height)
+            
+            if text:
+                lines = self.wrap_text(text, width, font_obj, by_character)
+                self.draw.multiline_text((x, y), "\n".join(lines), font=font_obj, fill=fill, spacing=self.LINE_SPACING)
+                
+                # Text may overflow the block; derive its extent from font metrics rather than a bbox query
+                ascent, descent = font_obj.getmetrics()
+                right = x + int(max(font_obj.getlength(line) for line in lines)) + 1
+                bottom = y + len(lines) * (ascent + descent + self.LINE_SPACING)
+                box = (box[0], box[1], max(box[2], right), max(box[3], bottom))
+            
+            self.dirty.append(box)
+            return box
+    
+    def erase(self, box):
+        """Restore the background in a previously drawn area"""
+        if box[2] <= box[0] or box[3] <= box[1]:
+            return
+        with self.lock:
+            self.draw.rectangle((box[0], box[1], box[2] - 1, box[3] - 1), fill=self.background)
+            self.dirty.append(box)
+    
+    def take_dirty(self):
+        """Return the changed region as (box, image patch) and reset the dirty list"""
+        with self.lock:
+            if not self.dirty:
+                return None, None
+            
+            # One bounding rectangle keeps the number of Tk copies per update at one
+            boxes = np.array(self.dirty)
+            self.dirty = []
+            box = (max(0, int(boxes[:, 0].min())), max(0, int(boxes[:, 1].min())),
+                   min(self.image.width, int(boxes[:, 2].max())), min(self.image.height, int(boxes[:, 3].max())))
+            if box[2] <= box[0] or box[3] <= box[1]:
+                return None, None
+            return box, self.image.crop(box)
+
+
+class LanguageIdentifier:
+    """Lightweight local language identification for short OCR texts
+    
+    Non-Latin scripts are identified from Unicode ranges. Latin text is
+    scored against small profiles of function words and characteristic
+    letters, which is enough to tell UI strings and dialogue apart by
+    language without a network round trip. Latin text with too few profile
+    words, such as a language without a profile, is left unidentified.
+    """
+    
+    # (first code point, last code point, language) for script-specific ranges
+    SCRIPT_RANGES = [
+        (0x3040, 0x30FF, 'ja'),  # Hiragana and Katakana
+        (0xAC00, 0xD7AF, 'ko'),  # Hangul syllables
+        (0x1100, 0x11FF, 'ko'),  # Hangul jamo
+        (0x4E00, 0x9FFF, 'zh'),  # CJK unified ideographs
+        (0x0400, 0x04FF, 'ru'),  # Cyrillic
+        (0x0370, 0x03FF, 'el'),  # Greek
+        (0x0E00, 0x0E7F, 'th'),  # Thai
+        (0x0600, 0x06FF, 'ar'),  # Arabic
+        (0x0590, 0x05FF, 'he'),  # Hebrew
+        (0x0900, 0x097F, 'hi'),  # Devanagari
+    ]
+    
+    LATIN_PROFILES = {
+        'en': ("the and you are is to of in it that for with this have not on your be was what",
+               ""),
+        'de': ("der die das und ist nicht ich du sie ein eine zu mit den auf sich auch es dem bitte",
+               "äöüß"),
+        'fr': ("le la les et est vous je un une des du pas que pour sur avec ce qui dans au",
+               "éèêàçùûôœ"),
+        'es': ("el la los las y es que de en un una por con para no su lo se al",
+               "ñáéíóú¿¡"),
+        'it': ("il lo la gli le e è di che un una per non con sono del della si ti",
+               "àèéìòù"),
+        'pt': ("o a os as e é de que um uma para com não do da em você se",
+               "ãõçáéêó"),
+        'nl': ("de het een en is van ik je niet dat op te zijn met voor er",
+               "ĳ"),
+    }
+    
+    WORD_PATTERN = re.compile(r"[^\W\d_]+", re.UNICODE)
+    MIN_WORD_SHARE = 0.3  # Share of words that must be profile words before Latin text gets a language
+    KANA_PATTERN = re.compile(r"[\u3040-\u30FF]")
+    
+    def __init__(self):
+        self.profiles = {lang: (set(words.split()), set(chars))
+                         for lang, (words, chars) in self.LATIN_PROFILES.items()}
+    
+    def has_letters(self, text):
+        """Whether text contains any letters, as opposed to numbers and symbols"""
+        return self.WORD_PATTERN.search(text) is not None
+    
+    def han_hint(self, texts, source=None):
+        """Language of Han-only text among these blocks: the configured source, else the neighbours' script"""
+        source_base = (source or "").lower().strip().split('-')[0]
+        if source_base in ('ja', 'zh'):
+            return source_base
+        
+        # Kana in any neighbouring block makes kanji-only lines Japanese too
+        if any(self.KANA_PATTERN.search(text) for text in texts):
+            return 'ja'
+        return None
+    
+    def identify(self, text, han_hint=None):
+        """Return (language, confidence) for text, or (None, 0.0) if unknown"""
+        # Script detection decides non-Latin text outright
+        script_counts = Counter()
+        letters = 0
+        for char in text:
+            if not char.isalpha():
+                continue
+            letters += 1
+            code = ord(char)
+            for first, last, lang in self.SCRIPT_RANGES:
+                if first <= code <= last:
+                    script_counts[lang] += 1
+                    break
+        
+        if letters == 0:
+            return None, 0.0
+        
+        if script_counts:
+            # Kana marks Japanese even when mixed with Han characters
+            if script_counts['ja']:
+                return 'ja', 1.0
+            lang, count = script_counts.most_common(1)[0]
+            # Han characters alone are shared by Chinese and Japanese
+            if lang == 'zh' and han_hint:
+                lang = han_hint
+            if count >= letters / 2:
+                return lang, count / letters
+        
+        # Latin text: function words and characteristic letters
+        words = [word.lower() for word in self.WORD_PATTERN.findall(text)]
+        chars = set(text.lower())
+        scores = Counter()
+        matches = {}
+        for lang, (profile_words, profile_chars) in self.profiles.items():
+            matches[lang] = sum(word in profile_words for word in words)
+            scores[lang] = 2 * matches[lang] + len(chars & profile_chars)
+        
+        best = scores.most_common(2)
+        if not best or best[0][1] == 0:
+            return None, 0.0
+        
+        # A stray stopword does not make a language; text no profile covers stays unknown
+        matched = matches[best[0][0]]
+        if matched < min(2, len(words)) or matched < len(words) * self.MIN_WORD_SHARE:
+            return None, 0.0
+        
+        # Confidence grows with the margin over the runner-up
+        top_score = best[0][1]
+        runner_up = best[1][1] if len(best) > 1 else 0
+        return best[0][0], (top_score - runner_up) / top_score
+
+
+class ControlServer:
+    """Local control interface for triggering captures from other programs
+    
+    Clients send one command per line, either as JSON such as
+    {"command": "set-region", "x": 0, "y": 0, "width": 800, "height": 200}
+    or as plain words such as "set-region 0 0 800 200", and get one JSON
+    reply per line. A Unix domain socket is used where available, with a
+    localhost TCP port as the fallback on Windows. TCP clients must first
+    send "auth <token>" with the token from the settings folder, and any
+    line that is not a known command closes the connection, so web pages
+    cannot drive the overlay with cross-protocol requests.
+    """
+    
+    DEFAULT_PORT = 47800
+    COMMANDS = {"capture", "pause", "resume", "set-region", "set-languages", "status"}
+    
+    def __init__(self, handle_command, address=None):
+        self.handle_command = handle_command  # (command, params) -> reply dict, called on a server thread
+        self.address = address if address is not None else self.default_address()
+        self.server = None
+    
+    @staticmethod
+    def default_address():
+        """Unix socket in the settings folder, or a localhost port where Unix sockets are unavailable"""
+        if hasattr(socket, "AF_UNIX") and os.name != "nt":
+            return os.path.join(os.path.expanduser("~"), ".OverText", "control.sock")
+        return ("127.0.0.1", ControlServer.DEFAULT_PORT)
+    
+    @staticmethod
+    def token_path():
+        """File holding the shared secret for TCP clients"""
+        return os.path.join(os.path.expanduser("~"), ".OverText", "control.token")
+    
+    @staticmethod
+    def load_token(create=False):
+        """The TCP token, created readable by the current user only if asked, or None if there is none"""
+        path = ControlServer.token_path()
+        try:
+            with open(path, encoding="utf-8") as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            if not create:
+                return None
+        
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        token = secrets.token_hex(16)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(token)
+        return token
+    
+    @staticmethod
+    def parse_address(text):
+        """A socket path, or host:port / port for TCP"""
+        if re.fullmatch(r"\d+", text):
+            return ("127.0.0.1", int(text))
+        host, _, port = text.rpartition(":")
+        if host and port.isdigit() and os.sep not in text:
+            return (host, int(port))
+        return text
+    
+    @staticmethod
+    def parse_command(line):
+        """Split a JSON or plain-text command line into the command name and its parameters"""
+        if line.startswith("{"):
+            params = json.loads(line)
+            return str(params.pop("command", "")).lower(), params
+        parts = line.split()
+        return parts[0].lower(), {"args": parts[1:]}
+    
+    def describe(self):
+        """Human-readable address for the status label"""
+        if isinstance(self.address, tuple):
+            return f"{self.address[0]}:{self.address[1]}"
+        return self.address
+    
+    def start(self):
+        """Start serving on a background thread"""
+        handle_command = self.handle_command
+        
+        # Any local process can connect to a TCP port, so TCP clients have to prove they can read the token
+        token = ControlServer.load_token(create=True) if isinstance(self.address, tuple) else None
+        
+        class CommandHandler(socketserver.StreamRequestHandler):
+            def reply(self, reply):
+                self.wfile.write((json.dumps(reply, ensure_ascii=False) + "\n").encode("utf-8"))
+                self.wfile.flush()
+            
+            def handle(self):
+                authenticated = token is None
+                for raw in self.rfile:
+                    line = raw.decode("utf-8", errors="replace").strip()
+                    if not line:
+                        continue
+                    
+                    # Stop at the first line that is not a command, such as an HTTP request
+                    try:
+                        command, params = ControlServer.parse_command(line)
+                    except ValueError as e:
+                        self.reply({"ok": False, "error": f"Invalid command line: {e}"})
+                        return
+                    if command not in ControlServer.COMMANDS and command != "auth":
+                        self.reply({"ok": False, "error": f"Unknown command: {command}"})
+                        return
+                    
+                    if not authenticated:
+                        offered = (params.get("args") or [params.get("token") or ""])[0]
+                        if command != "auth" or not hmac.compare_digest(str(offered), token):
+                            self.reply({"ok": False, "error": "Authentication required"})
+                            return
+                        authenticated = True
+                        self.reply({"ok": True})
+                        continue
+                    if command == "auth":
+                        self.reply({"ok": True})
+                        continue
+                    
+                    try:
+                        self.reply(handle_command(command, params))
+                    except Exception as e:
+                        self.reply({"ok": False, "error": str(e)})
+        
+        if isinstance(self.address, tuple):
+            socketserver.ThreadingTCPServer.allow_reuse_address = True
+            self.server = socketserver.ThreadingTCPServer(self.address, CommandHandler)
+        else:
+            os.makedirs(os.path.dirname(self.address) or ".", exist_ok=True)
+            
+            # Remove a stale socket left by a previous run, but never steal one that is in use
+            if os.path.exists(self.address):
+                try:
+                    ControlServer.send("status", self.address, timeout=1.0)
+                    raise OSError(f"Another instance is listening on {self.address}")
+                except (ConnectionError, FileNotFoundError, socket.timeout):
+                    os.unlink(self.address)
+            
+            self.server = socketserver.ThreadingUnixStreamServer(self.address, CommandHandler)
+            os.chmod(self.address, 0o600)  # Only the current user may control the overlay
+        
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+    
+    def stop(self):
+        """Stop serving and remove the socket file"""
+        if self.server is None:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+        if not isinstance(self.address, tuple) and os.path.exists(self.address):
+            os.unlink(self.address)
+    
+    @staticmethod
+    def send(command, address=None, timeout=120.0):
+        """Send one command line to a running instance and return its decoded reply"""
+        address = address if address is not None else ControlServer.default_address()
+        family = socket.AF_INET if isinstance(address, tuple) else socket.AF_UNIX
+        with socket.socket(family, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(address)
+            with sock.makefile("rb") as reply:
+                if family == socket.AF_INET:
+                    sock.sendall(f"auth {ControlServer.load_token() or ''}\n".encode("utf-8"))
+                    answer = json.loads(reply.readline() or b"{}")
+                    if not answer.get("ok"):
+                        return answer
+                sock.sendall(command.strip().encode("utf-8") + b"\n")
+                return json.loads(reply.readline() or b"{}")
+
 
 class OverText:
     def __init__(self, root):
@@ -29,6 +1857,9 @@ class OverText:
         
         # Create control panel with tabs
         self.create_control_panel()
+        
+        # Apply the CPU budget before the OCR engine starts its threads
+        self.apply_thread_budget()
 
         # Initialize OCR reader
         self.initialize_ocr_reader()
@@ -38,6 +1869,9 @@ class OverText:
         
         # Set up resize handlers
         self.setup_resize_handlers()
+        
+        # Start measuring UI responsiveness
+        self.measure_ui_lag()
     
     def init_variables(self):
         """Initialize all variables used by the application"""
@@ -52,10 +1886,60 @@ class OverText:
         # OCR settings
         self.ocr_languages = ['en', 'de']  # Default OCR languages
         self.reader = None  # Initialize to None, will create on first use
-        self.text_boxes = []
+        self.text_boxes = TextBlocks()
         self.translation_boxes = []
+        self.translation_box_index = {}  # Block index -> translation box
         self.ocr_text_boxes = []
         
+        # OCR preprocessing settings
+        self.ocr_preprocess = True
+        self.ocr_binarize = False
+        self.ocr_min_text_height = 24  # Upscale text smaller than this (pixels)
+        self.ocr_max_text_height = 64  # Downscale text larger than this (recognizer input height)
+        self.last_text_height = None  # Median text height of the last OCR pass
+        
+        # Text-region heatmap limiting OCR and change detection to where text appears
+        self.use_text_heatmap = False
+        self.text_heatmap = TextHeatmap()
+        
+        # Load shedding: cheaper processing while the pipeline falls behind
+        self.quality_controller = QualityController(target_ms=1000.0)
+        self.ocr_frame_blocks = None  # (frame, text blocks) of the last OCR pass, for dirty-region OCR
+        
+        # Scroll detection: move drawn blocks with scrolled content instead of reading everything again
+        self.detect_scrolling = True
+        self.processed_frame = None  # Frame the drawn blocks were read from
+        
+        # Prefetch margin: text just outside the overlay is read and translated before it scrolls in
+        self.prefetch_margin = 0  # Pixels captured beyond each side of the overlay; 0 disables
+        self.prefetch_axis = "Vertical"  # Margins above and below, or left and right
+        self.prefetch_chunk = 96  # Margins are read in bands this deep, so the pipeline never waits long for OCR
+        self.prefetch_overlap = 32  # Bands overlap by about one text line, so no line is only read cut in two
+        self.margin_frame = None  # (extended capture, overlay box inside it, overlay frame) of the last capture
+        self.prefetched = []  # Margin blocks in overlay coordinates: bounds, text and pixel hash
+        self.prefetch_generation = 0  # Bumped when the content is replaced rather than scrolled
+        self.scroll_origin = (0, 0)  # Total scroll since the content was last replaced
+        self.prefetch_executor = None
+        self.prefetch_future = None
+        self.ocr_lock = threading.Lock()  # The OCR reader is shared with the prefetch thread
+        self.full_scan_interval = 10  # Every Nth OCR pass and change check covers the whole frame
+        self.heatmap_ocr_count = 0
+        self.heatmap_check_count = 0
+        
+        # OCR post-processing settings
+        self.min_ocr_confidence = 0.30  # Drop fragments below this confidence
+        self.merge_mode = "Lines"  # None, Lines or Paragraphs
+        
+        # OCR engine and inference backend
+        self.ocr_engine = "EasyOCR"  # EasyOCR, Tesseract or Auto
+        self.ocr_engines = {}  # Loaded engines for the current languages
+        self.ocr_confidence_target = 0.70  # Minimum mean confidence for auto selection
+        self.auto_engine_chosen = False
+        self.ocr_backend = "PyTorch"  # PyTorch or ONNX Runtime
+        self.onnx_quantize = True
+        self.onnx_threads = 0  # 0 lets ONNX Runtime decide
+        self.onnx_model_dir = os.path.join(os.path.expanduser("~"), ".OverText", "onnx")
+        
         # Text appearance
         self.text_color = "#FFFFFF"
         self.text_font_family = "Arial"
@@ -68,11 +1952,62 @@ class OverText:
         self.text_shrink_factor = 0.9 # unused
         self.splitting_method = "Smart" # unused
 
+        # Local language identification
+        self.language_identifier = LanguageIdentifier()
+        self.skip_untranslatable = True  # Skip numbers, symbols and target-language text
+        self.detected_languages = deque(maxlen=500)  # Recently identified block languages
+        self.ocr_language_override = None  # OCR languages chosen from the suggestion
+        
+        # Progressive rendering
+        self.progressive_rendering = True
+        self.pending_text_color = "#A0A0A0"  # Source text waiting for its translation
+        self.render_generation = 0  # Bumped whenever the overlay content is replaced
+        self.translation_executor = None
+        
+        # Overlay render backend: "Canvas" items or one composited "Bitmap"
+        self.render_backend = "Canvas"
+        self.bitmap_renderer = None
+        self.bitmap_photo = None
+        self.bitmap_item = None
+        self.render_executor = None
+        self.bitmap_flush_pending = False
+        
+        # Additional target languages and JSON Lines output
+        self.language_canvases = {}  # Language -> (tab frame, canvas) in the tabs window
+        self.language_translations = {}  # Language -> block translations of the current content
+        self.rendered_views = set()  # Tabs window views drawn for the current content
+        self.wrap_cache = OrderedDict()  # (text, width, font, by character) -> wrapped text
+        self.pending_blocks = set()  # Primary-language blocks still waiting for a translation
+        self.output_path = None  # Append every frame's translations here as JSON Lines
+        self.output_frame = 0
+        self.block_areas = {}  # Drawn area per block index in the offscreen image
+        self.block_draws = {}  # draw_block arguments per block index, to redraw blocks under an erased area
+        
+        # Translation provider routing
+        self.translation_router = TranslationRouter(latency_budget=5.0)
+        self.libretranslate_url = "http://localhost:5000"  # Any LibreTranslate-compatible server
+        
+        # Translation memory and glossary
+        self.translation_memory = TranslationMemory()
+        self.use_translation_memory = True
+        
         # Capture settings
         self.save_screenshot = False
         self.change_threshold = 0.30
         self.comparison_method = "PIL"
         
+        # Resource budget
+        self.max_cores = os.cpu_count() or 1
+        self.intra_op_threads = 0  # 0 uses all budgeted cores
+        self.inter_op_threads = 1
+        self.cpu_affinity = ""  # e.g. "0-3,6"; empty allows all cores
+        self.process_niceness = max(0, os.getpriority(os.PRIO_PROCESS, 0)) if hasattr(os, "getpriority") else 0
+        self.ocr_latency = None  # Moving average of OCR time (ms)
+        self.ui_lag = None  # Moving average of Tk event loop lag (ms)
+        self.ui_lag_max = 0.0
+        self.polling = True  # Timers may run; off when captures are only triggered by commands
+        self.budget_baseline = None  # (OCR latency, UI lag) before the last budget change
+        
         # Auto-update settings
         self.auto_update = False
         self.update_interval = 1.0
@@ -81,15 +2016,69 @@ class OverText:
         self.last_screenshot = None
         self.last_text_hash = None
         
+        # Change detection cascade
+        self.cascade_ssim_threshold = 0.97  # Changed regions this similar count as unchanged
+        self.cascade_text_confirm = True
+        self.cascade_stats = Counter()
+        self.frame_hash_cache = (None, None)
+        self.cached_text_blocks = None  # (screenshot, text blocks) from change detection
+        
+        # Hidden canvas for text measurement, created on first use
+        self.measure_canvas = None
+        self.measure_item = None
+        
+        # Memory ceiling and soak testing
+        self.memory_ceiling_mb = 0  # Trim caches above this RSS, 0 = no ceiling
+        self.memory_trim_cooldown = 60.0  # Seconds between trims
+        self.memory_trim_hysteresis_mb = 64  # RSS change needed before trimming again
+        self.memory_trims = 0  # Trims since memory was last well under the ceiling
+        self.last_memory_trim = None  # (time, RSS after trimming)
+        self.soak_dir = os.path.join(os.path.expanduser("~"), ".OverText", "soak")
+        self.soak_hours = 1.0
+        self.soak_sample_interval = 60.0  # Seconds between metric samples
+        self.soak_running = False
+        self.soak_samples = []
+        
+        # Sampling profiler
+        self.profile_dir = os.path.join(os.path.expanduser("~"), ".OverText", "profiles")
+        self.profile_duration = 30  # Seconds
+        self.profiler = SamplingProfiler()
+        
+        # Session recording and replay
+        self.session_dir = os.path.join(os.path.expanduser("~"), ".OverText", "sessions")
+        self.session_recorder = None
+        self.replaying = False  # Auto-update stays idle while a recording is replayed
+        self.replay_max_speed = False
+        self.stop_replay = threading.Event()
+        
+        # Temporal text stabilization
+        self.stabilize_text = True
+        self.text_stabilizer = TextStabilizer()
+        
         # UI state
         self.show_tabs_var = tk.BooleanVar(value=False)
         self.resizing = False
         self.resize_edge = None
+        
+        # Window drag/resize coalescing
+        self.window_moving = False  # Pauses auto-update while the user drags or resizes
+        self.pending_motion = None  # Latest (x_root, y_root) not yet applied
+        self.motion_after_id = None
+        self.motion_interval_ms = 16  # Apply motion at most once per display frame (~60 Hz)
+        self.update_wake = threading.Event()  # Wakes the auto-update thread early
+        self.force_capture = False  # Process the next capture even if unchanged
+        
+        # Event-driven capture through the local control socket
+        self.control_server = None
+        self.control_address = None  # Default socket path or port when None
+        self.capture_lock = threading.Lock()  # One capture pipeline at a time, polled or commanded
+        self.paused = False  # Set by the "pause" command; keeps auto-update idle
+        self.ui_call_timeout = 10.0  # Seconds to wait for the main thread to run a command
 
-    def initialize_ocr_reader(self):
+    def initialize_ocr_reader(self, force=False):
         """Initialize or update the OCR reader with current language settings"""
         source_lang = self.source_lang.get().lower().split('-')[0]
-        target_lang = self.target_lang.get().lower().split('-')[0]
+        target_lang = self.primary_target().lower().split('-')[0]
         
         # Build language list for OCR
         languages = []
@@ -106,22 +2095,97 @@ class OverText:
         if target_lang not in languages:
             languages.append(target_lang)
         
+        # Use the suggested minimal language set when the user picked it
+        if self.ocr_language_override:
+            languages = list(self.ocr_language_override)
+        
         # Check if we need to reinitialize the reader
         current_langs = set(self.ocr_languages)
         new_langs = set(languages)
         
-        if current_langs != new_langs or self.reader is None:
+        if current_langs != new_langs or self.reader is None or force:
             logging.info(f"Initializing OCR reader with languages: {languages}")
+            self.ocr_engines = {}
             try:
-                self.reader = easyocr.Reader(languages)
+                self.reader = self.get_ocr_engine(self.ocr_engine, languages)
                 self.ocr_languages = languages
             except Exception as e:
                 logging.error(f"Error initializing OCR reader: {e}")
                 # Fallback to English if there's an error
                 if self.reader is None:
                     logging.info("Falling back to English-only OCR")
-                    self.reader = easyocr.Reader(['en'])
+                    self.reader = self.get_ocr_engine("EasyOCR", ['en'])
                     self.ocr_languages = ['en']
+    
+    def get_ocr_engine(self, name, languages):
+        """Create an OCR engine by name, reusing engines already loaded for these languages"""
+        if name == "Auto":
+            # EasyOCR until the benchmark has picked an engine for the current frames
+            self.auto_engine_chosen = False
+            name = "EasyOCR"
+        
+        if name not in self.ocr_engines:
+            if name == "Tesseract":
+                if not TesseractEngine.is_available() or not TesseractEngine.supports(languages):
+                    raise RuntimeError(f"Tesseract is not installed for languages {languages}")
+                self.ocr_engines[name] = TesseractEngine(languages)
+            else:
+                self.ocr_engines[name] = EasyOcrEngine(languages, backend=self.ocr_backend,
+                                                       model_dir=self.onnx_model_dir,
+                                                       quantize=self.onnx_quantize,
+                                                       num_threads=self.onnx_threads or self.budget_threads())
+        
+        return self.ocr_engines[name]
+    
+    def benchmark_ocr_engines(self, image):
+        """Time every usable OCR engine on a frame and pick the fastest accurate one"""
+        img_np, _ = self.preprocess_for_ocr(image)
+        if img_np is None:
+            logging.info("OCR benchmark skipped: no content in the capture area")
+            return None
+        
+        results = []
+        for engine_class in (EasyOcrEngine, TesseractEngine):
+            if not engine_class.is_available() or not engine_class.supports(self.ocr_languages):
+                continue
+            
+            try:
+                engine = self.get_ocr_engine(engine_class.name, self.ocr_languages)
+                
+                # Warm up once, then time two runs
+                engine.readtext(img_np)
+                start = time.perf_counter()
+                for _ in range(2):
+                    ocr_results = engine.readtext(img_np)
+                latency = (time.perf_counter() - start) / 2
+            except Exception as e:
+                logging.error(f"OCR benchmark failed for {engine_class.name}: {e}")
+                continue
+            
+            # Character-weighted mean confidence
+            chars = sum(len(text) for _, text, _ in ocr_results)
+            confidence = sum(prob * len(text) for _, text, prob in ocr_results) / chars if chars else 0.0
+            results.append((engine_class.name, latency, confidence))
+            logging.info(f"OCR benchmark {engine_class.name}: {latency * 1000:.0f} ms, confidence {confidence:.2f}")
+        
+        if not results:
+            return None
+        
+        # Fastest engine meeting the confidence target, else the most confident one
+        accurate = [result for result in results if result[2] >= self.ocr_confidence_target]
+        best = min(accurate, key=lambda result: result[1]) if accurate else max(results, key=lambda result: result[2])
+        
+        summary = ", ".join(f"{name} {latency * 1000:.0f} ms / {confidence:.2f}" for name, latency, confidence in results)
+        self.ocr_benchmark_label.config(text=f"{summary} -> {best[0]}")
+        return best[0]
+    
+    def select_ocr_engine(self, image):
+        """Run the benchmark on a frame and switch to the engine it picks"""
+        best = self.benchmark_ocr_engines(image)
+        if best is not None:
+            self.reader = self.get_ocr_engine(best, self.ocr_languages)
+            self.auto_engine_chosen = True
+            logging.info(f"OCR engine selected: {best}")
 
     def setup_main_window(self):
         """Set up the main transparent overlay window"""
@@ -134,6 +2198,9 @@ class OverText:
         total_height = self.height + (self.border_width * 2)
         self.root.geometry(f"{total_width}x{total_height}+100+100")
         
+        # Screen resolution for converting pixel sizes to font points
+        self.screen_dpi = self.root.winfo_fpixels('1i')
+        
         # Main outer frame with border
         self.outer_frame = tk.Frame(self.root, bg="#C0C0C0", borderwidth=self.border_width)
         self.outer_frame.pack(fill=tk.BOTH, expand=True)
@@ -153,13 +2220,14 @@ class OverText:
         # Make window draggable
         self.frame.bind("<ButtonPress-1>", self.start_drag)
         self.frame.bind("<B1-Motion>", self.on_drag)
+        self.frame.bind("<ButtonRelease-1>", self.stop_resize)
     
     def create_control_panel(self):
         """Create the tabbed control panel for all settings"""
         self.control_panel = tk.Toplevel(self.root)
         self.control_panel.title("Controls")
         self.control_panel.attributes("-topmost", True)
-        self.control_panel.geometry("320x500+10+10")
+        self.control_panel.geometry("340x560+10+10")
         
         # Create notebook for tabs
         self.control_tabs = ttk.Notebook(self.control_panel)
@@ -168,20 +2236,22 @@ class OverText:
         # Create tabs
         self.window_tab = ttk.Frame(self.control_tabs)
         self.appearance_tab = ttk.Frame(self.control_tabs)
-        self.translation_tab = ttk.Frame(self.control_tabs)
-        self.capture_tab = ttk.Frame(self.control_tabs)
         
-        # Add tabs to notebook
+        # Add tabs to notebook, long tabs scroll vertically
         self.control_tabs.add(self.window_tab, text="Window")
         self.control_tabs.add(self.appearance_tab, text="Appearance")
-        self.control_tabs.add(self.translation_tab, text="Translation")
-        self.control_tabs.add(self.capture_tab, text="Capture")
+        self.translation_tab = self.create_scrollable_tab("Translation")
+        self.ocr_settings_tab = self.create_scrollable_tab("OCR")
+        self.capture_tab = self.create_scrollable_tab("Capture")
+        self.diagnostics_tab = self.create_scrollable_tab("Diagnostics")
         
         # Set up tab contents
         self.setup_window_tab()
         self.setup_appearance_tab()
         self.setup_translation_tab()
+        self.setup_ocr_settings_tab()
         self.setup_capture_tab()
+        self.setup_diagnostics_tab()
         
         # Add action buttons at the bottom of the control panel
         self.setup_action_buttons()
@@ -189,6 +2259,43 @@ class OverText:
         # Close main window when control panel is closed
         self.control_panel.protocol("WM_DELETE_WINDOW", self.quit)
     
+    def create_scrollable_tab(self, text):
+        """Add a control panel tab whose contents scroll vertically"""
+        outer = ttk.Frame(self.control_tabs)
+        self.control_tabs.add(outer, text=text)
+        
+        canvas = tk.Canvas(outer, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(outer, orient="vertical", command=canvas.yview)
+        inner = ttk.Frame(canvas)
+        
+        # Keep the scroll region in sync with the contents
+        inner.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        canvas.create_window((0, 0), window=inner, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Scroll with the mouse wheel while the pointer is over the tab; X11 reports the wheel as buttons 4 and 5
+        wheel_bindings = {
+            "<MouseWheel>": lambda event: canvas.yview_scroll(-1 if event.delta > 0 else 1, "units"),
+            "<Button-4>": lambda event: canvas.yview_scroll(-1, "units"),
+            "<Button-5>": lambda event: canvas.yview_scroll(1, "units"),
+        }
+        
+        def bind_wheel(event):
+            for sequence, handler in wheel_bindings.items():
+                canvas.bind_all(sequence, handler)
+        
+        def unbind_wheel(event):
+            for sequence in wheel_bindings:
+                canvas.unbind_all(sequence)
+        
+        inner.bind("<Enter>", bind_wheel)
+        inner.bind("<Leave>", unbind_wheel)
+        
+        return inner
+    
     def setup_window_tab(self):
         """Set up window settings tab"""
         frame = self.window_tab
@@ -278,6 +2385,15 @@ class OverText:
         ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=2, sticky="ew", pady=10)
         row += 1
         
+        # Overlay render backend
+        tk.Label(frame, text="Renderer:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.render_backend_var = tk.StringVar(value=self.render_backend)
+        self.render_backend_dropdown = ttk.Combobox(frame, textvariable=self.render_backend_var,
+                                                   values=["Canvas", "Bitmap"], state="readonly")
+        self.render_backend_dropdown.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        self.render_backend_dropdown.bind("<<ComboboxSelected>>", lambda e: self.update_render_backend())
+        row += 1
+        
         # Option to use fixed font size vs. auto-detected
         self.use_fixed_font_size = tk.BooleanVar(value=True)
         self.fixed_font_check = tk.Checkbutton(frame, text="Use Fixed Font Size", 
@@ -302,125 +2418,515 @@ class OverText:
         self.shrink_slider.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
         row += 1
         
-        # Smart splitting method selection
-        tk.Label(frame, text="Text Splitting Method:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.splitting_var = tk.StringVar(value="Smart")
-        self.splitting_dropdown = ttk.Combobox(frame, textvariable=self.splitting_var,
-                                             values=["Smart", "Word Count", "Character Count", "Sentence"], 
-                                             state="readonly")
-        self.splitting_dropdown.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
-        """
-
-    def setup_translation_tab(self):
-        """Set up translation settings tab"""
-        frame = self.translation_tab
+        # Smart splitting method selection
+        tk.Label(frame, text="Text Splitting Method:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.splitting_var = tk.StringVar(value="Smart")
+        self.splitting_dropdown = ttk.Combobox(frame, textvariable=self.splitting_var,
+                                             values=["Smart", "Word Count", "Character Count", "Sentence"], 
+                                             state="readonly")
+        self.splitting_dropdown.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        """
+
+    def setup_translation_tab(self):
+        """Set up translation settings tab"""
+        frame = self.translation_tab
+        row = 0
+        
+        # Source and target languages
+        tk.Label(frame, text="Source Language:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.source_lang = tk.Entry(frame, width=10)
+        self.source_lang.insert(0, "auto")
+        self.source_lang.grid(row=row, column=1, padx=5, pady=5)
+        row += 1
+        
+        tk.Label(frame, text="Target Language(s):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.target_lang = tk.Entry(frame, width=10)
+        self.target_lang.insert(0, "de")
+        self.target_lang.grid(row=row, column=1, padx=5, pady=5)
+        row += 1
+
+        # OCR language refresh button
+        self.ocr_refresh_btn = tk.Button(
+            frame, 
+            text="Update OCR Languages",
+            command=self.update_ocr_languages
+        )
+        self.ocr_refresh_btn.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        # Language identification
+        self.skip_untranslatable_var = tk.BooleanVar(value=self.skip_untranslatable)
+        self.skip_untranslatable_check = tk.Checkbutton(frame, text="Skip Numbers and Target-Language Text", 
+                                                      variable=self.skip_untranslatable_var,
+                                                      command=lambda: setattr(self, 'skip_untranslatable', self.skip_untranslatable_var.get()))
+        self.skip_untranslatable_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        self.language_suggestion_label = tk.Label(frame, text="", wraplength=280, justify="left")
+        self.language_suggestion_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        self.suggested_langs_btn = tk.Button(frame, text="Use Suggested OCR Languages",
+                                           command=self.use_suggested_ocr_languages)
+        self.suggested_langs_btn.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+
+        # Translation service selection
+        tk.Label(frame, text="Translation Service:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.translation_service = tk.StringVar(value="Google")
+        self.service_dropdown = ttk.Combobox(frame, textvariable=self.translation_service,
+                                            values=["Google", "DeepL", "Baidu", "LibreTranslate"], state="readonly")
+        self.service_dropdown.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        # Secondary providers for hedged requests and failover
+        tk.Label(frame, text="Fallback Services:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.fallback_services = tk.Entry(frame, width=20)
+        self.fallback_services.grid(row=row, column=1, padx=5, pady=5)
+        row += 1
+        
+        tk.Label(frame, text="LibreTranslate URL:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.libretranslate_entry = tk.Entry(frame, width=20)
+        self.libretranslate_entry.insert(0, self.libretranslate_url)
+        self.libretranslate_entry.grid(row=row, column=1, padx=5, pady=5)
+        row += 1
+        
+        tk.Label(frame, text="Latency Budget (sec):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
+        self.latency_budget_slider = tk.Scale(frame, from_=0.5, to=15.0, resolution=0.5, orient=tk.HORIZONTAL,
+                                            command=lambda value: setattr(self.translation_router, 'latency_budget', float(value)))
+        self.latency_budget_slider.set(self.translation_router.latency_budget)
+        self.latency_budget_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        self.router_stats_label = tk.Label(frame, text="", wraplength=280, justify="left")
+        self.router_stats_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=2, sticky="ew", pady=10)
+        row += 1
+        
+        # API Keys (shown/hidden based on selected service)
+        tk.Label(frame, text="DeepL API Key:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.deepl_key = tk.Entry(frame, width=20)
+        self.deepl_key.grid(row=row, column=1, padx=5, pady=5)
+        row += 1
+        
+        tk.Label(frame, text="Baidu App ID:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.baidu_app_id = tk.Entry(frame, width=20)
+        self.baidu_app_id.grid(row=row, column=1, padx=5, pady=5)
+        row += 1
+        
+        tk.Label(frame, text="Baidu API Key:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.baidu_api_key = tk.Entry(frame, width=20)
+        self.baidu_api_key.grid(row=row, column=1, padx=5, pady=5)
+        row += 1
+        
+        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=2, sticky="ew", pady=10)
+        row += 1
+        
+        # Progressive rendering
+        self.progressive_var = tk.BooleanVar(value=self.progressive_rendering)
+        self.progressive_check = tk.Checkbutton(frame, text="Progressive Rendering", 
+                                              variable=self.progressive_var,
+                                              command=lambda: setattr(self, 'progressive_rendering', self.progressive_var.get()))
+        self.progressive_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        # Translation memory
+        self.use_tm_var = tk.BooleanVar(value=self.use_translation_memory)
+        self.use_tm_check = tk.Checkbutton(frame, text="Use Translation Memory", 
+                                         variable=self.use_tm_var,
+                                         command=lambda: setattr(self, 'use_translation_memory', self.use_tm_var.get()))
+        self.use_tm_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        self.tm_stats_label = tk.Label(frame, text=self.translation_memory.stats_text())
+        self.tm_stats_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        # Glossary file (one "source = target" pair per line)
+        tk.Label(frame, text="Glossary File:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.glossary_path = tk.Entry(frame, width=20)
+        self.glossary_path.grid(row=row, column=1, padx=5, pady=5)
+        row += 1
+        
+        self.glossary_btn = tk.Button(frame, text="Load Glossary", command=self.load_glossary)
+        self.glossary_btn.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        # Language information button
+        self.lang_info_btn = tk.Button(
+            self.translation_tab, 
+            text="Language Info", 
+            command=self.show_language_info
+        )
+        self.lang_info_btn.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+
+    def setup_capture_tab(self):
+        """Set up capture settings tab"""
+        frame = self.capture_tab
+        row = 0
+        
+        # Save screenshot option
+        self.save_screenshot_var = tk.BooleanVar(value=self.save_screenshot)
+        self.save_screenshot_check = tk.Checkbutton(frame, text="Save Screenshot", 
+                                                  variable=self.save_screenshot_var,
+                                                  command=lambda: setattr(self, 'save_screenshot', self.save_screenshot_var.get()))
+        self.save_screenshot_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        # Auto update settings
+        self.auto_update_var = tk.BooleanVar(value=self.auto_update)
+        self.auto_update_check = tk.Checkbutton(frame, text="Auto Update", 
+                                              variable=self.auto_update_var,
+                                              command=self.toggle_auto_update)
+        self.auto_update_check.grid(row=row, column=0, columnspan=2, pady=5, sticky="w")
+        row += 1
+        
+        # Update interval
+        tk.Label(frame, text="Update Interval (sec):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
+        self.interval_slider = tk.Scale(frame, from_=0.5, to=10.0, resolution=0.5,
+                                      orient=tk.HORIZONTAL, command=self.update_interval_time)
+        self.interval_slider.set(self.update_interval)
+        self.interval_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        # Load shedding
+        self.adaptive_quality_var = tk.BooleanVar(value=self.quality_controller.enabled)
+        self.adaptive_quality_check = tk.Checkbutton(frame, text="Adaptive Quality", 
+                                                   variable=self.adaptive_quality_var,
+                                                   command=self.toggle_adaptive_quality)
+        self.adaptive_quality_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        tk.Label(frame, text="Target Latency (ms):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
+        self.target_latency_slider = tk.Scale(frame, from_=200, to=5000, resolution=100, orient=tk.HORIZONTAL,
+                                            command=lambda value: setattr(self.quality_controller, 'target_ms', float(value)))
+        self.target_latency_slider.set(self.quality_controller.target_ms)
+        self.target_latency_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        self.quality_stats_label = tk.Label(frame, text=self.quality_controller.describe(), wraplength=280, justify="left")
+        self.quality_stats_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=2, sticky="ew", pady=10)
+        row += 1
+        
+        # Change detection settings
+        tk.Label(frame, text="Change Threshold (%):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
+        self.threshold_slider = tk.Scale(frame, from_=1, to=100, resolution=1,
+                                       orient=tk.HORIZONTAL, command=self.update_threshold)
+        self.threshold_slider.set(self.change_threshold * 100)
+        self.threshold_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        # Comparison method
+        tk.Label(frame, text="Comparison Method:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.comparison_var = tk.StringVar(value=self.comparison_method)
+        self.comparison_dropdown = ttk.Combobox(frame, textvariable=self.comparison_var,
+                                               values=["PIL", "SSIM", "Histogram", "Text", "Cascade"], state="readonly")
+        self.comparison_dropdown.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        self.comparison_dropdown.bind("<<ComboboxSelected>>", lambda e: self.update_comparison_method())
+        row += 1
+        
+        # Cascade options and statistics
+        self.cascade_text_var = tk.BooleanVar(value=self.cascade_text_confirm)
+        self.cascade_text_check = tk.Checkbutton(frame, text="Cascade: Confirm With OCR Text", 
+                                               variable=self.cascade_text_var,
+                                               command=lambda: setattr(self, 'cascade_text_confirm', self.cascade_text_var.get()))
+        self.cascade_text_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        self.stabilize_var = tk.BooleanVar(value=self.stabilize_text)
+        self.stabilize_check = tk.Checkbutton(frame, text="Stabilize OCR Text", 
+                                            variable=self.stabilize_var,
+                                            command=self.toggle_text_stabilization)
+        self.stabilize_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        self.cascade_stats_label = tk.Label(frame, text="", wraplength=280, justify="left")
+        self.cascade_stats_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        # Scrolled content only needs the revealed strip read
+        self.scroll_var = tk.BooleanVar(value=self.detect_scrolling)
+        self.scroll_check = tk.Checkbutton(frame, text="Detect Scrolling", 
+                                         variable=self.scroll_var,
+                                         command=lambda: setattr(self, 'detect_scrolling', self.scroll_var.get()))
+        self.scroll_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        self.scroll_stats_label = tk.Label(frame, text="", wraplength=280, justify="left")
+        self.scroll_stats_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        # Read text ahead of the overlay so it appears translated as soon as it scrolls in
+        tk.Label(frame, text="Prefetch Margin (px):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
+        self.prefetch_margin_slider = tk.Scale(frame, from_=0, to=400, resolution=20, orient=tk.HORIZONTAL,
+                                             command=lambda value: setattr(self, 'prefetch_margin', int(value)))
+        self.prefetch_margin_slider.set(self.prefetch_margin)
+        self.prefetch_margin_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        tk.Label(frame, text="Prefetch Direction:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.prefetch_axis_var = tk.StringVar(value=self.prefetch_axis)
+        self.prefetch_axis_dropdown = ttk.Combobox(frame, textvariable=self.prefetch_axis_var,
+                                                 values=["Vertical", "Horizontal"], state="readonly")
+        self.prefetch_axis_dropdown.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        self.prefetch_axis_dropdown.bind("<<ComboboxSelected>>",
+                                         lambda e: setattr(self, 'prefetch_axis', self.prefetch_axis_var.get()))
+        row += 1
+        
+        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=2, sticky="ew", pady=10)
+        row += 1
+        
+        # Resource budget for OCR and worker threads
+        tk.Label(frame, text="Max CPU Cores:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
+        self.max_cores_slider = tk.Scale(frame, from_=1, to=os.cpu_count() or 1, resolution=1,
+                                       orient=tk.HORIZONTAL)
+        self.max_cores_slider.set(self.max_cores)
+        self.max_cores_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        tk.Label(frame, text="Intra-op Threads (0 = auto):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
+        self.intra_threads_slider = tk.Scale(frame, from_=0, to=os.cpu_count() or 1, resolution=1,
+                                           orient=tk.HORIZONTAL)
+        self.intra_threads_slider.set(self.intra_op_threads)
+        self.intra_threads_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        tk.Label(frame, text="Inter-op Threads:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
+        self.inter_threads_slider = tk.Scale(frame, from_=1, to=os.cpu_count() or 1, resolution=1,
+                                           orient=tk.HORIZONTAL)
+        self.inter_threads_slider.set(self.inter_op_threads)
+        self.inter_threads_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        tk.Label(frame, text="CPU Affinity (e.g. 0-3):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.affinity_entry = tk.Entry(frame, width=10)
+        self.affinity_entry.insert(0, self.cpu_affinity)
+        self.affinity_entry.grid(row=row, column=1, padx=5, pady=5)
+        row += 1
+        
+        tk.Label(frame, text="Process Niceness:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
+        self.niceness_slider = tk.Scale(frame, from_=0, to=19, resolution=1, orient=tk.HORIZONTAL)
+        self.niceness_slider.set(self.process_niceness)
+        self.niceness_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        self.apply_budget_btn = tk.Button(frame, text="Apply Resource Budget", command=self.update_thread_budget)
+        self.apply_budget_btn.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        self.budget_stats_label = tk.Label(frame, text="", wraplength=280, justify="left")
+        self.budget_stats_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=2, sticky="ew", pady=10)
+        row += 1
+        
+        # Session recording and replay
+        self.record_session_var = tk.BooleanVar(value=False)
+        self.record_session_check = tk.Checkbutton(frame, text="Record Session", 
+                                                 variable=self.record_session_var,
+                                                 command=self.toggle_session_recording)
+        self.record_session_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        tk.Label(frame, text="Session File:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.session_path = tk.Entry(frame, width=20)
+        self.session_path.grid(row=row, column=1, padx=5, pady=5)
+        row += 1
+        
+        self.replay_speed_var = tk.BooleanVar(value=self.replay_max_speed)
+        self.replay_speed_check = tk.Checkbutton(frame, text="Replay at Max Speed", 
+                                               variable=self.replay_speed_var,
+                                               command=lambda: setattr(self, 'replay_max_speed', self.replay_speed_var.get()))
+        self.replay_speed_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        self.replay_btn = tk.Button(frame, text="Replay Session", command=self.toggle_replay)
+        self.replay_btn.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        self.session_stats_label = tk.Label(frame, text="", wraplength=280, justify="left")
+        self.session_stats_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=2, sticky="ew", pady=10)
+        row += 1
+        
+        # Event-driven capture from other programs
+        self.control_socket_var = tk.BooleanVar(value=False)
+        self.control_socket_check = tk.Checkbutton(frame, text="Control Socket", 
+                                                 variable=self.control_socket_var,
+                                                 command=self.toggle_control_socket)
+        self.control_socket_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        self.control_stats_label = tk.Label(frame, text="Off", wraplength=280, justify="left")
+        self.control_stats_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+    
+    def setup_diagnostics_tab(self):
+        """Set up the profiling tab"""
+        frame = self.diagnostics_tab
         row = 0
         
-        # Source and target languages
-        tk.Label(frame, text="Source Language:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.source_lang = tk.Entry(frame, width=10)
-        self.source_lang.insert(0, "auto")
-        self.source_lang.grid(row=row, column=1, padx=5, pady=5)
+        # Sampling profiler
+        tk.Label(frame, text="Profile Duration (sec):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
         row += 1
-        
-        tk.Label(frame, text="Target Language:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.target_lang = tk.Entry(frame, width=10)
-        self.target_lang.insert(0, "de")
-        self.target_lang.grid(row=row, column=1, padx=5, pady=5)
+        self.profile_duration_slider = tk.Scale(frame, from_=5, to=300, resolution=5, orient=tk.HORIZONTAL,
+                                              command=lambda value: setattr(self, 'profile_duration', int(value)))
+        self.profile_duration_slider.set(self.profile_duration)
+        self.profile_duration_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
         row += 1
-
-        # OCR language refresh button
-        self.ocr_refresh_btn = tk.Button(
-            frame, 
-            text="Update OCR Languages",
-            command=self.initialize_ocr_reader
-        )
-        self.ocr_refresh_btn.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        
+        self.profile_btn = tk.Button(frame, text="Start Profiling", command=self.toggle_profiling)
+        self.profile_btn.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
         row += 1
-
-        # Translation service selection
-        tk.Label(frame, text="Translation Service:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.translation_service = tk.StringVar(value="Google")
-        self.service_dropdown = ttk.Combobox(frame, textvariable=self.translation_service,
-                                            values=["Google", "DeepL", "Baidu"], state="readonly")
-        self.service_dropdown.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        
+        self.profile_summary_label = tk.Label(frame, text="", wraplength=300, justify="left",
+                                            font=("Courier", 8))
+        self.profile_summary_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
         row += 1
         
         ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=2, sticky="ew", pady=10)
         row += 1
         
-        # API Keys (shown/hidden based on selected service)
-        tk.Label(frame, text="DeepL API Key:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.deepl_key = tk.Entry(frame, width=20)
-        self.deepl_key.grid(row=row, column=1, padx=5, pady=5)
+        # Memory ceiling
+        tk.Label(frame, text="Memory Ceiling (MB, 0 = off):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
+        self.memory_ceiling_slider = tk.Scale(frame, from_=0, to=8192, resolution=128, orient=tk.HORIZONTAL,
+                                            command=lambda value: setattr(self, 'memory_ceiling_mb', int(value)))
+        self.memory_ceiling_slider.set(self.memory_ceiling_mb)
+        self.memory_ceiling_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
         row += 1
         
-        tk.Label(frame, text="Baidu App ID:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.baidu_app_id = tk.Entry(frame, width=20)
-        self.baidu_app_id.grid(row=row, column=1, padx=5, pady=5)
+        # Soak test replaying the session file from the Capture tab
+        tk.Label(frame, text="Soak Test Hours:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.soak_hours_entry = tk.Entry(frame, width=10)
+        self.soak_hours_entry.insert(0, str(self.soak_hours))
+        self.soak_hours_entry.grid(row=row, column=1, padx=5, pady=5)
         row += 1
         
-        tk.Label(frame, text="Baidu API Key:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.baidu_api_key = tk.Entry(frame, width=20)
-        self.baidu_api_key.grid(row=row, column=1, padx=5, pady=5)
+        self.soak_btn = tk.Button(frame, text="Start Soak Test", command=self.toggle_soak_test)
+        self.soak_btn.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
         
-        # Language information button
-        self.lang_info_btn = tk.Button(
-            self.translation_tab, 
-            text="Language Info", 
-            command=self.show_language_info
-        )
-        self.lang_info_btn.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
-
-    def setup_capture_tab(self):
-        """Set up capture settings tab"""
-        frame = self.capture_tab
+        self.soak_stats_label = tk.Label(frame, text="", wraplength=300, justify="left")
+        self.soak_stats_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+    
+    def setup_ocr_settings_tab(self):
+        """Set up OCR settings tab"""
+        frame = self.ocr_settings_tab
         row = 0
         
-        # Save screenshot option
-        self.save_screenshot_var = tk.BooleanVar(value=self.save_screenshot)
-        self.save_screenshot_check = tk.Checkbutton(frame, text="Save Screenshot", 
-                                                  variable=self.save_screenshot_var,
-                                                  command=lambda: setattr(self, 'save_screenshot', self.save_screenshot_var.get()))
-        self.save_screenshot_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        # OCR preprocessing options
+        self.ocr_preprocess_var = tk.BooleanVar(value=self.ocr_preprocess)
+        self.ocr_preprocess_check = tk.Checkbutton(frame, text="Preprocess OCR Input", 
+                                                 variable=self.ocr_preprocess_var,
+                                                 command=lambda: setattr(self, 'ocr_preprocess', self.ocr_preprocess_var.get()))
+        self.ocr_preprocess_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
         row += 1
         
-        # Auto update settings
-        self.auto_update_var = tk.BooleanVar(value=self.auto_update)
-        self.auto_update_check = tk.Checkbutton(frame, text="Auto Update", 
-                                              variable=self.auto_update_var,
-                                              command=self.toggle_auto_update)
-        self.auto_update_check.grid(row=row, column=0, columnspan=2, pady=5, sticky="w")
+        self.ocr_binarize_var = tk.BooleanVar(value=self.ocr_binarize)
+        self.ocr_binarize_check = tk.Checkbutton(frame, text="Binarize OCR Input", 
+                                               variable=self.ocr_binarize_var,
+                                               command=lambda: setattr(self, 'ocr_binarize', self.ocr_binarize_var.get()))
+        self.ocr_binarize_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
         row += 1
         
-        # Update interval
-        tk.Label(frame, text="Update Interval (sec):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        # Minimum OCR confidence
+        tk.Label(frame, text="Min OCR Confidence (%):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
         row += 1
-        self.interval_slider = tk.Scale(frame, from_=0.5, to=10.0, resolution=0.5,
-                                      orient=tk.HORIZONTAL, command=self.update_interval_time)
-        self.interval_slider.set(self.update_interval)
-        self.interval_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        self.confidence_slider = tk.Scale(frame, from_=0, to=100, resolution=5,
+                                        orient=tk.HORIZONTAL, command=self.update_min_confidence)
+        self.confidence_slider.set(self.min_ocr_confidence * 100)
+        self.confidence_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        # Block merging
+        tk.Label(frame, text="Merge Text Blocks:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.merge_var = tk.StringVar(value=self.merge_mode)
+        self.merge_dropdown = ttk.Combobox(frame, textvariable=self.merge_var,
+                                         values=["None", "Lines", "Paragraphs"], state="readonly")
+        self.merge_dropdown.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        self.merge_dropdown.bind("<<ComboboxSelected>>", lambda e: setattr(self, 'merge_mode', self.merge_var.get()))
+        row += 1
+        
+        # Text-region heatmap
+        self.heatmap_var = tk.BooleanVar(value=self.use_text_heatmap)
+        self.heatmap_check = tk.Checkbutton(frame, text="Limit OCR to Text Regions", 
+                                          variable=self.heatmap_var,
+                                          command=self.toggle_text_heatmap)
+        self.heatmap_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        tk.Label(frame, text="Full Scan Every N Frames:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
+        self.full_scan_slider = tk.Scale(frame, from_=2, to=60, resolution=1, orient=tk.HORIZONTAL,
+                                       command=lambda value: setattr(self, 'full_scan_interval', int(value)))
+        self.full_scan_slider.set(self.full_scan_interval)
+        self.full_scan_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        row += 1
+        
+        self.heatmap_stats_label = tk.Label(frame, text="", wraplength=280, justify="left")
+        self.heatmap_stats_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
         row += 1
         
         ttk.Separator(frame, orient="horizontal").grid(row=row, column=0, columnspan=2, sticky="ew", pady=10)
         row += 1
         
-        # Change detection settings
-        tk.Label(frame, text="Change Threshold (%):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        # OCR engine selection
+        tk.Label(frame, text="OCR Engine:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.ocr_engine_var = tk.StringVar(value=self.ocr_engine)
+        self.ocr_engine_dropdown = ttk.Combobox(frame, textvariable=self.ocr_engine_var,
+                                              values=["EasyOCR", "Tesseract", "Auto"], state="readonly")
+        self.ocr_engine_dropdown.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        self.ocr_engine_dropdown.bind("<<ComboboxSelected>>", lambda e: self.update_ocr_backend())
         row += 1
-        self.threshold_slider = tk.Scale(frame, from_=1, to=100, resolution=1,
-                                       orient=tk.HORIZONTAL, command=self.update_threshold)
-        self.threshold_slider.set(self.change_threshold * 100)
-        self.threshold_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        
+        self.ocr_benchmark_btn = tk.Button(frame, text="Benchmark OCR Engines", command=self.run_ocr_benchmark)
+        self.ocr_benchmark_btn.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
         row += 1
         
-        # Comparison method
-        tk.Label(frame, text="Comparison Method:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
-        self.comparison_var = tk.StringVar(value=self.comparison_method)
-        self.comparison_dropdown = ttk.Combobox(frame, textvariable=self.comparison_var,
-                                               values=["PIL", "SSIM", "Histogram"], state="readonly")
-        self.comparison_dropdown.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
-        self.comparison_dropdown.bind("<<ComboboxSelected>>", lambda e: self.update_comparison_method())
+        self.ocr_benchmark_label = tk.Label(frame, text="", wraplength=280, justify="left")
+        self.ocr_benchmark_label.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        # OCR inference backend
+        tk.Label(frame, text="OCR Backend:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        self.ocr_backend_var = tk.StringVar(value=self.ocr_backend)
+        self.ocr_backend_dropdown = ttk.Combobox(frame, textvariable=self.ocr_backend_var,
+                                               values=["PyTorch", "ONNX Runtime"], state="readonly")
+        self.ocr_backend_dropdown.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        self.ocr_backend_dropdown.bind("<<ComboboxSelected>>", lambda e: self.update_ocr_backend())
+        row += 1
+        
+        self.onnx_quantize_var = tk.BooleanVar(value=self.onnx_quantize)
+        self.onnx_quantize_check = tk.Checkbutton(frame, text="Int8 Quantization (ONNX)", 
+                                                variable=self.onnx_quantize_var,
+                                                command=self.update_ocr_backend)
+        self.onnx_quantize_check.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        row += 1
+        
+        tk.Label(frame, text="ONNX Threads (0 = auto):").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
+        self.onnx_threads_slider = tk.Scale(frame, from_=0, to=os.cpu_count() or 1, resolution=1,
+                                          orient=tk.HORIZONTAL)
+        self.onnx_threads_slider.set(self.onnx_threads)
+        self.onnx_threads_slider.grid(row=row, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        self.onnx_threads_slider.bind("<ButtonRelease-1>", lambda e: self.update_ocr_backend())
     
     def setup_action_buttons(self):
         """Set up action buttons at the bottom of the control panel"""
@@ -458,6 +2964,9 @@ class OverText:
         # Pack the tab control
         self.tab_control.pack(fill=tk.BOTH, expand=True)
         
+        # Views are drawn when they become visible
+        self.tab_control.bind("<<NotebookTabChanged>>", self.render_visible_view)
+        
         # Canvas for displaying translated text in tabs window
         self.tab_canvas = tk.Canvas(self.translate_tab, bg="black", highlightthickness=0)
         self.tab_canvas.pack(fill=tk.BOTH, expand=True)
@@ -497,6 +3006,144 @@ class OverText:
             # Stop the auto-update thread if it's running
             if self.update_thread and self.update_thread.is_alive():
                 self.stop_update_thread.set()
+                self.update_wake.set()
+    
+    def toggle_control_socket(self):
+        """Start or stop the local control socket"""
+        if self.control_socket_var.get():
+            server = ControlServer(self.handle_control_command, self.control_address)
+            try:
+                server.start()
+            except OSError as e:
+                logging.error(f"Control socket error: {e}")
+                self.control_socket_var.set(False)
+                self.control_stats_label.config(text=f"Error: {e}")
+                return
+            self.control_server = server
+            self.control_stats_label.config(text=f"Listening on {server.describe()}")
+            logging.info(f"Control socket listening on {server.describe()}")
+        elif self.control_server is not None:
+            self.control_server.stop()
+            self.control_server = None
+            self.control_stats_label.config(text="Off")
+    
+    def disable_polling(self):
+        """Stop every timer so the overlay is idle until a control command arrives"""
+        self.polling = False
+        self.auto_update_var.set(False)
+        self.toggle_auto_update()
+        self.auto_update_check.config(state=tk.DISABLED)
+    
+    def call_in_ui(self, func, *args):
+        """Run a function on the Tk main thread and return its result to a server thread"""
+        done = threading.Event()
+        outcome = {}
+        
+        def run():
+            try:
+                outcome["result"] = func(*args)
+            except Exception as e:
+                outcome["error"] = e
+            done.set()
+        
+        self.root.after(0, run)
+        if not done.wait(self.ui_call_timeout):
+            raise TimeoutError("The user interface did not respond")
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome.get("result")
+    
+    def handle_control_command(self, command, params):
+        """Run one control socket command and build its JSON reply"""
+        args = params.get("args", [])
+        
+        if command == "capture":
+            return self.control_capture()
+        if command == "pause":
+            self.paused = True
+            return {"ok": True, "paused": True}
+        if command == "resume":
+            self.paused = False
+            self.update_wake.set()
+            return {"ok": True, "paused": False}
+        if command == "set-region":
+            values = args or [params.get(key) for key in ("x", "y", "width", "height")]
+            try:
+                x, y, width, height = (int(value) for value in values)
+            except (TypeError, ValueError):
+                raise ValueError("set-region needs x, y, width and height")
+            if width < 50 or height < 50:
+                raise ValueError("The region must be at least 50x50 pixels")
+            self.call_in_ui(self.set_capture_region, x, y, width, height)
+            return {"ok": True, "region": [x, y, width, height]}
+        if command == "set-languages":
+            target = args[0] if args else params.get("target")
+            source = args[1] if len(args) > 1 else params.get("source")
+            if not target and not source:
+                raise ValueError("set-languages needs a target and/or source language")
+            self.call_in_ui(self.set_languages, target, source)
+            return {"ok": True, "source": self.source_lang.get(), "target": self.target_languages()}
+        if command == "status":
+            return self.call_in_ui(self.control_status)
+        raise ValueError(f"Unknown command: {command}")
+    
+    def control_capture(self):
+        """Capture and translate now, waiting until the overlay translation is complete"""
+        # Runs on the server thread like the auto-update thread, so OCR does not block the UI
+        with self.capture_lock:
+            start = time.perf_counter()
+            screenshot = self.capture_screenshot()
+            self.last_screenshot = screenshot
+            previous_frame = self.output_frame
+            self.process_screenshot(screenshot)
+            self.record_pipeline_latency((time.perf_counter() - start) * 1000)
+            
+            # No text found: the overlay keeps the old blocks, but they do not describe this capture
+            if self.output_frame == previous_frame:
+                self.output_frame += 1
+                return {"ok": True, "frame": self.output_frame, "language": self.primary_target(),
+                        "complete": True, "blocks": []}
+            frame = self.output_frame
+        
+        # Translations arrive in the background; give them the router's latency budget
+        deadline = time.perf_counter() + self.translation_router.latency_budget + 1.0
+        while self.pending_blocks and self.output_frame == frame and time.perf_counter() < deadline:
+            time.sleep(0.02)
+        
+        blocks = self.call_in_ui(lambda: self.output_blocks(
+            [box.get("translation", "") for box in self.block_translations()]))
+        return {"ok": True, "frame": frame, "language": self.primary_target(),
+                "complete": not self.pending_blocks, "blocks": blocks}
+    
+    def set_capture_region(self, x, y, width, height):
+        """Move and resize the overlay so it captures the given screen area"""
+        offset = self.border_width if not self.hide_frame else 0
+        self.width = width
+        self.height = height
+        self.root.geometry(f"{width + offset * 2}x{height + offset * 2}+{x - offset}+{y - offset}")
+        self.tabs_window.geometry(f"{width}x{height}")
+        self.is_maximized = False
+        
+        for entry, value in ((self.width_entry, width), (self.height_entry, height)):
+            entry.delete(0, tk.END)
+            entry.insert(0, str(value))
+        self.root.update_idletasks()
+    
+    def set_languages(self, target=None, source=None):
+        """Change the translation languages and reload the OCR reader for them"""
+        for entry, value in ((self.target_lang, target), (self.source_lang, source)):
+            if value:
+                entry.delete(0, tk.END)
+                entry.insert(0, value)
+        self.update_ocr_languages()
+    
+    def control_status(self):
+        """Current capture settings for the status command"""
+        offset = self.border_width if not self.hide_frame else 0
+        return {"ok": True, "auto_update": self.auto_update, "paused": self.paused,
+                "interval": self.update_interval,
+                "region": [self.root.winfo_x() + offset, self.root.winfo_y() + offset, self.width, self.height],
+                "source": self.source_lang.get(), "target": self.target_languages()}
     
     def update_interval_time(self, value):
         """Update the auto-update interval time"""
@@ -507,21 +3154,39 @@ class OverText:
     
     def auto_update_thread(self):
         """Thread function for auto-updating based on changes to the screen content"""
+        next_tick = time.perf_counter()
         while not self.stop_update_thread.is_set():
-            if self.auto_update:
-                # Capture the current screenshot
-                current_screenshot = self.capture_screenshot()
-                
-                # Check if the screenshot or text content has changed
-                if self.has_content_changed(current_screenshot):
-                    # Update the last screenshot
-                    self.last_screenshot = current_screenshot
+            start = time.perf_counter()
+            if self.auto_update and not self.window_moving and not self.replaying and not self.paused:
+                with self.capture_lock:
+                    # Capture the current screenshot
+                    current_screenshot = self.capture_screenshot()
                     
-                    # Process the screenshot
-                    self.process_screenshot(current_screenshot)
+                    # Check if the screenshot or text content has changed
+                    force_capture, self.force_capture = self.force_capture, False
+                    if force_capture or self.has_content_changed(current_screenshot):
+                        # Update the last screenshot
+                        self.last_screenshot = current_screenshot
+                        
+                        # Process the screenshot
+                        self.process_screenshot(current_screenshot)
+                        self.record_pipeline_latency((time.perf_counter() - start) * 1000)
+            
+            if self.memory_ceiling_mb:
+                self.enforce_memory_ceiling()
+            
+            # Wait for the next tick on a fixed schedule, so a slow frame does not delay every
+            # later one; ticks missed while processing are dropped instead of run back to back
+            interval = self.update_interval * self.quality_controller.interval_factor()
+            now = time.perf_counter()
+            next_tick += interval
+            if next_tick < now:
+                next_tick += np.ceil((now - next_tick) / interval) * interval
             
-            # Wait for the specified interval before the next check
-            time.sleep(self.update_interval)
+            # Woken early after a drag or by a command: start a new schedule from now
+            if self.update_wake.wait(next_tick - now):
+                next_tick = time.perf_counter()
+            self.update_wake.clear()
     
     def capture_screenshot(self):
         """Capture a screenshot of the overlay area"""
@@ -540,12 +3205,30 @@ class OverText:
         x = root_x + offset_x
         y = root_y + offset_y
         
-        # Take screenshot of the area inside the frame
-        screenshot = ImageGrab.grab(bbox=(x, y, x + self.width, y + self.height))
+        if self.prefetch_margin:
+            # Grab the margins too, clipped to the screen, and keep the overlay area as the frame
+            margin = self.prefetch_margin
+            mx, my = (0, margin) if self.prefetch_axis == "Vertical" else (margin, 0)
+            ex0, ey0 = max(0, x - mx), max(0, y - my)
+            ex1 = min(self.root.winfo_screenwidth(), x + self.width + mx)
+            ey1 = min(self.root.winfo_screenheight(), y + self.height + my)
+            extended = ImageGrab.grab(bbox=(ex0, ey0, max(ex1, x + self.width), max(ey1, y + self.height)))
+            view_box = (x - ex0, y - ey0, x - ex0 + self.width, y - ey0 + self.height)
+            screenshot = extended.crop(view_box)
+            self.margin_frame = (extended, view_box, screenshot)
+        else:
+            # Take screenshot of the area inside the frame
+            screenshot = ImageGrab.grab(bbox=(x, y, x + self.width, y + self.height))
+            self.margin_frame = None
         
         # Make window visible again with proper transparency
         self.root.attributes("-alpha", float(self.transparency_slider.get()))
         
+        # Keep what the overlay saw for later replay
+        if self.session_recorder is not None:
+            self.session_recorder.add_frame(screenshot)
+            self.session_stats_label.config(text=self.session_recorder.stats_text())
+        
         return screenshot
     
     def has_content_changed(self, current_screenshot):
@@ -554,10 +3237,20 @@ class OverText:
             return True
         
         comparison_method = self.comparison_method
+        if comparison_method == "SSIM" and self.quality_controller.at_least("no SSIM"):
+            comparison_method = "Histogram"
+        
+        # Pixel comparisons only look at the regions where text usually appears
+        box = self.change_detection_box(current_screenshot.size)
+        last_screenshot = self.last_screenshot
+        if box is not None and comparison_method in ("PIL", "SSIM", "Histogram") \
+                and last_screenshot.size == current_screenshot.size:
+            current_screenshot = current_screenshot.crop(box)
+            last_screenshot = last_screenshot.crop(box)
         
         if comparison_method == "PIL":
             # PIL difference method
-            diff_stats = ImageChops.difference(current_screenshot, self.last_screenshot).convert('L').point(lambda x: 255 if x > 0 else 0).getdata()
+            diff_stats = ImageChops.difference(current_screenshot, last_screenshot).convert('L').point(lambda x: 255 if x > 0 else 0).getdata()
             changed_pixels = sum(1 for pixel in diff_stats if pixel > 0)
             total_pixels = current_screenshot.width * current_screenshot.height
             change_ratio = changed_pixels / total_pixels if total_pixels > 0 else 0
@@ -567,7 +3260,7 @@ class OverText:
         elif comparison_method == "SSIM":
             # Structural Similarity Index method
             current_array = np.array(current_screenshot.convert('L'))
-            last_array = np.array(self.last_screenshot.convert('L'))
+            last_array = np.array(last_screenshot.convert('L'))
             
             score = ssim(current_array, last_array, full=False)
             change_measure = 1 - ((score + 1) / 2)
@@ -577,7 +3270,7 @@ class OverText:
         elif comparison_method == "Histogram":
             # Histogram comparison method
             current_hist = current_screenshot.convert('L').histogram()
-            last_hist = self.last_screenshot.convert('L').histogram()
+            last_hist = last_screenshot.convert('L').histogram()
             
             hist_diff = sum(abs(c - l) for c, l in zip(current_hist, last_hist))
             max_diff = sum(max(c, l) for c, l in zip(current_hist, last_hist))
@@ -585,16 +3278,127 @@ class OverText:
             
             return hist_change_ratio > self.change_threshold
         
+        elif comparison_method == "Cascade":
+            return self.has_content_changed_cascade(current_screenshot, box)
+        
         # Fallback to text-based comparison
+        return self.has_text_changed(current_screenshot)
+    
+    def has_text_changed(self, current_screenshot):
+        """Check if the recognized text has changed, keeping the OCR result for reuse"""
         current_text_blocks = self.extract_text_with_positions(current_screenshot)
+        
+        if self.stabilize_text:
+            # Compare majority-voted text instead of raw OCR readings
+            changed, current_text_blocks = self.text_stabilizer.update(current_text_blocks)
+            self.cached_text_blocks = (current_screenshot, current_text_blocks)
+            return changed
+        
         current_text_hash = self.generate_text_hash(current_text_blocks)
         
+        # Let process_screenshot reuse this OCR pass
+        self.cached_text_blocks = (current_screenshot, current_text_blocks)
+        
         if self.last_text_hash is not None and current_text_hash == self.last_text_hash:
             return False
         
         self.last_text_hash = current_text_hash
         return True
     
+    def take_cached_text_blocks(self, screenshot):
+        """Return text blocks recognized for this screenshot during change detection"""
+        cached = self.cached_text_blocks
+        self.cached_text_blocks = None
+        
+        if cached is not None and cached[0] is screenshot:
+            return cached[1]
+        return None
+    
+    def get_frame_hash(self, image):
+        """Hash the raw pixels of a frame, caching the hash of the previous frame"""
+        cached_image, cached_hash = self.frame_hash_cache
+        if cached_image is image:
+            return cached_hash
+        
+        frame_hash = (image.size, hashlib.blake2b(image.tobytes(), digest_size=16).digest())
+        self.frame_hash_cache = (image, frame_hash)
+        return frame_hash
+    
+    def has_content_changed_cascade(self, current_screenshot, box=None):
+        """Check for changes with a cascade of increasingly expensive stages"""
+        stage, changed = self.run_change_cascade(current_screenshot, box)
+        
+        # Record which stage resolved this frame
+        self.cascade_stats[stage] += 1
+        total = sum(self.cascade_stats.values())
+        summary = ", ".join(f"{name} {self.cascade_stats[name] / total * 100:.0f}%"
+                            for name in ("hash", "downsample", "ssim", "text", "changed"))
+        self.cascade_stats_label.config(text=summary)
+        
+        if total % 100 == 0:
+            logging.info(f"Change detection stages over {total} frames: {summary}")
+        
+        return changed
+    
+    def run_change_cascade(self, current_screenshot, box=None):
+        """Run the change detection cascade, returning the resolving stage and result"""
+        last_screenshot = self.last_screenshot
+        
+        # Stage 1: identical pixels
+        last_hash = self.get_frame_hash(last_screenshot)
+        current_hash = (current_screenshot.size, hashlib.blake2b(current_screenshot.tobytes(), digest_size=16).digest())
+        if current_hash == last_hash:
+            return "hash", False
+        
+        if current_screenshot.size != last_screenshot.size:
+            return "changed", True
+        
+        # Stage 2: coarse difference on a downsampled grayscale frame
+        factor = 8
+        current_gray = current_screenshot.convert('L')
+        last_gray = last_screenshot.convert('L')
+        current_small = np.array(current_gray.reduce(factor), dtype=np.int16)
+        last_small = np.array(last_gray.reduce(factor), dtype=np.int16)
+        changed_cells = np.abs(current_small - last_small) > 12
+        
+        # Ignore changes outside the text regions
+        if box is not None:
+            region_cells = np.zeros_like(changed_cells)
+            region_cells[box[1] // factor:-(-box[3] // factor), box[0] // factor:-(-box[2] // factor)] = True
+            changed_cells &= region_cells
+        
+        if not changed_cells.any():
+            return "downsample", False
+        
+        # Stage 3: SSIM restricted to the changed region
+        rows = np.flatnonzero(changed_cells.any(axis=1))
+        cols = np.flatnonzero(changed_cells.any(axis=0))
+        width, height = current_screenshot.size
+        x0 = max(0, (int(cols[0]) - 1) * factor)
+        y0 = max(0, (int(rows[0]) - 1) * factor)
+        x1 = min(width, (int(cols[-1]) + 2) * factor)
+        y1 = min(height, (int(rows[-1]) + 2) * factor)
+        
+        current_region = np.array(current_gray)[y0:y1, x0:x1]
+        last_region = np.array(last_gray)[y0:y1, x0:x1]
+        if min(current_region.shape) >= 7 and not self.quality_controller.at_least("no SSIM"):
+            score = ssim(current_region, last_region, full=False)
+            if score >= self.cascade_ssim_threshold:
+                return "ssim", False
+        
+        # Stage 4: confirm with the recognized text
+        if self.cascade_text_confirm:
+            if not self.has_text_changed(current_screenshot):
+                # Same text on a changed background: compare against this frame from now on,
+                # unless a reading is still being outvoted and later frames must reach the vote
+                if not (self.stabilize_text and self.text_stabilizer.settling()):
+                    self.last_screenshot = current_screenshot
+                    self.frame_hash_cache = (current_screenshot, current_hash)
+                return "text", False
+        
+        self.frame_hash_cache = (current_screenshot, current_hash)
+        return "changed", True
+    
     def generate_text_hash(self, text_blocks):
         """Generate a hash from text blocks for comparison"""
         text_str = ""
@@ -635,57 +3439,104 @@ class OverText:
         
         return font_size
 
-    def estimate_original_font_size(self, img_np, bbox):
-        """Estimate the font size of original text using image analysis"""
-        # Extract text region
-        x, y, width, height = bbox["x"], bbox["y"], bbox["width"], bbox["height"]
-        text_region = img_np[y:y+height, x:x+width]
-        
-        # Count text pixels (assuming dark text on light background or vice versa)
-        text_pixels = np.sum(text_region < 128)  # For dark text
-        if text_pixels < (width * height * 0.1):  # If too few dark pixels, try light text
-            text_pixels = np.sum(text_region > 128)
-        
-        # Calculate text density
-        text_density = text_pixels / (width * height)
-        
-        # Calculate a rough font size based on height and density
-        font_size = int(height * 0.7 * text_density)
-        
-        # Limit to reasonable range
-        return max(8, min(font_size, 36))
+    def estimate_font_sizes(self, img_np, text_blocks):
+        """Estimate the font size of all text blocks in one pass over the image"""
+        # Grayscale ink mask for the whole frame
+        gray = img_np if img_np.ndim == 2 else img_np[..., :3] @ np.array([0.299, 0.587, 0.114])
+        dark = gray < 128
+        
+        # Horizontal ink/background transitions, two per stroke crossing
+        transitions = np.zeros(dark.shape, dtype=bool)
+        transitions[:, 1:] = dark[:, 1:] != dark[:, :-1]
+        
+        def integral(mask):
+            table = np.zeros((mask.shape[0] + 1, mask.shape[1] + 1), dtype=np.int32)
+            table[1:, 1:] = mask.cumsum(axis=0, dtype=np.int32).cumsum(axis=1, dtype=np.int32)
+            return table
+        
+        dark_table = integral(dark)
+        transition_table = integral(transitions)
+        
+        # Clip all boxes to the image and sum every box with four lookups
+        height, width = dark.shape
+        x0 = np.clip(text_blocks.x, 0, width)
+        y0 = np.clip(text_blocks.y, 0, height)
+        x1 = np.clip(text_blocks.x + text_blocks.width, 0, width)
+        y1 = np.clip(text_blocks.y + text_blocks.height, 0, height)
+        
+        def box_sums(table):
+            return table[y1, x1] - table[y0, x1] - table[y1, x0] + table[y0, x0]
+        
+        area = np.maximum((x1 - x0) * (y1 - y0), 1)
+        dark_pixels = box_sums(dark_table)
+        
+        # Ink is the minority class, so dark and light text both work
+        ink_pixels = np.minimum(dark_pixels, area - dark_pixels)
+        stroke_count = np.maximum(box_sums(transition_table) / 2, 1)
+        
+        # Height based estimate: detector boxes are roughly 1.33 em per text line
+        height_px = text_blocks.line_height * 0.75
+        
+        # Stroke based estimate: regular strokes are about 11% of the em size
+        stroke_px = (ink_pixels / stroke_count) / 0.11
+        
+        # Blend both when they agree, otherwise trust the text height
+        agree = (stroke_px > height_px * 0.5) & (stroke_px < height_px * 2.0)
+        size_px = np.where(agree, np.sqrt(height_px * stroke_px), height_px)
+        
+        # Convert pixels to font points and limit to a reasonable range
+        size_pt = size_px * 72.0 / getattr(self, 'screen_dpi', 96.0)
+        return np.clip(size_pt, 8, 36).astype(np.int32)
 
-    def create_wrapped_text(self, canvas, x, y, text, max_width, font):
+    def measure_text(self, text, font):
+        """Bounding box of text in font, measured on one reused hidden canvas item"""
+        # A single hidden window and text item serve every measurement,
+        # instead of creating and destroying a Toplevel per wrapped block
+        if self.measure_canvas is None:
+            measure_window = tk.Toplevel(self.root)
+            measure_window.withdraw()
+            self.measure_canvas = tk.Canvas(measure_window)
+            self.measure_item = self.measure_canvas.create_text(0, 0, text="", anchor="nw")
+        
+        self.measure_canvas.itemconfig(self.measure_item, text=text, font=font)
+        return self.measure_canvas.bbox(self.measure_item)
+    
+    def remember_layout(self, key, wrapped, max_entries=2000):
+        """Cache a wrapped text layout, dropping the least recently added ones"""
+        self.wrap_cache[key] = wrapped
+        if len(self.wrap_cache) > max_entries:
+            self.wrap_cache.popitem(last=False)
+    
+    def create_wrapped_text(self, canvas, x, y, text, max_width, font, fill=None):
         """Create text with intelligent line breaks that respect word boundaries"""
         if not text:
             # Return a dummy text ID if there's no text
             return canvas.create_text(x, y, text="", anchor="nw")
             
         # Check if using Asian language
-        is_asian = self.is_asian_language(self.target_lang.get())
+        is_asian = self.is_asian_language(self.primary_target())
+        
+        # Views showing the same text reuse one computed layout
+        wrapped = self.wrap_cache.get((text, max_width, font, is_asian))
+        if wrapped is not None:
+            return canvas.create_text(x, y, text=wrapped, font=font, anchor="nw", fill=fill or self.text_color)
         
         # For Asian languages, use different wrapping logic
         if is_asian:
-            return self.create_asian_wrapped_text(canvas, x, y, text, max_width, font)
+            return self.create_asian_wrapped_text(canvas, x, y, text, max_width, font, fill)
         
         # For non-Asian languages, use word-based wrapping
         words = text.split()
         lines = []
         current_line = []
         
-        # Create a temporary window for text measurement (hidden)
-        temp = tk.Toplevel()
-        temp.withdraw()
-        temp_canvas = tk.Canvas(temp)
-        
         for word in words:
             # Try adding this word to the current line
             current_line.append(word)
             temp_text = " ".join(current_line)
             
             # Measure the text width
-            text_id = temp_canvas.create_text(0, 0, text=temp_text, font=font, anchor="nw")
-            bbox = temp_canvas.bbox(text_id)
+            bbox = self.measure_text(temp_text, font)
             
             # If adding this word makes the line too long
             if bbox and (bbox[2] - bbox[0]) > max_width and len(current_line) > 1:
@@ -700,17 +3551,15 @@ class OverText:
         if current_line:
             lines.append(" ".join(current_line))
         
-        # Clean up temporary window
-        temp.destroy()
-        
         # Create the final text with proper line breaks
         if lines:
+            self.remember_layout((text, max_width, font, is_asian), "\n".join(lines))
             return canvas.create_text(
                 x, y, 
                 text="\n".join(lines), 
                 font=font, 
                 anchor="nw", 
-                fill=self.text_color
+                fill=fill or self.text_color
             )
         else:
             # Fallback in case of empty result
@@ -720,10 +3569,10 @@ class OverText:
                 font=font, 
                 anchor="nw", 
                 width=max_width,
-                fill=self.text_color
+                fill=fill or self.text_color
             )
 
-    def create_asian_wrapped_text(self, canvas, x, y, text, max_width, font):
+    def create_asian_wrapped_text(self, canvas, x, y, text, max_width, font, fill=None):
         """Create text with character-based wrapping for Asian languages"""
         # For Asian languages we need character-by-character wrapping
         # since words aren't separated by spaces
@@ -731,19 +3580,13 @@ class OverText:
         lines = []
         current_line = []
         
-        # Create a temporary window for text measurement
-        temp = tk.Toplevel()
-        temp.withdraw()
-        temp_canvas = tk.Canvas(temp)
-        
         for char in chars:
             # Try adding this character to the current line
             current_line.append(char)
             temp_text = "".join(current_line)
             
             # Measure the text width
-            text_id = temp_canvas.create_text(0, 0, text=temp_text, font=font, anchor="nw")
-            bbox = temp_canvas.bbox(text_id)
+            bbox = self.measure_text(temp_text, font)
             
             # If adding this character makes the line too long
             if bbox and (bbox[2] - bbox[0]) > max_width and len(current_line) > 1:
@@ -758,17 +3601,15 @@ class OverText:
         if current_line:
             lines.append("".join(current_line))
         
-        # Clean up temporary window
-        temp.destroy()
-        
         # Create the final text with proper line breaks
         if lines:
+            self.remember_layout((text, max_width, font, True), "\n".join(lines))
             return canvas.create_text(
                 x, y, 
                 text="\n".join(lines), 
                 font=font, 
                 anchor="nw", 
-                fill=self.text_color
+                fill=fill or self.text_color
             )
         else:
             # Fallback in case of empty result
@@ -778,7 +3619,7 @@ class OverText:
                 font=font, 
                 anchor="nw", 
                 width=max_width,
-                fill=self.text_color
+                fill=fill or self.text_color
             )
 
     def show_language_info(self):
@@ -825,118 +3666,769 @@ class OverText:
         # Convert PIL Image to numpy array for analysis
         img_np = np.array(screenshot)
         
-        # Extract text with positions
-        text_blocks = self.extract_text_with_positions(screenshot)
-        self.text_boxes = text_blocks
+        # Extract text with positions, reusing the change detection OCR pass if any
+        text_blocks = self.take_cached_text_blocks(screenshot)
+        
+        # Scrolled content keeps its drawn translations; only the revealed strip is read
+        if text_blocks is None and self.detect_scrolling and self.processed_frame is not None and self.text_boxes:
+            offset = self.detect_scroll(self.processed_frame, screenshot)
+            if offset is not None:
+                self.apply_scroll(screenshot, img_np, *offset)
+                return
+        
+        if text_blocks is None:
+            text_blocks = self.extract_text_with_positions(screenshot)
         
         # Only proceed if text is found
         if text_blocks:
             # Clear previous translations
             self.clear_translations()
+            self.text_boxes = text_blocks
+            self.processed_frame = screenshot
+            generation = self.render_generation
+            
+            # Margin text read for the previous content does not belong to this one
+            self.prefetched = []
+            self.prefetch_generation += 1
+            self.scroll_origin = (0, 0)
             
             # Configure canvas backgrounds
             self.canvas.config(bg="black", highlightthickness=0)
+            if self.render_backend == "Bitmap":
+                self.prepare_bitmap_overlay()
             self.tab_canvas.config(bg="black", highlightthickness=0)
             self.ocr_canvas.config(bg="black", highlightthickness=0)
             
-            # Background color
-            bg_fill = "black"
+            # Work on the whole batch of texts at once
+            texts = text_blocks.texts
+            target = self.primary_target()
             
-            # Combine all text into one string for translation
-            combined_text = " ".join(block["text"] for block in text_blocks if block["text"].strip())
+            # Under load, misses are translated in the background instead of being waited for
+            deferred = self.quality_controller.at_least("cached translations")
+            if self.progressive_rendering or deferred:
+                # Draw cached translations now and source text for the rest
+                translated_blocks, misses = self.lookup_translations(texts, target)
+                for i in misses:
+                    translated_blocks[i] = texts[i]
+                self.update_tm_stats()
+            else:
+                # Translate all blocks, reusing the translation memory where possible
+                translated_blocks = self.translate_blocks(texts, target)
+                misses = []
             
-            # Translate the combined text
-            translated_full_text = self.translate_text(combined_text) if combined_text else ""
+            self.draw_blocks(img_np, text_blocks, translated_blocks, set(misses))
             
-            # Detect if target language is Asian
-            is_asian = self.is_asian_language(self.target_lang.get())
+            # Draw the tabs window view only if it is on screen
+            self.render_visible_view()
             
-            # Split the translated text back into blocks
-            translated_blocks = self.split_translated_text(translated_full_text, text_blocks)
+            self.translate_in_background(texts, misses, generation)
+            self.start_prefetch(screenshot)
             
-            # Display each text block
-            for i, block in enumerate(text_blocks):
-                if block["text"].strip():
-                    # Get positions and dimensions
-                    x = block["x"]
-                    y = block["y"]
-                    width = block["width"]
-                    height = block["height"]
-                    
-                    # Get translated text for this block
-                    translated_text = translated_blocks[i] if i < len(translated_blocks) else ""
-                    original_text = block["text"]
-                    
-                    # Estimate original font size
-                    estimated_font_size = self.estimate_original_font_size(img_np, block)
+            # Save screenshot if option is enabled
+            if self.save_screenshot_var.get():
+                desktop = os.path.join(os.path.expanduser("~"), "Desktop")
+                screenshot_path = os.path.join(desktop, "translated_screenshot.png")
+                screenshot.save(screenshot_path)
+                print(f"Screenshot saved at: {screenshot_path}")
+    
+    def draw_blocks(self, img_np, text_blocks, translated_blocks, pending, first_index=0):
+        """Draw text blocks with estimated font sizes, numbered from first_index"""
+        target = self.primary_target()
+        
+        # Detect if target language is Asian
+        is_asian = self.is_asian_language(target)
+        
+        # Estimate original font sizes for all blocks at once
+        use_fixed_font_size = self.use_fixed_font_size.get()
+        if not use_fixed_font_size:
+            estimated_font_sizes = self.estimate_font_sizes(img_np, text_blocks).tolist()
+        
+        # Display each text block
+        for j, (original_text, (x, y, width, height)) in enumerate(zip(text_blocks.texts, text_blocks.bounds.tolist())):
+            i = first_index + j
+            if original_text.strip():
+                # Get translated text for this block
+                translated_text = translated_blocks[i] if i < len(translated_blocks) else ""
+                
+                # If user has specified a fixed font size, use that instead
+                if use_fixed_font_size:
+                    font_size = self.text_font_size
+                else:
+                    estimated_font_size = estimated_font_sizes[j]
                     
                     # Adjust font size for Asian languages if needed
                     if is_asian:
                         # Asian languages often need larger font sizes for readability
                         estimated_font_size = int(estimated_font_size * 1.2)
                     
-                    # If user has specified a fixed font size, use that instead
-                    if self.use_fixed_font_size:
-                        font_size = self.text_font_size
-                    else:
-                        # Use estimated font size with appropriate scaling
-                        font_size = max(8, min(int(estimated_font_size * 0.9), 36))
-                    
-                    # Set the font
-                    text_font = (self.text_font_family, font_size, 
-                               "bold" if self.bold_var.get() else "normal")
-                    
-                    # MAIN OVERLAY WINDOW - Background rectangle
-                    bg_id = self.canvas.create_rectangle(
-                        x, y, x + width, y + height,
-                        fill=bg_fill, 
-                        outline=""
-                    )
-                    
-                    # Create wrapped text for better line breaks
-                    text_id = self.create_wrapped_text(
-                        self.canvas, x, y, translated_text, 
-                        width, text_font
-                    )
-                    
-                    # Set visibility state
-                    self.canvas.itemconfig(text_id, state="hidden" if self.show_tabs_var.get() else "normal")
-                    
-                    # Store reference to text object
-                    self.translation_boxes.append({"bg": bg_id, "text": text_id})
-                    
-                    # TABS WINDOW - TRANSLATED TAB with wrapped text
-                    tab_bg_id = self.tab_canvas.create_rectangle(
-                        x, y, x + width, y + height,
-                        fill=bg_fill,
-                        outline=""
-                    )
-                    
-                    tab_text_id = self.create_wrapped_text(
-                        self.tab_canvas, x, y, translated_text, 
-                        width, text_font
-                    )
-                    
-                    # TABS WINDOW - OCR TEXT TAB
-                    ocr_bg_id = self.ocr_canvas.create_rectangle(
-                        x, y, x + width, y + height,
-                        fill=bg_fill,
-                        outline=""
-                    )
-                    
-                    ocr_text_id = self.create_wrapped_text(
-                        self.ocr_canvas, x, y, original_text,
-                        width, text_font
-                    )
-                    
-                    self.ocr_text_boxes.append({"bg": ocr_bg_id, "text": ocr_text_id})
+                    # Use estimated font size with appropriate scaling
+                    font_size = max(8, min(int(estimated_font_size * 0.9), 36))
+                
+                # Set the font
+                text_font = (self.text_font_family, font_size, 
+                           "bold" if self.bold_var.get() else "normal")
+                
+                self.render_block(i, x, y, width, height, translated_text, original_text,
+                                  text_font, pending=i in pending)
+    
+    def translate_in_background(self, texts, misses, generation):
+        """Translate the missing primary-language blocks and all other target languages off the UI thread"""
+        target = self.primary_target()
+        
+        # Translate the remaining blocks in parallel, each replacing its source text when done
+        self.output_frame += 1
+        self.pending_blocks = set(misses)
+        for i in misses:
+            future = self.get_translation_executor().submit(self.translate_single, texts[i], target)
+            future.add_done_callback(
+                lambda f, i=i: self.root.after(0, self.update_block_translation, generation, i, f.result()))
+        
+        # The primary language is complete once no block is waiting for its translation
+        if not misses:
+            self.write_output(target, [box.get("translation", "") for box in self.block_translations()])
+        
+        # Other target languages reuse this OCR pass, each translated in parallel
+        for language in self.target_languages()[1:]:
+            future = self.get_translation_executor().submit(self.translate_blocks, texts, language)
+            future.add_done_callback(
+                lambda f, language=language: self.root.after(
+                    0, self.show_language_translations, generation, language, f.result()))
+    
+    def detect_scroll(self, last_image, image):
+        """Estimate how far the content scrolled between two frames, as (dx, dy) or None"""
+        if last_image.size != image.size:
+            return None
+        
+        last_gray = np.array(last_image.convert('L'))
+        gray = np.array(image.convert('L'))
+        
+        # Rows first, since vertical scrolling is the common case
+        shift = self.match_line_hashes(last_gray, gray)
+        if shift is not None:
+            return 0, shift
+        shift = self.match_line_hashes(last_gray.T, gray.T)
+        if shift is not None:
+            return shift, 0
+        return None
+    
+    def match_line_hashes(self, last_lines, lines, min_share=0.75, min_lines=8):
+        """Offset by which pixel lines moved, from matching line hashes, or None"""
+        count = len(lines)
+        last_hashes = np.array([hash(line.tobytes()) for line in last_lines], dtype=np.int64)
+        hashes = np.array([hash(line.tobytes()) for line in lines], dtype=np.int64)
+        
+        # Uniform lines (background) match anywhere and say nothing about the offset
+        informative = lines.max(axis=1) != lines.min(axis=1)
+        
+        def share(shift):
+            # Line y of the new frame shows line y - shift of the old one
+            if shift >= 0:
+                new, old, mask = hashes[shift:], last_hashes[:count - shift], informative[shift:]
+            else:
+                new, old, mask = hashes[:count + shift], last_hashes[-shift:], informative[:count + shift]
+            matched = np.count_nonzero(mask)
+            return np.count_nonzero(new[mask] == old[mask]) / matched if matched >= min_lines else 0.0
+        
+        # At least a quarter of the frame must overlap
+        max_shift = count * 3 // 4
+        best_share, best_shift = max((share(shift), shift) for shift in range(-max_shift, max_shift + 1) if shift)
+        
+        # Content that did not move is a change, not a scroll
+        if best_share < min_share or share(0) >= best_share:
+            return None
+        return best_shift
+    
+    def apply_scroll(self, screenshot, img_np, dx, dy):
+        """Move the drawn blocks with the scrolled content and OCR only what was not visible before"""
+        width, height = screenshot.size
+        old_blocks = self.text_boxes
+        old_boxes = self.block_translations()
+        last_gray = np.array(self.processed_frame.convert('L'))
+        gray = np.array(screenshot.convert('L'))
+        
+        # Each block either scrolled with the content, stayed in place (fixed headers) or has to be read again
+        moved = []
+        static = []
+        reread = []
+        for i, (x, y, w, h) in enumerate(old_blocks.bounds.tolist()):
+            x0, y0 = max(0, x), max(0, y)
+            x1, y1 = min(width, x + w), min(height, y + h)
+            area = last_gray[y0:y1, x0:x1]
+            if not old_boxes[i] or area.size == 0:
+                continue
+            if np.array_equal(area, gray[y0:y1, x0:x1]):
+                static.append(i)
+            elif 0 <= x0 + dx and x1 + dx <= width and 0 <= y0 + dy and y1 + dy <= height \
+                    and np.array_equal(area, gray[y0 + dy:y1 + dy, x0 + dx:x1 + dx]):
+                moved.append(i)
+            else:
+                reread.append(i)
+        
+        # Lines that neither scrolled nor stayed in place were revealed, at the edge or from under a fixed overlay
+        last_lines, lines, shift = (last_gray, gray, dy) if dy else (last_gray.T, gray.T, dx)
+        count = len(lines)
+        scrolled = np.zeros(count, dtype=bool)
+        if shift >= 0:
+            scrolled[shift:] = (lines[shift:] == last_lines[:count - shift]).all(axis=1)
+        else:
+            scrolled[:count + shift] = (lines[:count + shift] == last_lines[-shift:]).all(axis=1)
+        revealed = ~scrolled & ~(lines == last_lines).all(axis=1)
+        
+        # Read the revealed bands plus every block that did not survive the scroll intact
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], revealed.view(np.int8), [0]))))
+        strips = []
+        for start_line, end_line in zip(edges[::2].tolist(), edges[1::2].tolist()):
+            start_line, end_line = max(0, start_line - 2), min(count, end_line + 2)
+            strips.append((0, start_line, width, end_line) if dy else (start_line, 0, end_line, height))
+        for i in reread:
+            x, y, w, h = old_blocks.bounds[i].tolist()
+            box = (max(0, x + dx), max(0, y + dy), min(width, x + w + dx), min(height, y + h + dy))
+            if box[2] > box[0] and box[3] > box[1]:
+                strips.append(box)
+        regions = self.merge_boxes(strips)
+        
+        # Margin text read ahead of time is used as is where its pixels scrolled in unchanged
+        self.scroll_origin = (self.scroll_origin[0] + dx, self.scroll_origin[1] + dy)
+        arrived = self.take_prefetched_blocks(gray, dx, dy)
+        regions = [region for region in regions if not self.region_covered(gray, region, arrived, vertical=bool(dy))]
+        
+        start = time.perf_counter()
+        results = []
+        for region in regions:
+            results.extend(self.read_region(screenshot, region))
+        self.record_ocr_latency((time.perf_counter() - start) * 1000)
+        
+        fresh = TextBlocks.from_ocr_results(results)
+        fresh = fresh.select((fresh.confidence >= self.min_ocr_confidence) & fresh.has_text())
+        fresh = self.merge_text_blocks(fresh, self.merge_mode)
+        if len(arrived) and len(fresh):
+            fresh = fresh.select(~self.centers_inside(fresh, arrived))
+        fresh = TextBlocks.concat([arrived, fresh])
+        
+        # Blocks that were kept win over fresh readings of the same spot
+        kept = static + moved
+        offsets = [(0, 0)] * len(static) + [(dx, dy)] * len(moved)
+        kept_blocks = TextBlocks.concat([old_blocks.select(np.array(static, dtype=np.int64)),
+                                         old_blocks.select(np.array(moved, dtype=np.int64)).shifted(dx, dy)])
+        if len(fresh) and len(kept_blocks):
+            fresh = fresh.select(~self.centers_inside(fresh, kept_blocks))
+        
+        # Pending translations of the old numbering no longer apply
+        self.render_generation += 1
+        generation = self.render_generation
+        
+        # Move the drawn items; remove the blocks that left the frame or are read again
+        if self.render_backend == "Bitmap":
+            self.shift_bitmap_overlay(dx, dy, old_boxes, static, moved)
+        else:
+            dropped = set(range(len(old_boxes))) - set(kept)
+            for i in dropped:
+                if old_boxes[i]:
+                    self.canvas.delete(old_boxes[i]["bg"], old_boxes[i]["text"])
+            for i in moved:
+                self.canvas.move(old_boxes[i]["bg"], dx, dy)
+                self.canvas.move(old_boxes[i]["text"], dx, dy)
+        
+        # Renumber the kept boxes: fixed blocks first, then moved ones, then the fresh readings
+        self.translation_boxes = []
+        self.translation_box_index = {}
+        for new_i, (old_i, (ox, oy)) in enumerate(zip(kept, offsets)):
+            box = old_boxes[old_i]
+            box.update(index=new_i, x=box["x"] + ox, y=box["y"] + oy, tab_bg=None, tab_text=None)
+            self.translation_boxes.append(box)
+            self.translation_box_index[new_i] = box
+        self.text_boxes = TextBlocks.concat([kept_blocks, fresh])
+        self.processed_frame = screenshot
+        self.ocr_frame_blocks = (screenshot, self.text_boxes)
+        
+        # The tabs window views are redrawn from the boxes when shown
+        self.tab_canvas.delete("all")
+        self.ocr_canvas.delete("all")
+        for _, canvas in self.language_canvases.values():
+            canvas.delete("all")
+        self.ocr_text_boxes = []
+        self.rendered_views = set()
+        
+        # Fresh blocks: cached translations now, the rest in the background, like a new frame
+        texts = self.text_boxes.texts
+        fresh_translations, fresh_misses = self.lookup_translations(fresh.texts, self.primary_target())
+        translated_blocks = [box["original"] if box["pending"] else box["translation"]
+                             for box in self.translation_boxes] + fresh_translations
+        for j in fresh_misses:
+            translated_blocks[len(kept) + j] = fresh.texts[j]
+        
+        # Kept blocks still waiting for a translation are asked for again under their new number
+        misses = [i for i, box in enumerate(self.translation_boxes) if box["pending"]]
+        misses += [len(kept) + j for j in fresh_misses]
+        
+        self.draw_blocks(img_np, fresh, translated_blocks, set(misses), first_index=len(kept))
+        self.update_tm_stats()
+        self.render_visible_view()
+        self.translate_in_background(texts, misses, generation)
+        
+        self.start_prefetch(screenshot)
+        
+        coverage = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in regions) / float(width * height)
+        prefetched = f", {len(arrived)} prefetched" if self.prefetch_margin else ""
+        self.scroll_stats_label.config(
+            text=f"Last scroll: {dx:+d}, {dy:+d} px, kept {len(kept)} blocks{prefetched}, read {coverage * 100:.0f}% of frame")
+    
+    def centers_inside(self, blocks, others):
+        """Boolean mask of blocks whose center lies inside any of the other blocks"""
+        centers = blocks.bounds[:, :2] + blocks.bounds[:, 2:] / 2
+        ob = others.bounds
+        return ((centers[:, None, 0] >= ob[None, :, 0]) & (centers[:, None, 0] <= ob[None, :, 0] + ob[None, :, 2]) &
+                (centers[:, None, 1] >= ob[None, :, 1]) & (centers[:, None, 1] <= ob[None, :, 1] + ob[None, :, 3])).any(axis=1)
+    
+    def start_prefetch(self, screenshot):
+        """Read and translate the margins of this capture in the background, one job at a time"""
+        # Replayed and resized frames have no margins of their own
+        if not self.prefetch_margin or self.margin_frame is None or self.margin_frame[2] is not screenshot:
+            return
+        if self.prefetch_future is not None and not self.prefetch_future.done():
+            return
+        
+        if self.prefetch_executor is None:
+            self.prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        extended, view_box, _ = self.margin_frame
+        self.prefetch_future = self.prefetch_executor.submit(
+            self.prefetch_margins, self.prefetch_generation, self.scroll_origin, extended, view_box)
+    
+    def prefetch_margins(self, generation, origin, extended, view_box):
+        """OCR and translate the text just outside the overlay, so it shows translated as soon as it scrolls in"""
+        vx0, vy0, vx1, vy1 = view_box
+        width, height = extended.size
+        if self.prefetch_axis == "Vertical":
+            regions = [(0, 0, width, vy0), (0, vy1, width, height)]
+        else:
+            regions = [(0, 0, vx0, height), (vx1, 0, width, height)]
+        
+        results = []
+        for region in regions:
+            if region[2] - region[0] < 8 or region[3] - region[1] < 8:
+                continue
             
-            # Save screenshot if option is enabled
-            if self.save_screenshot_var.get():
-                desktop = os.path.join(os.path.expanduser("~"), "Desktop")
-                screenshot_path = os.path.join(desktop, "translated_screenshot.png")
-                screenshot.save(screenshot_path)
-                print(f"Screenshot saved at: {screenshot_path}")
+            for chunk, owned in self.margin_chunks(region):
+                # Low priority: wait while the capture pipeline works on what is on screen
+                while self.capture_lock.locked() and generation == self.prefetch_generation:
+                    time.sleep(0.02)
+                if generation != self.prefetch_generation:
+                    return
+                
+                # A line read in two bands is kept from the band that owns its center
+                axis = 1 if self.prefetch_axis == "Vertical" else 0
+                results.extend(result for result in self.read_region(extended, chunk)
+                               if owned[0] <= result[0][:, axis].mean() < owned[1])
+        
+        blocks = TextBlocks.from_ocr_results(results)
+        blocks = blocks.select((blocks.confidence >= self.min_ocr_confidence) & blocks.has_text())
+        blocks = self.merge_text_blocks(blocks, self.merge_mode)
+        
+        # Translations go into the translation memory, where the scrolled-in blocks find them;
+        # each block on its own, since fragments of a split batch are not remembered
+        texts = blocks.texts
+        for language in self.target_languages():
+            _, misses = self.lookup_translations(texts, language)
+            for i in misses:
+                if generation != self.prefetch_generation:
+                    return
+                self.translate_single(texts[i], language)
+        
+        # Identify each block by its pixels, in overlay coordinates of the captured frame
+        gray = np.array(extended.convert('L'))
+        entries = []
+        for text, (x, y, w, h) in zip(texts, blocks.bounds.tolist()):
+            x0, y0 = max(0, x), max(0, y)
+            area = gray[y0:min(height, y + h), x0:min(width, x + w)]
+            entries.append({"bounds": (x0 - vx0, y0 - vy0, area.shape[1], area.shape[0]), "text": text,
+                            "hash": hash(area.tobytes())})
+        self.root.after(0, self.store_prefetched, generation, origin, entries)
+    
+    def margin_chunks(self, region):
+        """Split a margin into overlapping bands along the scroll axis, each with the span of centers it owns"""
+        x0, y0, x1, y1 = region
+        axis = 1 if self.prefetch_axis == "Vertical" else 0
+        start, end = (y0, y1) if axis else (x0, x1)
+        step = max(1, self.prefetch_chunk - self.prefetch_overlap)
+        
+        chunks = []
+        position = start
+        while True:
+            stop = min(end, position + self.prefetch_chunk)
+            owned = (start if position == start else position + self.prefetch_overlap / 2,
+                     end if stop == end else stop - self.prefetch_overlap / 2)
+            chunks.append(((x0, position, x1, stop) if axis else (position, y0, stop, y1), owned))
+            if stop == end:
+                return chunks
+            position += step
+    
+    def store_prefetched(self, generation, origin, entries):
+        """Keep prefetched margin blocks, moved by any scrolling since their capture"""
+        if generation != self.prefetch_generation:
+            return
+        dx, dy = self.scroll_origin[0] - origin[0], self.scroll_origin[1] - origin[1]
+        for entry in entries:
+            x, y, w, h = entry["bounds"]
+            entry["bounds"] = (x + dx, y + dy, w, h)
+        self.prefetched = entries
+    
+    def take_prefetched_blocks(self, gray, dx, dy):
+        """Move the prefetched blocks by a scroll and return those now fully in view with unchanged pixels"""
+        height, width = gray.shape
+        rects = []
+        texts = []
+        remaining = []
+        for entry in self.prefetched:
+            x, y, w, h = entry["bounds"]
+            x, y = x + dx, y + dy
+            entry["bounds"] = (x, y, w, h)
+            if x < 0 or y < 0 or x + w > width or y + h > height:
+                remaining.append(entry)
+            elif hash(gray[y:y + h, x:x + w].tobytes()) == entry["hash"]:
+                rects.append((x, y, w, h))
+                texts.append(entry["text"])
+        self.prefetched = remaining
+        
+        if not rects:
+            return TextBlocks()
+        return TextBlocks.from_rects(rects, texts, np.ones(len(texts), dtype=np.float32))
+    
+    def region_covered(self, gray, region, blocks, vertical=True):
+        """Check if every line with content in a region lies within the given blocks"""
+        if not len(blocks):
+            return False
+        x0, y0, x1, y1 = region
+        area = gray[y0:y1, x0:x1]
+        lines = area if vertical else area.T
+        has_content = lines.max(axis=1) != lines.min(axis=1)
+        
+        covered = np.zeros(len(lines), dtype=bool)
+        for x, y, w, h in blocks.bounds.tolist():
+            if vertical and x < x1 and x + w > x0:
+                covered[max(0, y - y0):max(0, y + h - y0)] = True
+            elif not vertical and y < y1 and y + h > y0:
+                covered[max(0, x - x0):max(0, x + w - x0)] = True
+        return bool((covered | ~has_content).all())
+    
+    def shift_bitmap_overlay(self, dx, dy, old_boxes, static, moved):
+        """Scroll the offscreen overlay image and renumber the drawn areas of the kept blocks"""
+        renderer = self.bitmap_renderer
+        areas = self.block_areas
+        draws = self.block_draws
+        
+        def shift():
+            old_areas = dict(areas)
+            old_draws = dict(draws)
+            areas.clear()
+            draws.clear()
+            
+            # Everything scrolled; fixed blocks and dropped blocks are erased at their shifted spot
+            renderer.shift(dx, dy)
+            for i, area in old_areas.items():
+                if i not in moved:
+                    renderer.erase((area[0] + dx, area[1] + dy, area[2] + dx, area[3] + dy))
+            for new_i, old_i in enumerate(moved, start=len(static)):
+                if old_i in old_areas:
+                    area = old_areas[old_i]
+                    areas[new_i] = (area[0] + dx, area[1] + dy, area[2] + dx, area[3] + dy)
+                if old_i in old_draws:
+                    spec = old_draws[old_i]
+                    draws[new_i] = dict(spec, x=spec["x"] + dx, y=spec["y"] + dy)
+            self.root.after(0, self.schedule_bitmap_flush)
+        
+        self.render_executor.submit(shift)
+        
+        # Fixed blocks are drawn again where they were
+        for new_i, old_i in enumerate(static):
+            box = old_boxes[old_i]
+            fill = self.pending_text_color if box["pending"] else self.text_color
+            self.submit_bitmap_block(self.render_generation, new_i, box["x"], box["y"], box["width"], box["height"],
+                                     box["translation"], box["font"], fill)
+    
+    def merge_boxes(self, boxes):
+        """Merge overlapping (x0, y0, x1, y1) boxes into their bounding boxes"""
+        merged = []
+        for box in boxes:
+            box = tuple(box)
+            while True:
+                overlapping = [other for other in merged
+                               if box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]]
+                if not overlapping:
+                    break
+                for other in overlapping:
+                    merged.remove(other)
+                    box = (min(box[0], other[0]), min(box[1], other[1]), max(box[2], other[2]), max(box[3], other[3]))
+            merged.append(box)
+        return merged
+    
+    def render_block(self, i, x, y, width, height, translated_text, original_text, text_font, pending=False):
+        """Draw one block's background and text on the overlay and tabs window canvases"""
+        # Background color
+        bg_fill = "black"
+        
+        # Text still waiting for its translation is drawn dimmed
+        fill = self.pending_text_color if pending else self.text_color
+        
+        if self.render_backend == "Bitmap":
+            # MAIN OVERLAY WINDOW - composited off the main thread
+            bg_id = text_id = None
+            self.submit_bitmap_block(self.render_generation, i, x, y, width, height,
+                                     translated_text, text_font, fill)
+        else:
+            # MAIN OVERLAY WINDOW - Background rectangle
+            bg_id = self.canvas.create_rectangle(
+                x, y, x + width, y + height,
+                fill=bg_fill, 
+                outline=""
+            )
+            
+            # Create wrapped text for better line breaks
+            text_id = self.create_wrapped_text(
+                self.canvas, x, y, translated_text, 
+                width, text_font, fill
+            )
+            
+            # Tagged so visibility is toggled for all blocks in one call
+            self.canvas.itemconfig(text_id, state="hidden" if self.show_tabs_var.get() else "normal",
+                                   tags=("overlay_text",))
+        
+        # Store the layout inputs; the tabs window views are drawn from them when visible
+        box = {"index": i, "bg": bg_id, "text": text_id, "tab_bg": None, "tab_text": None,
+               "x": x, "y": y, "width": width, "height": height, "font": text_font,
+               "translation": translated_text, "original": original_text, "pending": pending}
+        self.translation_boxes.append(box)
+        self.translation_box_index[i] = box
+    
+    def update_block_translation(self, generation, i, translated_text):
+        """Replace a block's source text with its translation once it arrives"""
+        # Ignore translations for blocks that were cleared or replaced meanwhile
+        if generation != self.render_generation or i not in self.translation_box_index:
+            return
+        
+        box = self.translation_box_index[i]
+        box["translation"] = translated_text
+        box["pending"] = False
+        
+        if self.render_backend == "Bitmap":
+            self.submit_bitmap_block(generation, i, box["x"], box["y"], box["width"], box["height"],
+                                     translated_text, box["font"], self.text_color)
+        else:
+            self.canvas.delete(box["text"])
+            box["text"] = self.create_wrapped_text(self.canvas, box["x"], box["y"], translated_text,
+                                                   box["width"], box["font"])
+            self.canvas.itemconfig(box["text"], state="hidden" if self.show_tabs_var.get() else "normal",
+                                   tags=("overlay_text",))
+        
+        # The translated tab is only updated if it has been drawn; otherwise it is drawn when shown
+        if box["tab_text"] is not None:
+            self.tab_canvas.delete(box["tab_text"])
+            box["tab_text"] = self.create_wrapped_text(self.tab_canvas, box["x"], box["y"], translated_text,
+                                                       box["width"], box["font"])
+        self.update_tm_stats()
+        
+        self.pending_blocks.discard(i)
+        if not self.pending_blocks:
+            self.write_output(self.primary_target(), [box.get("translation", "") for box in self.block_translations()])
+    
+    def primary_target(self):
+        """The first configured target language, shown on the overlay"""
+        languages = self.target_languages()
+        return languages[0] if languages else "en"
+    
+    def target_languages(self):
+        """All configured target languages, from a comma-separated entry"""
+        return list(dict.fromkeys(lang.strip() for lang in self.target_lang.get().split(",") if lang.strip()))
+    
+    def block_translations(self):
+        """Primary-language box per text block, with empty entries for blocks that were not drawn"""
+        return [self.translation_box_index.get(i, {}) for i in range(len(self.text_boxes))]
+    
+    def get_language_canvas(self, language):
+        """Canvas in the tabs window showing one additional target language"""
+        if language not in self.language_canvases:
+            tab = tk.Frame(self.tab_control, bg="black")
+            self.tab_control.add(tab, text=f"Translated ({language})")
+            canvas = tk.Canvas(tab, bg="black", highlightthickness=0)
+            canvas.pack(fill=tk.BOTH, expand=True)
+            self.language_canvases[language] = (tab, canvas)
+        return self.language_canvases[language][1]
+    
+    def remove_unused_language_tabs(self):
+        """Drop tabs for languages that are no longer configured"""
+        current = set(self.target_languages()[1:])
+        for language in list(self.language_canvases):
+            if language not in current:
+                tab, _ = self.language_canvases.pop(language)
+                self.tab_control.forget(tab)
+                tab.destroy()
+    
+    def show_language_translations(self, generation, language, translations):
+        """Draw an additional language's translations in its own tab and write them out"""
+        if generation != self.render_generation:
+            return
+        
+        # Drawn like the other tabs window views, when its tab is visible
+        self.get_language_canvas(language)
+        self.language_translations[language] = translations
+        self.rendered_views.discard(language)
+        self.render_visible_view()
+        
+        self.write_output(language, translations)
+    
+    def visible_view(self):
+        """Name of the tabs window view currently on screen, or None if the window is hidden"""
+        if not self.show_tabs_var.get():
+            return None
+        
+        selected = self.tab_control.select()
+        if selected == str(self.translate_tab):
+            return "translated"
+        if selected == str(self.ocr_tab):
+            return "ocr"
+        for language, (tab, _) in self.language_canvases.items():
+            if selected == str(tab):
+                return language
+        return None
+    
+    def render_visible_view(self, event=None):
+        """Draw the visible tabs window view if it has not been drawn for the current content"""
+        view = self.visible_view()
+        if view is None or view in self.rendered_views:
+            return
+        self.rendered_views.add(view)
+        
+        if view == "translated":
+            for box in self.translation_boxes:
+                x, y, width, height = box["x"], box["y"], box["width"], box["height"]
+                box["tab_bg"] = self.tab_canvas.create_rectangle(x, y, x + width, y + height,
+                                                                 fill="black", outline="")
+                fill = self.pending_text_color if box["pending"] else self.text_color
+                box["tab_text"] = self.create_wrapped_text(self.tab_canvas, x, y, box["translation"],
+                                                           width, box["font"], fill)
+        
+        elif view == "ocr":
+            for box in self.translation_boxes:
+                x, y, width, height = box["x"], box["y"], box["width"], box["height"]
+                ocr_bg_id = self.ocr_canvas.create_rectangle(x, y, x + width, y + height,
+                                                             fill="black", outline="")
+                ocr_text_id = self.create_wrapped_text(self.ocr_canvas, x, y, box["original"],
+                                                       width, box["font"])
+                self.ocr_text_boxes.append({"bg": ocr_bg_id, "text": ocr_text_id})
+        
+        else:
+            canvas = self.language_canvases[view][1]
+            for i, text in enumerate(self.language_translations.get(view, [])):
+                box = self.translation_box_index.get(i)
+                if box is None or not text:
+                    continue
+                x, y, width, height = box["x"], box["y"], box["width"], box["height"]
+                canvas.create_rectangle(x, y, x + width, y + height, fill="black", outline="")
+                self.create_wrapped_text(canvas, x, y, text, width, box["font"])
+    
+    def write_output(self, language, translations):
+        """Append one frame's translations for a language to the JSON Lines output"""
+        if not self.output_path:
+            return
+        
+        record = {"frame": self.output_frame, "time": time.time(), "language": language,
+                  "blocks": self.output_blocks(translations)}
+        
+        try:
+            with open(self.output_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logging.error(f"Error writing output: {e}")
+    
+    def output_blocks(self, translations):
+        """Non-empty blocks of the current content with their position, text and translation"""
+        return [{"x": x, "y": y, "width": width, "height": height, "text": text, "translation": translation}
+                for text, (x, y, width, height), translation
+                in zip(self.text_boxes.texts, self.text_boxes.bounds.tolist(), translations) if text.strip()]
+    
+    def prepare_bitmap_overlay(self):
+        """Size the offscreen image to the overlay and show it as a single canvas image"""
+        width = max(1, self.canvas.winfo_width())
+        height = max(1, self.canvas.winfo_height())
+        
+        if self.bitmap_renderer is None:
+            self.bitmap_renderer = BitmapRenderer(width, height)
+            self.render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render")
+        
+        if self.bitmap_photo is None or self.bitmap_photo.width() != width or self.bitmap_photo.height() != height:
+            self.bitmap_photo = tk.PhotoImage(width=width, height=height)
+            self.render_executor.submit(self.bitmap_renderer.resize, width, height)
+        else:
+            self.render_executor.submit(self.bitmap_renderer.clear)
+        
+        # clear_translations removed the previous image item along with everything else
+        self.bitmap_item = self.canvas.create_image(0, 0, image=self.bitmap_photo, anchor="nw",
+                                                    state="hidden" if self.show_tabs_var.get() else "normal")
+        self.block_areas = {}
+        self.block_draws = {}
+    
+    def submit_bitmap_block(self, generation, i, x, y, width, height, text, text_font, fill):
+        """Queue a block for drawing on the render thread"""
+        family, size, weight = text_font
+        areas = self.block_areas
+        draws = self.block_draws
+        by_character = self.is_asian_language(self.primary_target())
+        size_px = max(1, int(round(size * self.screen_dpi / 72.0)))
+        
+        def draw():
+            # Skip work for content that was replaced before the render thread got to it
+            if generation != self.render_generation:
+                return
+            renderer = self.bitmap_renderer
+            font_obj = renderer.get_font(family, size_px, weight == "bold")
+            draws[i] = dict(x=x, y=y, width=width, height=height, text=text, font_obj=font_obj, fill=fill,
+                            by_character=by_character)
+            redraw = [i]
+            if i in areas:
+                # Overflowing text reaches into neighbouring blocks, which are drawn again in their original order
+                erased = areas[i]
+                renderer.erase(erased)
+                redraw = sorted(j for j, area in areas.items() if j == i or (
+                    j in draws and area[0] < erased[2] and erased[0] < area[2] and area[1] < erased[3] and erased[1] < area[3]))
+            for j in redraw:
+                areas[j] = renderer.draw_block(**draws[j])
+            self.root.after(0, self.schedule_bitmap_flush)
+        
+        self.render_executor.submit(draw)
+    
+    def schedule_bitmap_flush(self):
+        """Coalesce dirty regions from several blocks into one update"""
+        if not self.bitmap_flush_pending:
+            self.bitmap_flush_pending = True
+            self.root.after_idle(self.flush_bitmap)
+    
+    def flush_bitmap(self):
+        """Copy the changed part of the offscreen image to the overlay"""
+        self.bitmap_flush_pending = False
+        if self.bitmap_renderer is None or self.bitmap_photo is None:
+            return
+        
+        box, patch = self.bitmap_renderer.take_dirty()
+        if box is None:
+            return
+        
+        # Only the dirty rectangle is transferred to Tk
+        patch_photo = ImageTk.PhotoImage(patch)
+        self.bitmap_photo.tk.call(self.bitmap_photo, "copy", patch_photo, "-to", box[0], box[1])
+    
+    def update_render_backend(self):
+        """Switch between canvas items and the composited bitmap overlay"""
+        self.render_backend = self.render_backend_var.get()
+        self.clear_translations()
+        
+        # Redraw the current content with the new backend on the next capture
+        self.last_screenshot = None
+    
+    def get_translation_executor(self):
+        """Thread pool for translation requests, sized by the resource budget"""
+        if self.translation_executor is None:
+            self.translation_executor = ThreadPoolExecutor(max_workers=self.worker_pool_size(),
+                                                           thread_name_prefix="translate")
+        return self.translation_executor
 
     def is_asian_language(self, lang_code):
         """Check if language is an Asian character-based language"""
@@ -981,7 +4473,7 @@ class OverText:
         # Get the expansion factor or default to 1.0
         return expansion_factors.get((src, tgt), 1.0)
 
-    def split_translated_text(self, translated_text, original_blocks):
+    def split_translated_text(self, translated_text, original_blocks, target=None):
         """Split translated text into blocks more accurately matching original blocks"""
         if not translated_text or not original_blocks:
             return []
@@ -994,7 +4486,7 @@ class OverText:
         
         # Detect language characteristics
         src_lang = self.source_lang.get()
-        tgt_lang = self.target_lang.get()
+        tgt_lang = target or self.primary_target()
         
         # Get expansion/contraction factor between languages
         expansion_factor = self.get_language_expansion_factor(src_lang, tgt_lang)
@@ -1048,6 +4540,10 @@ class OverText:
             adjusted_count = int(proportion * translated_chars)
             end_idx = min(start_idx + adjusted_count, translated_chars)
             
+            # The last block takes whatever text remains
+            if i == len(original_char_counts) - 1:
+                end_idx = translated_chars
+            
             # Try to find word boundaries for cleaner splits
             if end_idx < translated_chars:
                 # Look for space after the calculated position
@@ -1085,93 +4581,554 @@ class OverText:
             result.append(sentences)
         return result
 
+    def get_ocr_scale(self):
+        """Get the scale factor that brings the last seen text height into the recognizer's range"""
+        if not self.last_text_height:
+            return 1.0
+        
+        if self.last_text_height < self.ocr_min_text_height:
+            # Upscale tiny text, but not beyond 3x
+            return min(self.ocr_min_text_height / self.last_text_height, 3.0)
+        elif self.last_text_height > self.ocr_max_text_height:
+            # Downscale large text, but not below 25%
+            return max(self.ocr_max_text_height / self.last_text_height, 0.25)
+        
+        return 1.0
+    
+    def find_content_bounds(self, gray, padding=8):
+        """Find the bounding box of non-background content in a grayscale image"""
+        # Estimate the background level from the border pixels
+        border = np.concatenate((gray[0, :], gray[-1, :], gray[:, 0], gray[:, -1]))
+        background = int(np.median(border))
+        
+        # Pixels that differ clearly from the background count as content
+        content = np.abs(gray.astype(np.int16) - background) > 24
+        rows = np.flatnonzero(content.any(axis=1))
+        cols = np.flatnonzero(content.any(axis=0))
+        
+        if rows.size == 0 or cols.size == 0:
+            return None
+        
+        height, width = gray.shape
+        x0 = max(0, int(cols[0]) - padding)
+        y0 = max(0, int(rows[0]) - padding)
+        x1 = min(width, int(cols[-1]) + padding + 1)
+        y1 = min(height, int(rows[-1]) + padding + 1)
+        
+        return x0, y0, x1, y1
+    
+    def binarize_image(self, gray):
+        """Binarize a grayscale image with Otsu's threshold, keeping a light background"""
+        hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+        total = hist.sum()
+        
+        # Otsu: pick the threshold that maximizes between-class variance
+        weight_bg = np.cumsum(hist)
+        weight_fg = total - weight_bg
+        cum_mean = np.cumsum(hist * np.arange(256))
+        mean_bg = cum_mean / np.maximum(weight_bg, 1)
+        mean_fg = (cum_mean[-1] - cum_mean) / np.maximum(weight_fg, 1)
+        variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        threshold = int(np.argmax(variance))
+        
+        binary = np.where(gray > threshold, 255, 0).astype(np.uint8)
+        
+        # Keep dark text on a light background
+        if np.count_nonzero(binary) < binary.size / 2:
+            binary = 255 - binary
+        
+        return binary
+    
+    def preprocess_for_ocr(self, image):
+        """Prepare a screenshot for OCR and return the array with its coordinate transform"""
+        if not self.ocr_preprocess:
+            scale = self.quality_controller.ocr_scale()
+            if scale != 1.0:
+                image = image.resize((max(1, int(image.width * scale)), max(1, int(image.height * scale))), Image.BILINEAR)
+            return np.array(image), (0, 0, scale)
+        
+        # Grayscale is all the recognizer needs
+        gray = np.array(image.convert('L'))
+        
+        # Crop empty margins, skip OCR entirely if there is no content
+        bounds = self.find_content_bounds(gray)
+        if bounds is None:
+            return None, (0, 0, 1.0)
+        
+        x0, y0, x1, y1 = bounds
+        gray = gray[y0:y1, x0:x1]
+        
+        # Scale text towards the recognizer's preferred height, smaller while shedding load
+        scale = self.get_ocr_scale() * self.quality_controller.ocr_scale()
+        if scale != 1.0:
+            new_width = max(1, int(round(gray.shape[1] * scale)))
+            new_height = max(1, int(round(gray.shape[0] * scale)))
+            resample = Image.LANCZOS if scale < 1.0 else Image.BICUBIC
+            gray = np.array(Image.fromarray(gray).resize((new_width, new_height), resample))
+        
+        if self.ocr_binarize:
+            gray = self.binarize_image(gray)
+        
+        return gray, (x0, y0, scale)
+
+    def cluster_blocks(self, rects, should_join, reach):
+        """Group rectangles with a grid spatial index, joining neighbours that satisfy should_join"""
+        count = len(rects)
+        parent = list(range(count))
+        
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        # Grid cells sized by the typical text height keep neighbour lookups local
+        cell = max(1, int(np.median([rect[3] for rect in rects]) * 2))
+        grid = {}
+        
+        for i, (x, y, width, height) in enumerate(rects):
+            margin = int(height * reach)
+            x0 = (x - margin) // cell
+            x1 = (x + width + margin) // cell
+            y0 = (y - margin) // cell
+            y1 = (y + height + margin) // cell
+            
+            # Compare against rectangles already indexed in the covered cells
+            candidates = set()
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    candidates.update(grid.get((cx, cy), ()))
+            
+            for j in candidates:
+                if find(i) != find(j) and should_join(rects[j], rects[i]):
+                    parent[find(i)] = find(j)
+            
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    grid.setdefault((cx, cy), []).append(i)
+        
+        groups = {}
+        for i in range(count):
+            groups.setdefault(find(i), []).append(i)
+        
+        return list(groups.values())
+    
+    def merge_text_blocks(self, text_blocks, mode):
+        """Merge adjacent OCR fragments into lines and optionally paragraphs"""
+        if mode == "None" or len(text_blocks) < 2:
+            return text_blocks
+        
+        def same_line(a, b):
+            # Similar height, overlapping vertically and separated by a small gap
+            min_height = max(1, min(a[3], b[3]))
+            if max(a[3], b[3]) > min_height * 1.5:
+                return False
+            overlap = min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1])
+            gap = max(b[0] - (a[0] + a[2]), a[0] - (b[0] + b[2]))
+            return overlap >= min_height * 0.5 and gap <= max(a[3], b[3])
+        
+        rects = text_blocks.bounds.tolist()
+        groups = self.cluster_blocks(rects, same_line, reach=1.0)
+        lines = text_blocks.combine([sorted(group, key=lambda i: rects[i][0]) for group in groups])
+        
+        if mode == "Paragraphs" and len(lines) > 1:
+            def same_paragraph(a, b):
+                # Similar height, stacked closely and overlapping horizontally
+                min_height = max(1, min(a[3], b[3]))
+                if max(a[3], b[3]) > min_height * 1.3:
+                    return False
+                upper, lower = (a, b) if a[1] <= b[1] else (b, a)
+                gap = lower[1] - (upper[1] + upper[3])
+                overlap = min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0])
+                return -0.3 * min_height <= gap <= 0.6 * min_height and overlap >= 0.5 * min(a[2], b[2])
+            
+            rects = lines.bounds.tolist()
+            groups = self.cluster_blocks(rects, same_paragraph, reach=0.6)
+            lines = lines.combine([sorted(group, key=lambda i: rects[i][1]) for group in groups])
+        
+        # Keep reading order: top to bottom, then left to right
+        return lines.select(np.lexsort((lines.x, lines.y)))
+    
     def extract_text_with_positions(self, image):
         """Extract text and positions from image using EasyOCR"""
         # Ensure OCR reader is initialized
         if self.reader is None:
             self.initialize_ocr_reader()
+        
+        # Let the benchmark pick the engine on the first real frame
+        if self.ocr_engine == "Auto" and not self.auto_engine_chosen:
+            self.select_ocr_engine(image)
 
-        # Convert PIL Image to numpy array for EasyOCR
-        img_np = np.array(image)
+        # Under load only the part that changed since the last OCR pass is read again
+        if self.quality_controller.at_least("dirty regions"):
+            text_blocks = self.extract_dirty_regions(image)
+            if text_blocks is not None:
+                return text_blocks
+        
+        # Routine frames are only read inside the regions where text usually appears
+        regions = self.ocr_regions(image)
+        full_scan = regions is None
+        if full_scan:
+            regions = [(0, 0, image.width, image.height)]
+        
+        results = []
+        start = time.perf_counter()
+        for region in regions:
+            results.extend(self.read_region(image, region))
+        self.record_ocr_latency((time.perf_counter() - start) * 1000)
+        
+        # All polygons are already in overlay coordinates
+        text_blocks = TextBlocks.from_ocr_results(results)
+        
+        # Skip empty text and low-confidence noise
+        keep = (text_blocks.confidence >= self.min_ocr_confidence) & text_blocks.has_text()
+        text_blocks = text_blocks.select(keep)
+        
+        # Remember the typical text height for adaptive scaling
+        if text_blocks:
+            median_height = float(np.median(text_blocks.text_height))
+            if median_height > 0:
+                self.last_text_height = median_height
         
-        # Use EasyOCR to get text and positions
-        results = self.reader.readtext(img_np)
+        if self.use_text_heatmap:
+            self.text_heatmap.add(text_blocks, image.size, full_scan)
+            self.update_heatmap_stats(regions, full_scan)
         
-        # Process the results
-        text_blocks = []
+        # Merge adjacent fragments into lines or paragraphs
+        text_blocks = self.merge_text_blocks(text_blocks, self.merge_mode)
+        self.ocr_frame_blocks = (image, text_blocks)
+        return text_blocks
+    
+    def extract_dirty_regions(self, image):
+        """Re-read only the changed part of the frame, keeping the other blocks of the last OCR pass"""
+        if self.ocr_frame_blocks is None or self.ocr_frame_blocks[0].size != image.size:
+            return None
+        last_image, last_blocks = self.ocr_frame_blocks
+        
+        box = self.dirty_box(last_image, image)
+        if box is None:
+            self.ocr_frame_blocks = (image, last_blocks)
+            return last_blocks
+        
+        # Grow the box until it holds every old block it touches, so no block is read in halves
+        bounds = last_blocks.bounds
+        x0, y0, x1, y1 = box
+        while True:
+            touched = ((bounds[:, 0] < x1) & (bounds[:, 0] + bounds[:, 2] > x0) &
+                       (bounds[:, 1] < y1) & (bounds[:, 1] + bounds[:, 3] > y0))
+            if not touched.any():
+                break
+            grown = (min(x0, int(bounds[touched, 0].min())), min(y0, int(bounds[touched, 1].min())),
+                     max(x1, int((bounds[touched, 0] + bounds[touched, 2]).max())),
+                     max(y1, int((bounds[touched, 1] + bounds[touched, 3]).max())))
+            grown = (max(0, grown[0]), max(0, grown[1]), min(image.width, grown[2]), min(image.height, grown[3]))
+            if grown == (x0, y0, x1, y1):
+                break
+            x0, y0, x1, y1 = grown
         
-        for (bbox, text, prob) in results:
-            if text.strip():  # Skip empty text
-                # Extract bounding box coordinates
-                top_left = bbox[0]
-                top_right = bbox[1]
-                bottom_right = bbox[2]
-                bottom_left = bbox[3]
-                
-                # Calculate dimensions
-                x = int(top_left[0])
-                y = int(top_left[1])
-                width = int(top_right[0] - top_left[0])
-                height = int(bottom_left[1] - top_left[1])
-                
-                text_blocks.append({
-                    "text": text,
-                    "x": x,
-                    "y": y,
-                    "width": width,
-                    "height": height
-                })
+        start = time.perf_counter()
+        results = self.read_region(image, (x0, y0, x1, y1))
+        self.record_ocr_latency((time.perf_counter() - start) * 1000)
+        
+        fresh = TextBlocks.from_ocr_results(results)
+        fresh = fresh.select((fresh.confidence >= self.min_ocr_confidence) & fresh.has_text())
+        fresh = self.merge_text_blocks(fresh, self.merge_mode)
         
+        text_blocks = TextBlocks.concat([last_blocks.select(~touched), fresh])
+        self.ocr_frame_blocks = (image, text_blocks)
         return text_blocks
     
-    def translate_text(self, text):
+    def dirty_box(self, last_image, image, factor=8):
+        """Bounding box of the cells that differ between two frames, or None if they match"""
+        last_small = np.array(last_image.convert('L').reduce(factor), dtype=np.int16)
+        small = np.array(image.convert('L').reduce(factor), dtype=np.int16)
+        changed_cells = np.abs(small - last_small) > 12
+        if not changed_cells.any():
+            return None
+        
+        # One cell of padding around the changed cells
+        rows = np.flatnonzero(changed_cells.any(axis=1))
+        cols = np.flatnonzero(changed_cells.any(axis=0))
+        return (max(0, (int(cols[0]) - 1) * factor), max(0, (int(rows[0]) - 1) * factor),
+                min(image.width, (int(cols[-1]) + 2) * factor), min(image.height, (int(rows[-1]) + 2) * factor))
+    
+    def read_region(self, image, region):
+        """OCR one rectangle of the image, returning results in image coordinates"""
+        x0, y0, x1, y1 = region
+        crop = image if (x0, y0, x1, y1) == (0, 0, image.width, image.height) else image.crop(region)
+        
+        # Convert and shrink the image for EasyOCR
+        img_np, (offset_x, offset_y, scale) = self.preprocess_for_ocr(crop)
+        if img_np is None:
+            return []
+        
+        offset = np.array([x0 + offset_x, y0 + offset_y], dtype=np.float32)
+        with self.ocr_lock:
+            results = self.reader.readtext(img_np)
+        return [(np.asarray(bbox, dtype=np.float32) / scale + offset, text, prob)
+                for bbox, text, prob in results]
+    
+    def ocr_regions(self, image):
+        """Hot regions to OCR for this frame, or None for a full-frame scan"""
+        if not self.use_text_heatmap:
+            return None
+        
+        self.heatmap_ocr_count += 1
+        if not self.text_heatmap.is_ready(image.size) or self.heatmap_ocr_count % self.full_scan_interval == 0:
+            return None
+        
+        # Nothing hot yet means there is nothing to narrow down to
+        return self.text_heatmap.hot_regions() or None
+    
+    def change_detection_box(self, size):
+        """Part of the frame that change detection compares, or None for the whole frame"""
+        if not self.use_text_heatmap or not self.text_heatmap.is_ready(size):
+            return None
+        
+        self.heatmap_check_count += 1
+        if self.heatmap_check_count % self.full_scan_interval == 0:
+            return None
+        return self.text_heatmap.bounding_box()
+    
+    def update_heatmap_stats(self, regions, full_scan):
+        """Show how much of the frame the last OCR pass covered"""
+        coverage = 100.0 if full_scan else self.text_heatmap.coverage(regions) * 100
+        kind = "full scan" if full_scan else f"{len(regions)} regions"
+        self.heatmap_stats_label.config(text=f"Last OCR: {kind}, {coverage:.0f}% of frame")
+    
+    def toggle_text_heatmap(self):
+        """Enable or disable the text-region heatmap, starting over with full scans"""
+        self.use_text_heatmap = self.heatmap_var.get()
+        self.text_heatmap.reset()
+    
+    def request_translation(self, text, service=None, target=None):
+        """Send text to a translation service, raising on any failure"""
+        service = service or self.translation_service.get()
+        source = self.source_lang.get()
+        target = target or self.primary_target()
+        
+        logging.info('%s %s', 'translation_service request: ', service)
+        
+        if service == "Google":
+            translator = GoogleTranslator(source=source, target=target)
+            
+        elif service == "DeepL":
+            api_key = self.deepl_key.get().strip()
+            if api_key:
+                # Using API Key
+                translator = DeeplTranslator(api_key=api_key, source=source, target=target)
+            else:
+                # Using the free version
+                translator = DeeplTranslator(source=source, target=target)
+            
+        elif service == "Baidu":
+            app_id = self.baidu_app_id.get().strip()
+            api_key = self.baidu_api_key.get().strip()
+            
+            if not app_id or not api_key:
+                raise ValueError("Baidu requires App ID and API Key")
+                
+            translator = BaiduTranslator(app_id=app_id, app_key=api_key,
+                                        source=source, target=target)
+            
+        elif service == "LibreTranslate" or service.startswith(("http://", "https://")):
+            # LibreTranslate-compatible HTTP API, also used with local stub servers
+            url = self.libretranslate_entry.get().strip() if service == "LibreTranslate" else service
+            return self.request_libretranslate(url, text, source, target)
+            
+        else:
+            raise ValueError("Unknown translation service")
+        
+        return translator.translate(text)
+    
+    def request_libretranslate(self, url, text, source, target):
+        """Translate with a LibreTranslate-compatible server"""
+        payload = json.dumps({"q": text, "source": source, "target": target, "format": "text"}).encode("utf-8")
+        request = urllib.request.Request(url.rstrip("/") + "/translate", data=payload,
+                                         headers={"Content-Type": "application/json"})
+        
+        # Never wait on one server longer than the whole latency budget
+        with urllib.request.urlopen(request, timeout=self.translation_router.latency_budget) as response:
+            return json.loads(response.read().decode("utf-8"))["translatedText"]
+    
+    def translation_providers(self):
+        """Selected service first, then the configured fallbacks"""
+        fallbacks = [name.strip() for name in self.fallback_services.get().split(",") if name.strip()]
+        return [self.translation_service.get()] + fallbacks
+    
+    def route_translation(self, text, target=None):
+        """Translate text through the provider router, hedging slow providers"""
+        return self.translation_router.translate(
+            lambda service: self.request_translation(text, service=service, target=target),
+            self.translation_providers())
+    
+    def translate_text(self, text, target=None):
         """Translate text using the selected translation service"""
         if not text:
             return ""
             
         try:
-            service = self.translation_service.get()
+            return self.route_translation(text, target=target)
+        
+        except ValueError as e:
+            return f"[Error: {str(e)}]"
             
-            logging.info('%s %s', 'translation_service request: ', service)
+        except Exception as e:
+            # Providers are down or too slow; show the source text instead of stalling
+            logging.warning(f"Translation error: {e}")
+            return text
+    
+    def lookup_translations(self, texts, target):
+        """Look up block texts in the translation memory, returning results and miss indices"""
+        source = self.source_lang.get()
+        memory = self.translation_memory
+        
+        results = [""] * len(texts)
+        misses = []
+        target_base = target.lower().strip().split('-')[0]
+        han_hint = self.language_identifier.han_hint(texts, source) if self.skip_untranslatable else None
+        
+        for i, text in enumerate(texts):
+            if not text.strip():
+                continue
             
-            if service == "Google":
-                translator = GoogleTranslator(source=self.source_lang.get(), target=self.target_lang.get())
-                translated = translator.translate(text)
-                
-            elif service == "DeepL":
-                api_key = self.deepl_key.get().strip()
-                if api_key:
-                    # Using API Key
-                    translator = DeeplTranslator(api_key=api_key, 
-                                                source=self.source_lang.get(), 
-                                                target=self.target_lang.get())
-                else:
-                    # Using the free version
-                    translator = DeeplTranslator(source=self.source_lang.get(), 
-                                               target=self.target_lang.get())
-                translated = translator.translate(text)
-                
-            elif service == "Baidu":
-                app_id = self.baidu_app_id.get().strip()
-                api_key = self.baidu_api_key.get().strip()
-                
-                if not app_id or not api_key:
-                    return "[Error: Baidu requires App ID and API Key]"
-                    
-                translator = BaiduTranslator(app_id=app_id, 
-                                            app_key=api_key,
-                                            source=self.source_lang.get(), 
-                                            target=self.target_lang.get())
-                translated = translator.translate(text)
-                
-            else:
-                return "[Error: Unknown translation service]"
-                
-            return translated
+            if self.skip_untranslatable and self.is_untranslatable(text, target_base, han_hint):
+                # Shown as recognized, without asking the translator
+                results[i] = text
+                continue
             
+            cached = memory.lookup(text, source, target) if self.use_translation_memory else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.append(i)
+        
+        return results, misses
+    
+    def is_untranslatable(self, text, target_base, han_hint=None):
+        """Check if a block is numeric, symbolic or already in the target language"""
+        if not self.language_identifier.has_letters(text):
+            return True
+        
+        lang, confidence = self.language_identifier.identify(text, han_hint)
+        if lang is not None:
+            self.detected_languages.append(lang)
+        
+        return lang == target_base and confidence >= 0.5
+    
+    def suggest_ocr_languages(self, min_share=0.1):
+        """Suggest the smallest OCR language set covering the recently seen text"""
+        counts = Counter(self.detected_languages)
+        total = sum(counts.values())
+        if not total:
+            return []
+        
+        # Languages making up a meaningful share of the recent blocks
+        languages = [lang for lang, count in counts.most_common() if count / total >= min_share]
+        
+        # EasyOCR uses its own code for Simplified Chinese
+        return ['ch_sim' if lang == 'zh' else lang for lang in languages]
+    
+    def update_language_suggestion(self):
+        """Show detected languages and the suggested OCR language set"""
+        counts = Counter(self.detected_languages)
+        total = sum(counts.values())
+        if not total:
+            return
+        
+        detected = ", ".join(f"{lang} {count / total * 100:.0f}%" for lang, count in counts.most_common(4))
+        suggested = ", ".join(self.suggest_ocr_languages())
+        self.language_suggestion_label.config(text=f"Detected: {detected}\nSuggested OCR languages: {suggested}")
+    
+    def use_suggested_ocr_languages(self):
+        """Reload the OCR reader with the suggested language set"""
+        suggested = self.suggest_ocr_languages()
+        if suggested:
+            self.ocr_language_override = suggested
+            self.initialize_ocr_reader()
+    
+    def update_ocr_languages(self):
+        """Reload the OCR reader for the source and target language settings"""
+        self.ocr_language_override = None
+        self.initialize_ocr_reader()
+    
+    def translate_misses(self, texts, misses, target):
+        """Translate the missing blocks in one request and split the result back"""
+        source = self.source_lang.get()
+        memory = self.translation_memory
+        
+        # Apply the glossary and translate all misses in one request, one block per line
+        miss_texts = [" ".join(memory.apply_glossary(texts[i]).split()) for i in misses]
+        combined_text = "\n".join(miss_texts)
+        
+        try:
+            translated_full_text = self.route_translation(combined_text, target=target)
+            failed = False
+        except ValueError as e:
+            translated_full_text = f"[Error: {str(e)}]"
+            failed = True
+        except Exception as e:
+            # Providers are down or too slow; show the source text instead of stalling
+            logging.warning(f"Translation error: {e}")
+            return {i: texts[i] for i in misses}
+        
+        # Translators keep line breaks, so the lines map back to the blocks when their count matches
+        translated_lines = [line.strip() for line in translated_full_text.split("\n") if line.strip()]
+        aligned = len(misses) == 1 or len(translated_lines) == len(misses)
+        if len(misses) == 1:
+            translated_parts = [translated_full_text]
+        elif aligned:
+            translated_parts = translated_lines
+        else:
+            translated_parts = self.split_translated_text(" ".join(translated_lines),
+                                                          [{"text": text} for text in miss_texts], target)
+        
+        translations = {}
+        for i, translated in zip(misses, translated_parts):
+            if not failed:
+                translated = memory.enforce_glossary(translated)
+                # Fragments of a heuristic split may be misaligned, so only aligned translations are remembered
+                if self.use_translation_memory and aligned:
+                    memory.store(texts[i], translated, source, target)
+            translations[i] = translated
+        
+        return translations
+    
+    def translate_single(self, text, target):
+        """Translate one block on its own, storing the result in the translation memory"""
+        memory = self.translation_memory
+        
+        try:
+            translated = memory.enforce_glossary(self.route_translation(memory.apply_glossary(text), target=target))
+        except ValueError as e:
+            return f"[Error: {str(e)}]"
         except Exception as e:
-            print(f"Translation error: {e}")
-            return f"[Translation Error: {str(e)}]"
+            # Providers are down or too slow; keep showing the source text
+            logging.warning(f"Translation error: {e}")
+            return text
+        
+        if self.use_translation_memory:
+            memory.store(text, translated, self.source_lang.get(), target)
+        return translated
+    
+    def translate_blocks(self, texts, target=None):
+        """Translate block texts, serving repeats from the translation memory"""
+        target = target or self.primary_target()
+        results, misses = self.lookup_translations(texts, target)
+        
+        if misses:
+            for i, translated in self.translate_misses(texts, misses, target).items():
+                results[i] = translated
+        
+        self.update_tm_stats()
+        return results
+    
+    def update_tm_stats(self):
+        """Show the translation memory hit ratio and detected languages"""
+        if self.use_translation_memory:
+            self.tm_stats_label.config(text=self.translation_memory.stats_text())
+        self.router_stats_label.config(text=self.translation_router.stats_text())
+        self.update_language_suggestion()
     
     def capture_and_translate(self):
         """Capture screenshot, extract text, and display translations"""
@@ -1183,9 +5140,19 @@ class OverText:
         self.canvas.delete("all")
         self.tab_canvas.delete("all")
         self.ocr_canvas.delete("all")
-        self.text_boxes = []
+        for _, canvas in self.language_canvases.values():
+            canvas.delete("all")
+        self.remove_unused_language_tabs()
+        self.language_translations = {}
+        self.rendered_views = set()
+        self.bitmap_item = None
+        self.text_boxes = TextBlocks()
         self.translation_boxes = []
+        self.translation_box_index = {}
         self.ocr_text_boxes = []
+        
+        # Pending progressive updates belong to the cleared content
+        self.render_generation += 1
     
     def detect_edge(self, event):
         """Detect if mouse is near an edge and change cursor accordingly"""
@@ -1236,6 +5203,7 @@ class OverText:
         """Start resize operation based on cursor position"""
         if self.resize_edge:
             self.resizing = True
+            self.window_moving = True
             self.start_x = event.x_root
             self.start_y = event.y_root
             self.start_width = self.root.winfo_width()
@@ -1247,40 +5215,81 @@ class OverText:
             self.start_drag(event)
     
     def on_resize_or_drag(self, event):
-        """Handle window resizing based on flag"""
-        if self.resizing:
-            # Calculate the difference from starting point
-            delta_x = event.x_root - self.start_x
-            delta_y = event.y_root - self.start_y
-            
-            # Calculate new dimensions and position based on which edge is being dragged
-            new_width = self.start_width
-            new_height = self.start_height
-            new_x = self.start_pos_x
-            new_y = self.start_pos_y
-            
-            # Apply changes based on which edge is being resized
-            if "left" in self.resize_edge:
-                new_width = max(200, self.start_width - delta_x)
-                new_x = self.start_pos_x + (self.start_width - new_width)
-            
-            if "right" in self.resize_edge:
-                new_width = max(200, self.start_width + delta_x)
-            
-            if "top" in self.resize_edge:
-                new_height = max(200, self.start_height - delta_y)
-                new_y = self.start_pos_y + (self.start_height - new_height)
-            
-            if "bottom" in self.resize_edge:
-                new_height = max(200, self.start_height + delta_y)
-            
-            # Update the window geometry
-            self.root.geometry(f"{new_width}x{new_height}+{new_x}+{new_y}")
+        """Record the pointer position and apply it on the next display frame"""
+        self.pending_motion = (event.x_root, event.y_root)
+        
+        # Many motion events per frame collapse into a single geometry change
+        if self.motion_after_id is None:
+            self.motion_after_id = self.root.after(self.motion_interval_ms, self.apply_pending_motion)
+    
+    def apply_pending_motion(self):
+        """Apply the latest pointer position to the window geometry"""
+        self.motion_after_id = None
+        if self.pending_motion is None:
+            return
+        
+        x_root, y_root = self.pending_motion
+        self.pending_motion = None
+        
+        # Calculate the difference from starting point
+        delta_x = x_root - self.start_x
+        delta_y = y_root - self.start_y
+        
+        if not self.resizing:
+            # Dragging only moves the window
+            self.root.geometry(f"+{self.start_pos_x + delta_x}+{self.start_pos_y + delta_y}")
+            return
+        
+        # Calculate new dimensions and position based on which edge is being dragged
+        new_width = self.start_width
+        new_height = self.start_height
+        new_x = self.start_pos_x
+        new_y = self.start_pos_y
+        
+        # Apply changes based on which edge is being resized
+        if "left" in self.resize_edge:
+            new_width = max(200, self.start_width - delta_x)
+            new_x = self.start_pos_x + (self.start_width - new_width)
+        
+        if "right" in self.resize_edge:
+            new_width = max(200, self.start_width + delta_x)
+        
+        if "top" in self.resize_edge:
+            new_height = max(200, self.start_height - delta_y)
+            new_y = self.start_pos_y + (self.start_height - new_height)
+        
+        if "bottom" in self.resize_edge:
+            new_height = max(200, self.start_height + delta_y)
+        
+        # Update the window geometry
+        self.root.geometry(f"{new_width}x{new_height}+{new_x}+{new_y}")
+        
+        # Update the width and height variables to match the new window size
+        # This is key for fixing the resize capture issue
+        self.width = new_width - (self.border_width * 2)
+        self.height = new_height - (self.border_width * 2)
+    
+    def stop_resize(self, event):
+        """Finish a drag or resize, then apply the deferred updates and capture once"""
+        # Apply the last position that was still waiting for a frame
+        if self.motion_after_id is not None:
+            self.root.after_cancel(self.motion_after_id)
+            self.motion_after_id = None
+        if self.window_moving:
+            self.apply_pending_motion()
+        
+        was_resizing = self.resizing
+        self.resizing = False
+        
+        if was_resizing:
+            # Get the current window dimensions
+            self.root.update_idletasks()
+            current_width = self.root.winfo_width()
+            current_height = self.root.winfo_height()
             
-            # Update the width and height variables to match the new window size
-            # This is key for fixing the resize capture issue
-            self.width = new_width - (self.border_width * 2)
-            self.height = new_height - (self.border_width * 2)
+            # Update internal dimensions
+            self.width = current_width - (self.border_width * 2)
+            self.height = current_height - (self.border_width * 2)
             
             # Update the width/height entries in the control panel
             self.width_entry.delete(0, tk.END)
@@ -1289,47 +5298,29 @@ class OverText:
             self.height_entry.insert(0, str(self.height))
             
             # Update tabs window size to match
-            self.tabs_window.geometry(f"{self.width}x{self.height}")
-        else:
-            # If not resizing, then we're dragging
-            self.on_drag(event)
-    
-    def stop_resize(self, event):
-        """Stop the resize operation and update internal dimensions"""
-        self.resizing = False
-        
-        # Get the current window dimensions
-        current_width = self.root.winfo_width()
-        current_height = self.root.winfo_height()
-        
-        # Update internal dimensions
-        self.width = current_width - (self.border_width * 2)
-        self.height = current_height - (self.border_width * 2)
-        
-        # Update the width/height entries in the control panel
-        self.width_entry.delete(0, tk.END)
-        self.width_entry.insert(0, str(self.width))
-        self.height_entry.delete(0, tk.END)
-        self.height_entry.insert(0, str(self.height))
-        
-        # Update tabs window size to match
-        if self.show_tabs_var.get():
-            self.tabs_window.geometry(f"{self.width}x{self.height}")
+            if self.show_tabs_var.get():
+                self.tabs_window.geometry(f"{self.width}x{self.height}")
+            
+            logging.info(f"Window resized: {self.width}x{self.height}")
         
-        logging.info(f"Window resized: {self.width}x{self.height}")
+        if self.window_moving:
+            # Resume auto-update with an immediate capture at the new geometry
+            self.window_moving = False
+            if self.auto_update:
+                self.force_capture = True
+                self.update_wake.set()
     
     def start_drag(self, event):
         """Start drag operation for moving the window"""
-        self.x = event.x
-        self.y = event.y
+        self.window_moving = True
+        self.start_x = event.x_root
+        self.start_y = event.y_root
+        self.start_pos_x = self.root.winfo_x()
+        self.start_pos_y = self.root.winfo_y()
     
     def on_drag(self, event):
         """Handle window dragging"""
-        x_offset = event.x - self.x
-        y_offset = event.y - self.y
-        x = self.root.winfo_x() + x_offset
-        y = self.root.winfo_y() + y_offset
-        self.root.geometry(f"+{x}+{y}")
+        self.on_resize_or_drag(event)
     
     def apply_size(self):
         """Apply size from control panel inputs"""
@@ -1412,6 +5403,8 @@ class OverText:
             self.tabs_window.geometry(f"{self.width}x{self.height}")
             # Hide text in main overlay
             self.update_main_overlay_visibility()
+            # Draw the selected view, which was skipped while the window was hidden
+            self.render_visible_view()
         else:
             self.tabs_window.withdraw()
             # Show text in main overlay
@@ -1419,15 +5412,12 @@ class OverText:
     
     def update_main_overlay_visibility(self):
         """Update the visibility of text in the main overlay based on tabs window visibility"""
-        if self.translation_boxes:
-            show_text = not self.show_tabs_var.get()
-            for box in self.translation_boxes:
-                if show_text:
-                    # Show text by restoring its original state
-                    self.canvas.itemconfig(box["text"], state="normal")
-                else:
-                    # Hide text by setting state to hidden
-                    self.canvas.itemconfig(box["text"], state="hidden")
+        state = "hidden" if self.show_tabs_var.get() else "normal"
+        if self.bitmap_item is not None:
+            self.canvas.itemconfig(self.bitmap_item, state=state)
+        
+        # All overlay text items share one tag
+        self.canvas.itemconfig("overlay_text", state=state)
     
     def update_threshold(self, value):
         """Update the change threshold for image comparison"""
@@ -1437,19 +5427,761 @@ class OverText:
         except ValueError:
             pass
     
+    def load_glossary(self):
+        """Load the glossary file into the translation memory"""
+        path = self.glossary_path.get().strip()
+        if not path:
+            return
+        
+        try:
+            count = self.translation_memory.load_glossary(path)
+            logging.info(f"Loaded {count} glossary terms from {path}")
+        except OSError as e:
+            logging.error(f"Error loading glossary: {e}")
+    
+    def session_settings(self):
+        """Settings stored in the header of a session recording"""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "source_lang": self.source_lang.get(),
+            "target_lang": self.target_lang.get(),
+            "translation_service": self.translation_service.get(),
+            "comparison_method": self.comparison_method,
+            "change_threshold": self.change_threshold,
+            "update_interval": self.update_interval,
+            "ocr_engine": self.ocr_engine,
+            "ocr_backend": self.ocr_backend,
+            "merge_mode": self.merge_mode,
+            "min_ocr_confidence": self.min_ocr_confidence,
+            "render_backend": self.render_backend,
+        }
+    
+    def toggle_session_recording(self):
+        """Start or stop recording captured frames to a session file"""
+        if self.record_session_var.get():
+            os.makedirs(self.session_dir, exist_ok=True)
+            path = os.path.join(self.session_dir, time.strftime("session-%Y%m%d-%H%M%S.otrec"))
+            self.session_recorder = SessionRecorder(path, self.session_settings())
+            
+            # Offer the new recording for replay
+            self.session_path.delete(0, tk.END)
+            self.session_path.insert(0, path)
+            logging.info(f"Recording session to {path}")
+        elif self.session_recorder is not None:
+            recorder, self.session_recorder = self.session_recorder, None
+            recorder.close()
+            logging.info(f"{recorder.stats_text()} saved to {recorder.path}")
+    
+    def toggle_replay(self):
+        """Start replaying the session file, or stop a running replay"""
+        if self.replaying:
+            self.stop_replay.set()
+            return
+        
+        path = self.session_path.get().strip()
+        if path:
+            self.start_replay(path, self.replay_max_speed)
+    
+    def start_replay(self, path, max_speed=False):
+        """Replay a recorded session in a background thread"""
+        try:
+            reader = SessionReader(path)
+        except (OSError, ValueError) as e:
+            logging.error(f"Error opening session: {e}")
+            return
+        
+        # Compare frames the same way as during the recording, and restore the user's settings afterwards
+        settings = reader.settings
+        saved_settings = self.replay_settings()
+        self.apply_replay_settings(settings)
+        logging.info(f"Replaying {len(reader)} frames ({reader.duration():.0f}s) recorded with {settings}")
+        
+        self.replaying = True
+        self.stop_replay.clear()
+        self.last_screenshot = None
+        self.replay_btn.config(text="Stop Replay")
+        threading.Thread(target=self.replay_session, args=(reader, max_speed, saved_settings), daemon=True).start()
+    
+    def replay_settings(self):
+        """The settings a recording brings along, as currently set"""
+        return {"comparison_method": self.comparison_method, "change_threshold": self.change_threshold,
+                "merge_mode": self.merge_mode, "min_ocr_confidence": self.min_ocr_confidence}
+    
+    def apply_replay_settings(self, settings):
+        """Apply recorded (or saved) processing settings and show them in the control panel"""
+        self.comparison_method = settings.get("comparison_method", self.comparison_method)
+        self.change_threshold = settings.get("change_threshold", self.change_threshold)
+        self.merge_mode = settings.get("merge_mode", self.merge_mode)
+        self.min_ocr_confidence = settings.get("min_ocr_confidence", self.min_ocr_confidence)
+        self.comparison_var.set(self.comparison_method)
+        self.threshold_slider.set(self.change_threshold * 100)
+        self.merge_var.set(self.merge_mode)
+        self.confidence_slider.set(self.min_ocr_confidence * 100)
+    
+    def replay_session(self, reader, max_speed, saved_settings=None):
+        """Feed recorded frames through change detection and processing"""
+        processed = 0
+        frames = 0
+        start = time.perf_counter()
+        
+        try:
+            for timestamp, frame in reader.frames():
+                if self.stop_replay.is_set():
+                    break
+                
+                # Keep the recorded pacing unless replaying as fast as possible
+                if not max_speed:
+                    delay = timestamp - (time.perf_counter() - start)
+                    if delay > 0 and self.stop_replay.wait(delay):
+                        break
+                
+                frames += 1
+                if self.has_content_changed(frame):
+                    self.last_screenshot = frame
+                    self.process_screenshot(frame)
+                    processed += 1
+        finally:
+            reader.close()
+            self.replaying = False
+            elapsed = time.perf_counter() - start
+            summary = f"Replayed {frames} frames in {elapsed:.1f}s, processed {processed}"
+            logging.info(summary)
+            self.root.after(0, lambda: (self.session_stats_label.config(text=summary),
+                                        self.replay_btn.config(text="Replay Session")))
+            if saved_settings is not None:
+                self.root.after(0, self.apply_replay_settings, saved_settings)
+    
+    def toggle_profiling(self):
+        """Start sampling the application threads, or stop a running profile early"""
+        if self.profiler.is_running():
+            self.profiler.stop()
+            return
+        
+        self.profile_btn.config(text="Stop Profiling")
+        self.profile_summary_label.config(text=f"Profiling for {self.profile_duration}s...")
+        self.profiler.start(self.profile_duration,
+                            on_finish=lambda profiler: self.root.after(0, self.finish_profiling),
+                            thread_ids=self.profiled_threads)
+    
+    def profiled_threads(self):
+        """Idents of the UI thread and the auto-update thread, which do the capture work"""
+        idents = {threading.main_thread().ident}
+        if self.update_thread is not None and self.update_thread.is_alive():
+            idents.add(self.update_thread.ident)
+        return idents
+    
+    def finish_profiling(self):
+        """Write the profile files and show the hottest functions"""
+        self.profile_btn.config(text="Start Profiling")
+        
+        os.makedirs(self.profile_dir, exist_ok=True)
+        base = os.path.join(self.profile_dir, time.strftime("profile-%Y%m%d-%H%M%S"))
+        summary = self.profiler.summary_text()
+        
+        try:
+            self.profiler.write_collapsed(base + ".collapsed")
+            self.profiler.write_speedscope(base + ".speedscope.json")
+            with open(base + ".txt", "w", encoding="utf-8") as f:
+                f.write(summary + "\n")
+        except OSError as e:
+            logging.error(f"Error writing profile: {e}")
+            return
+        
+        logging.info(f"Profile written to {base}.*\n{summary}")
+        self.profile_summary_label.config(text=f"{summary}\n\nSaved to {base}.*")
+    
+    def memory_usage_mb(self):
+        """Resident set size of this process in MB"""
+        try:
+            # Linux: resident pages are the second field
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+        except (OSError, ValueError, AttributeError):
+            pass
+        try:
+            import psutil
+            return psutil.Process().memory_info().rss / 1e6
+        except ImportError:
+            return 0.0
+    
+    def count_widgets(self, widget):
+        """Number of Tk widgets below widget, including itself"""
+        return 1 + sum(self.count_widgets(child) for child in widget.winfo_children())
+    
+    def soak_metrics(self):
+        """Memory, Tk object counts and cache sizes for leak tracking"""
+        metrics = {
+            "rss_mb": self.memory_usage_mb(),
+            "widgets": self.count_widgets(self.root),
+            "canvas_items": sum(len(canvas.find_all()) for canvas in (self.canvas, self.tab_canvas, self.ocr_canvas)),
+            "tm_entries": len(self.translation_memory.entries),
+            "wrap_cache": len(self.wrap_cache),
+            "stabilizer_tracks": len(self.text_stabilizer.tracks),
+            "bitmap_fonts": len(self.bitmap_renderer.fonts) if self.bitmap_renderer else 0,
+            "threads": threading.active_count(),
+        }
+        if tracemalloc.is_tracing():
+            metrics["traced_mb"] = tracemalloc.get_traced_memory()[0] / 1e6
+        return metrics
+    
+    def trim_caches(self, translations=False):
+        """Drop cached frames and text, and halve the translation memory if asked, to get back under the ceiling"""
+        self.frame_hash_cache = (None, None)
+        self.cached_text_blocks = None
+        self.wrap_cache.clear()
+        if self.bitmap_renderer is not None:
+            self.bitmap_renderer.fonts.clear()
+        if translations:
+            self.translation_memory.trim(len(self.translation_memory.entries) // 2)
+        gc.collect()
+    
+    def enforce_memory_ceiling(self):
+        """Trim caches when the process uses more memory than the configured ceiling, at most once per cooldown"""
+        rss = self.memory_usage_mb()
+        if rss <= self.memory_ceiling_mb - self.memory_trim_hysteresis_mb:
+            # Well under the ceiling again: the next trim starts over with the cheap caches
+            self.memory_trims = 0
+            self.last_memory_trim = None
+            return False
+        if rss <= self.memory_ceiling_mb:
+            return False
+        
+        # Freed objects rarely lower RSS, so trimming again only helps once memory has grown further
+        if self.last_memory_trim is not None:
+            trimmed_at, trimmed_rss = self.last_memory_trim
+            if (time.monotonic() - trimmed_at < self.memory_trim_cooldown
+                    or rss < trimmed_rss + self.memory_trim_hysteresis_mb):
+                return False
+        
+        # The bounded caches go first; the translation memory only when that was not enough
+        self.trim_caches(translations=self.memory_trims > 0)
+        self.memory_trims += 1
+        trimmed_rss = self.memory_usage_mb()
+        self.last_memory_trim = (time.monotonic(), trimmed_rss)
+        logging.warning(f"Memory {rss:.0f} MB above ceiling {self.memory_ceiling_mb} MB, "
+                        f"trimmed caches to {trimmed_rss:.0f} MB")
+        return True
+    
+    def toggle_soak_test(self):
+        """Start a soak test with the session file from the Capture tab, or stop it"""
+        if self.soak_running:
+            self.stop_replay.set()
+            return
+        
+        try:
+            self.soak_hours = float(self.soak_hours_entry.get())
+        except ValueError:
+            return
+        path = self.session_path.get().strip()
+        if path:
+            self.start_soak_test(path, self.soak_hours)
+    
+    def start_soak_test(self, path, hours):
+        """Replay a session in a loop through the full pipeline for the given hours"""
+        try:
+            SessionReader(path).close()
+        except (OSError, ValueError) as e:
+            logging.error(f"Error opening session: {e}")
+            return
+        
+        self.soak_running = True
+        self.replaying = True
+        self.stop_replay.clear()
+        self.soak_btn.config(text="Stop Soak Test")
+        threading.Thread(target=self.soak_test, args=(path, hours), daemon=True).start()
+    
+    def soak_test(self, path, hours):
+        """Soak test loop: replay frames, sample metrics, enforce the ceiling, then report"""
+        tracemalloc.start(10)
+        first_snapshot = tracemalloc.take_snapshot()
+        self.soak_samples = []
+        trims = 0
+        frames = 0
+        start = time.perf_counter()
+        end = start + hours * 3600
+        next_sample = start
+        
+        try:
+            while time.perf_counter() < end and not self.stop_replay.is_set():
+                reader = SessionReader(path)
+                try:
+                    for _, frame in reader.frames():
+                        if self.stop_replay.is_set() or time.perf_counter() >= end:
+                            break
+                        
+                        frames += 1
+                        if self.has_content_changed(frame):
+                            self.last_screenshot = frame
+                            self.process_screenshot(frame)
+                        
+                        if time.perf_counter() >= next_sample:
+                            next_sample += self.soak_sample_interval
+                            if self.memory_ceiling_mb and self.enforce_memory_ceiling():
+                                trims += 1
+                            metrics = self.soak_metrics()
+                            metrics["elapsed"] = time.perf_counter() - start
+                            self.soak_samples.append(metrics)
+                            status = (f"Soak: {metrics['elapsed'] / 3600:.2f}h, {frames} frames, "
+                                      f"RSS {metrics['rss_mb']:.0f} MB, {metrics['canvas_items']} items")
+                            self.root.after(0, lambda status=status: self.soak_stats_label.config(text=status))
+                finally:
+                    reader.close()
+        finally:
+            report = self.soak_report(first_snapshot, frames, trims)
+            tracemalloc.stop()
+            self.soak_running = False
+            self.replaying = False
+            
+            os.makedirs(self.soak_dir, exist_ok=True)
+            report_path = os.path.join(self.soak_dir, time.strftime("soak-%Y%m%d-%H%M%S.txt"))
+            with open(report_path, "w", encoding="utf-8") as f:
+                f.write(report)
+            logging.info(f"Soak test report written to {report_path}\n{report}")
+            
+            summary = report.split("\n\n")[0]
+            self.root.after(0, lambda: (self.soak_stats_label.config(text=f"{summary}\nReport: {report_path}"),
+                                        self.soak_btn.config(text="Start Soak Test")))
+    
+    def find_growing_metrics(self, samples, min_increase_ratio=0.8):
+        """Metrics that grew over the run and rose in most sampling steps"""
+        growing = []
+        if len(samples) < 3:
+            return growing
+        
+        for name in samples[0]:
+            if name == "elapsed":
+                continue
+            values = np.array([sample.get(name, 0) for sample in samples], dtype=np.float64)
+            steps = np.diff(values)
+            
+            # Monotonic growth: never or rarely goes down, and still grows in the second half,
+            # so caches that fill up and then stay at their limit are not reported
+            rising = np.count_nonzero(steps > 0) / max(1, np.count_nonzero(steps))
+            still_growing = values[-1] > values[len(values) // 2]
+            if still_growing and rising >= min_increase_ratio:
+                hours = (samples[-1]["elapsed"] - samples[0]["elapsed"]) / 3600 or 1.0
+                growing.append((name, values[0], values[-1], (values[-1] - values[0]) / hours))
+        return growing
+    
+    def soak_report(self, first_snapshot, frames, trims):
+        """Summarize a soak test: duration, growth per metric and top allocation sites"""
+        samples = self.soak_samples
+        elapsed = samples[-1]["elapsed"] if samples else 0.0
+        lines = [f"Soak test: {elapsed / 3600:.2f}h, {frames} frames, {len(samples)} samples, {trims} cache trims"]
+        
+        growing = self.find_growing_metrics(samples)
+        lines.append("Monotonic growth: " + ("none" if not growing else ", ".join(name for name, *_ in growing)))
+        lines.append("")
+        for name, first, last, per_hour in growing:
+            lines.append(f"{name}: {first:.1f} -> {last:.1f} ({per_hour:+.1f}/h)")
+        
+        if samples:
+            lines.append("")
+            lines.append("Final metrics: " + ", ".join(f"{name} {value:.1f}" for name, value in samples[-1].items()))
+        
+        # Allocation sites that grew the most since the start
+        if tracemalloc.is_tracing():
+            lines.append("")
+            lines.append("Top allocation growth:")
+            for stat in tracemalloc.take_snapshot().compare_to(first_snapshot, "lineno")[:10]:
+                lines.append(f"  {stat}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def toggle_text_stabilization(self):
+        """Toggle temporal text stabilization, starting with fresh tracks"""
+        self.stabilize_text = self.stabilize_var.get()
+        self.text_stabilizer.reset()
+        self.last_text_hash = None
+    
+    def parse_cpu_list(self, spec):
+        """Parse a CPU list like "0-3,6" into a sorted list of core numbers"""
+        cores = set()
+        for part in spec.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            if '-' in part:
+                first, last = part.split('-', 1)
+                cores.update(range(int(first), int(last) + 1))
+            else:
+                cores.add(int(part))
+        return sorted(cores)
+    
+    def budget_cores(self):
+        """CPU cores the process may use under the current budget"""
+        all_cores = list(range(os.cpu_count() or 1))
+        try:
+            cores = self.parse_cpu_list(self.cpu_affinity) or all_cores
+        except ValueError:
+            cores = all_cores
+        return cores[:self.max_cores]
+    
+    def budget_threads(self):
+        """Intra-op thread count for OCR under the current budget"""
+        cores = len(self.budget_cores())
+        return min(self.intra_op_threads, cores) if self.intra_op_threads else cores
+    
+    def worker_pool_size(self, limit=8):
+        """Thread count for worker pools under the current budget"""
+        return max(1, min(limit, len(self.budget_cores())))
+    
+    def apply_thread_budget(self):
+        """Apply thread counts, CPU affinity and niceness to the process and OCR engines"""
+        cores = self.budget_cores()
+        threads = self.budget_threads()
+        
+        # Native thread pools started from now on (OpenMP in Tesseract, BLAS)
+        os.environ["OMP_THREAD_LIMIT"] = str(threads)
+        os.environ["OMP_NUM_THREADS"] = str(threads)
+        
+        # Torch inside EasyOCR
+        torch = sys.modules.get("torch")
+        if torch is not None:
+            torch.set_num_threads(threads)
+            try:
+                torch.set_num_interop_threads(self.inter_op_threads)
+            except RuntimeError:
+                # Torch only allows this before its first parallel work
+                logging.warning("Inter-op thread count applies after a restart")
+        
+        # CPU affinity; on Linux each existing thread has its own, and new threads inherit their creator's
+        try:
+            if hasattr(os, "sched_setaffinity"):
+                self.for_each_thread(lambda tid: os.sched_setaffinity(tid, cores))
+            else:
+                import psutil
+                psutil.Process().cpu_affinity(cores)
+        except (ImportError, OSError, ValueError) as e:
+            logging.warning(f"Could not set CPU affinity: {e}")
+        
+        # Process niceness
+        try:
+            if hasattr(os, "setpriority"):
+                self.for_each_thread(lambda tid: os.setpriority(os.PRIO_PROCESS, tid, self.process_niceness))
+            else:
+                import psutil
+                if self.process_niceness >= 10:
+                    priority = psutil.IDLE_PRIORITY_CLASS
+                elif self.process_niceness > 0:
+                    priority = psutil.BELOW_NORMAL_PRIORITY_CLASS
+                else:
+                    priority = psutil.NORMAL_PRIORITY_CLASS
+                psutil.Process().nice(priority)
+        except (ImportError, OSError) as e:
+            logging.warning(f"Could not set process niceness: {e}")
+        
+        logging.info(f"Resource budget: cores {cores}, intra-op {threads}, "
+                     f"inter-op {self.inter_op_threads}, niceness {self.process_niceness}")
+    
+    def for_each_thread(self, apply):
+        """Call apply(tid) for every thread of the process on Linux, or apply(0) for the process elsewhere"""
+        try:
+            thread_ids = [int(tid) for tid in os.listdir("/proc/self/task")]
+        except OSError:
+            thread_ids = [0]
+        
+        for tid in thread_ids:
+            try:
+                apply(tid)
+            except ProcessLookupError:
+                # The thread exited since the listing
+                pass
+    
+    def update_thread_budget(self):
+        """Read the resource budget from the control panel and apply it"""
+        self.max_cores = int(self.max_cores_slider.get())
+        self.intra_op_threads = int(self.intra_threads_slider.get())
+        self.inter_op_threads = int(self.inter_threads_slider.get())
+        self.cpu_affinity = self.affinity_entry.get().strip()
+        self.process_niceness = int(self.niceness_slider.get())
+        
+        # Remember the measurements from before the change for comparison
+        self.budget_baseline = (self.ocr_latency, self.ui_lag)
+        self.ocr_latency = None
+        self.ui_lag = None
+        self.ui_lag_max = 0.0
+        
+        self.apply_thread_budget()
+        
+        # ONNX Runtime sessions take their thread count at creation
+        if self.ocr_backend == "ONNX Runtime":
+            self.initialize_ocr_reader(force=True)
+    
+    def record_pipeline_latency(self, latency_ms):
+        """Feed one processed frame's latency to the quality controller"""
+        # Progressive rendering never waits for translations, so serving them from the cache saves nothing
+        self.quality_controller.inactive_levels = {"cached translations"} if self.progressive_rendering else set()
+        level = self.quality_controller.record(latency_ms)
+        if level is not None:
+            logging.info(f"Quality level changed to {level} "
+                         f"(latency {self.quality_controller.latency:.0f} ms, target {self.quality_controller.target_ms:.0f} ms)")
+            
+            # Regions read at the previous level may have been scaled differently
+            self.ocr_frame_blocks = None
+        self.root.after(0, lambda: self.quality_stats_label.config(text=self.quality_controller.describe()))
+    
+    def toggle_adaptive_quality(self):
+        """Enable or disable load shedding, returning to full quality"""
+        self.quality_controller.enabled = self.adaptive_quality_var.get()
+        self.quality_controller.reset()
+        self.ocr_frame_blocks = None
+        self.quality_stats_label.config(text=self.quality_controller.describe())
+    
+    def record_ocr_latency(self, latency_ms):
+        """Update the moving average of OCR latency"""
+        if self.ocr_latency is None:
+            self.ocr_latency = latency_ms
+        else:
+            self.ocr_latency = 0.8 * self.ocr_latency + 0.2 * latency_ms
+    
+    def measure_ui_lag(self, expected=None, interval_ms=100):
+        """Measure how late Tk runs a timer callback, as a proxy for UI responsiveness"""
+        now = time.perf_counter()
+        if expected is not None:
+            lag = max(0.0, (now - expected) * 1000)
+            self.ui_lag = lag if self.ui_lag is None else 0.9 * self.ui_lag + 0.1 * lag
+            self.ui_lag_max = max(self.ui_lag_max, lag)
+            self.ui_lag_ticks += 1
+            
+            # Refresh the statistics about once a second
+            if self.ui_lag_ticks % 10 == 0:
+                self.budget_stats_label.config(text=self.budget_stats_text())
+        else:
+            self.ui_lag_ticks = 0
+        
+        if self.polling:
+            self.root.after(interval_ms, self.measure_ui_lag, now + interval_ms / 1000, interval_ms)
+    
+    def budget_stats_text(self):
+        """Summary of OCR latency and UI lag, before and after the last budget change"""
+        def describe(ocr_latency, ui_lag):
+            ocr_text = f"{ocr_latency:.0f} ms" if ocr_latency is not None else "n/a"
+            lag_text = f"{ui_lag:.0f} ms" if ui_lag is not None else "n/a"
+            return f"OCR {ocr_text}, UI lag {lag_text}"
+        
+        text = f"Now: {describe(self.ocr_latency, self.ui_lag)} (max lag {self.ui_lag_max:.0f} ms)"
+        if self.budget_baseline is not None:
+            text += f"\nBefore: {describe(*self.budget_baseline)}"
+        return text
+    
+    def update_ocr_backend(self):
+        """Apply OCR engine and backend settings and reload the reader"""
+        self.ocr_engine = self.ocr_engine_var.get()
+        self.ocr_backend = self.ocr_backend_var.get()
+        self.onnx_quantize = self.onnx_quantize_var.get()
+        self.onnx_threads = int(self.onnx_threads_slider.get())
+        self.initialize_ocr_reader(force=True)
+    
+    def run_ocr_benchmark(self):
+        """Benchmark the OCR engines on the current capture area"""
+        screenshot = self.capture_screenshot()
+        if self.ocr_engine == "Auto":
+            self.select_ocr_engine(screenshot)
+        else:
+            self.benchmark_ocr_engines(screenshot)
+    
+    def update_min_confidence(self, value):
+        """Update the minimum OCR confidence for keeping a text fragment"""
+        try:
+            self.min_ocr_confidence = float(value) / 100
+        except ValueError:
+            pass
+    
     def update_comparison_method(self):
         """Update the image comparison method"""
         self.comparison_method = self.comparison_var.get()
     
     def quit(self):
         """Close the application"""
+        if self.translation_executor is not None:
+            self.translation_executor.shutdown(wait=False, cancel_futures=True)
+        if self.render_executor is not None:
+            self.render_executor.shutdown(wait=False, cancel_futures=True)
+        if self.prefetch_executor is not None:
+            self.prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        self.profiler.stop()
+        if self.session_recorder is not None:
+            self.session_recorder.close()
+        self.stop_replay.set()
+        if self.control_server is not None:
+            self.control_server.stop()
         if hasattr(self, 'tabs_window') and self.tabs_window:
             self.tabs_window.destroy()
         self.control_panel.destroy()
         self.root.destroy()
         sys.exit()
 
+def benchmark_ocr_backends(image_paths, languages, repeats=3, num_threads=0):
+    """Compare latency and accuracy of the OCR backends on sample frames
+    
+    Accuracy is the character similarity of each backend's text to the
+    PyTorch reference output.
+    """
+    images = [np.array(Image.open(path).convert('RGB')) for path in image_paths]
+    model_dir = os.path.join(os.path.expanduser("~"), ".OverText", "onnx")
+    configs = [("PyTorch", False), ("ONNX Runtime", False), ("ONNX Runtime", True)]
+    
+    reference = None
+    rows = []
+    
+    for backend, quantize in configs:
+        # The exported networks must not be quantized by PyTorch first
+        reader = easyocr.Reader(languages, gpu=False, quantize=backend != "ONNX Runtime")
+        if backend == "ONNX Runtime":
+            try:
+                OnnxOcrBackend(reader, model_dir, quantize=quantize, num_threads=num_threads).install()
+            except Exception as e:
+                print(f"{backend} (int8: {quantize}) unavailable: {e}")
+                continue
+        
+        # Warm up once so session creation and caches are not timed
+        reader.readtext(images[0])
+        
+        timings = []
+        texts = []
+        for image in images:
+            start = time.perf_counter()
+            for _ in range(repeats):
+                results = reader.readtext(image)
+            timings.append((time.perf_counter() - start) / repeats)
+            texts.append(" ".join(text for _, text, _ in results))
+        
+        if reference is None:
+            reference = texts
+        
+        similarity = [1.0 - TextStabilizer.edit_distance(text, ref) / max(len(text), len(ref), 1)
+                      for text, ref in zip(texts, reference)]
+        rows.append((f"{backend}{' int8' if quantize else ''}",
+                     np.mean(timings) * 1000, np.mean(similarity) * 100))
+    
+    print(f"{'Backend':<20}{'Latency (ms)':>14}{'Accuracy (%)':>14}")
+    for name, latency, accuracy in rows:
+        print(f"{name:<20}{latency:>14.1f}{accuracy:>14.1f}")
+    
+    return rows
+
+
+def make_translation_stub_server(port, delay=0.0, failure_rate=0.0):
+    """LibreTranslate-compatible stub that injects delays and failures, for testing
+    
+    The delay and failure_rate attributes of the returned server can be
+    changed while it runs.
+    """
+    
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            time.sleep(self.server.delay)
+            
+            if random.random() < self.server.failure_rate:
+                self.send_error(500, "Injected failure")
+                return
+            
+            body = json.dumps({"translatedText": f"[{request.get('target', '')}] {request.get('q', '')}"}).encode("utf-8")
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                # The client gave up waiting, which is what the delay is for
+                pass
+        
+        def log_message(self, format, *args):
+            logging.info("stub: " + format, *args)
+    
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.delay = delay
+    server.failure_rate = failure_rate
+    return server
+
+
+def run_translation_stub_server(port, delay=0.0, failure_rate=0.0):
+    """Serve the translation stub until interrupted"""
+    server = make_translation_stub_server(port, delay, failure_rate)
+    print(f"Translation stub on http://127.0.0.1:{port} (delay {delay}s, failure rate {failure_rate:.0%})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OverText screen translation overlay")
+    parser.add_argument("--benchmark-ocr", nargs="+", metavar="IMAGE",
+                        help="compare OCR backend latency and accuracy on sample frames and exit")
+    parser.add_argument("--ocr-languages", default="en",
+                        help="comma-separated OCR languages for the benchmark (default: en)")
+    parser.add_argument("--threads", type=int, default=0,
+                        help="ONNX Runtime intra-op threads for the benchmark (default: auto)")
+    parser.add_argument("--replay", metavar="SESSION",
+                        help="replay a recorded session file instead of capturing the screen")
+    parser.add_argument("--replay-max-speed", action="store_true",
+                        help="replay frames as fast as possible instead of at recorded pace")
+    parser.add_argument("--soak", metavar="SESSION",
+                        help="replay a recorded session in a loop and report memory growth")
+    parser.add_argument("--soak-hours", type=float, default=1.0,
+                        help="duration of the soak test in hours (default: 1)")
+    parser.add_argument("--memory-ceiling", type=int, default=0, metavar="MB",
+                        help="trim caches when the process uses more memory than this (default: off)")
+    parser.add_argument("--target-languages", metavar="LANGS",
+                        help="comma-separated target languages, the first one is shown on the overlay")
+    parser.add_argument("--output", metavar="FILE",
+                        help="append the translations of every processed frame to this JSON Lines file")
+    parser.add_argument("--control-socket", nargs="?", const="", metavar="PATH_OR_PORT",
+                        help="accept capture commands on a local socket (default: ~/.OverText/control.sock)")
+    parser.add_argument("--no-polling", action="store_true",
+                        help="never capture on a timer; capture only when commanded over the control socket")
+    parser.add_argument("--send", metavar="COMMAND",
+                        help="send a command to a running instance's control socket, print the reply and exit")
+    parser.add_argument("--translation-stub-server", type=int, metavar="PORT",
+                        help="run a LibreTranslate-compatible stub server for testing and exit when stopped")
+    parser.add_argument("--stub-delay", type=float, default=0.0,
+                        help="seconds the stub server waits before answering (default: 0)")
+    parser.add_argument("--stub-failure-rate", type=float, default=0.0,
+                        help="share of stub requests answered with HTTP 500 (default: 0)")
+    args = parser.parse_args()
+    
+    if args.translation_stub_server:
+        run_translation_stub_server(args.translation_stub_server, args.stub_delay, args.stub_failure_rate)
+        sys.exit()
+    
+    if args.send:
+        address = ControlServer.parse_address(args.control_socket) if args.control_socket else None
+        try:
+            print(json.dumps(ControlServer.send(args.send, address), ensure_ascii=False, indent=2))
+        except OSError as e:
+            print(f"No OverText control socket reachable: {e}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit()
+    
+    if args.benchmark_ocr:
+        benchmark_ocr_backends(args.benchmark_ocr, args.ocr_languages.split(","), num_threads=args.threads)
+        sys.exit()
+    
     root = tk.Tk()
     app = OverText(root)
+    if args.target_languages:
+        app.target_lang.delete(0, tk.END)
+        app.target_lang.insert(0, args.target_languages)
+    if args.output:
+        app.output_path = args.output
+    if args.memory_ceiling:
+        app.memory_ceiling_slider.set(args.memory_ceiling)
+    if args.control_socket is not None:
+        if args.control_socket:
+            app.control_address = ControlServer.parse_address(args.control_socket)
+        app.control_socket_var.set(True)
+        app.toggle_control_socket()
+    if args.no_polling:
+        app.disable_polling()
+    if args.replay:
+        app.session_path.insert(0, args.replay)
+        root.after(500, app.start_replay, args.replay, args.replay_max_speed)
+    elif args.soak:
+        app.session_path.insert(0, args.soak)
+        root.after(500, app.start_soak_test, args.soak, args.soak_hours)
     root.mainloop()
@@ -0,0 +1,33 @@
+import pytest
+
+# OverText imports its GUI, OCR and translation dependencies at module level
+for module in ("tkinter", "PIL", "skimage", "deep_translator", "easyocr", "numpy"):
+    pytest.importorskip(module)
+
+from OverText import LanguageIdentifier
+
+
+@pytest.mark.parametrize("text, language", [
+    ("This is a test of the system", "en"),
+    ("Das ist nicht gut", "de"),
+    ("Le chat est sur la table", "fr"),
+])
+def test_profiled_languages(text, language):
+    assert LanguageIdentifier().identify(text)[0] == language
+
+
+@pytest.mark.parametrize("text", [
+    "Nie wiem, to jest problem",
+    "To jest mój dom",
+    "Tôi là một người",
+])
+def test_unprofiled_latin_text_is_unknown(text):
+    assert LanguageIdentifier().identify(text) == (None, 0.0)
+
+
+def test_han_only_text_follows_hint():
+    identifier = LanguageIdentifier()
+    
+    assert identifier.identify("東京都")[0] == "zh"
+    assert identifier.identify("東京都", identifier.han_hint(["東京都", "ようこそ"]))[0] == "ja"
+    assert identifier.identify("東京都", identifier.han_hint(["東京都"], "ja"))[0] == "ja"
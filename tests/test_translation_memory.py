@@ -0,0 +1,39 @@
+import pytest
+
+# OverText imports its GUI, OCR and translation dependencies at module level
+for module in ("tkinter", "PIL", "skimage", "deep_translator", "easyocr", "numpy"):
+    pytest.importorskip(module)
+
+from OverText import TranslationMemory
+
+
+def test_number_slots_round_trip():
+    memory = TranslationMemory()
+    memory.store("You have 1 potion and 0 gold", "Du hast 1 Trank und 0 Gold", "en", "de")
+
+    assert memory.lookup("You have 7 potion and 5 gold", "en", "de") == "Du hast 7 Trank und 5 Gold"
+
+
+def test_reordered_and_repeated_slots():
+    memory = TranslationMemory()
+    memory.store("Level 10 of 1", "1: Stufe 10", "en", "de")
+    memory.store("3 and 3", "3 und 3", "en", "de")
+
+    assert memory.lookup("Level 12 of 3", "en", "de") == "3: Stufe 12"
+    assert memory.lookup("4 and 5", "en", "de") == "4 und 5"
+
+
+def test_missing_slot_value_is_stored_untemplated():
+    memory = TranslationMemory()
+    memory.store("2 swords", "zwei Schwerter", "en", "de")
+
+    assert memory.lookup("2 swords", "en", "de") == "zwei Schwerter"
+    assert memory.lookup("3 swords", "en", "de") is None
+
+
+def test_glossary_slots_round_trip():
+    memory = TranslationMemory()
+    memory.set_glossary({"Excalibur": "Exkalibur"})
+    memory.store("Excalibur deals 5 damage", "Exkalibur verursacht 5 Schaden", "en", "de")
+
+    assert memory.lookup("Excalibur deals 9 damage", "en", "de") == "Exkalibur verursacht 9 Schaden"
@@ -0,0 +1,98 @@
+import json
+import threading
+import time
+import urllib.request
+
+import pytest
+
+# OverText imports its GUI, OCR and translation dependencies at module level
+for module in ("tkinter", "PIL", "skimage", "deep_translator", "easyocr", "numpy"):
+    pytest.importorskip(module)
+
+from OverText import TranslationRouter, make_translation_stub_server
+
+
+@pytest.fixture
+def stub_servers():
+    """Start stub servers on free ports, each returned as its provider URL and server"""
+    servers = []
+    
+    def start(**settings):
+        server = make_translation_stub_server(0, **settings)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}", server
+    
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def translate_with(url, text="hello"):
+    """Request a translation from a stub server the way deep_translator does, without a timeout"""
+    payload = json.dumps({"q": text, "source": "en", "target": "de"}).encode("utf-8")
+    request = urllib.request.Request(url + "/translate", data=payload, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read().decode("utf-8"))["translatedText"]
+
+
+def test_hedge_fires_after_delay(stub_servers):
+    slow, _ = stub_servers(delay=2.0)
+    fast, _ = stub_servers()
+    router = TranslationRouter(latency_budget=5.0, hedge_delay=0.2)
+    
+    start = time.perf_counter()
+    assert router.translate(translate_with, [slow, fast]) == "[de] hello"
+    elapsed = time.perf_counter() - start
+    
+    assert 0.2 <= elapsed < 1.0
+    assert router.provider(fast)["hedges"] == 1
+
+
+def test_breaker_trips_and_recovers_through_trial(stub_servers):
+    flaky, server = stub_servers(failure_rate=1.0)
+    backup, _ = stub_servers()
+    router = TranslationRouter(latency_budget=2.0, failure_threshold=2, cooldown=0.3)
+    
+    for _ in range(2):
+        assert router.translate(translate_with, [flaky, backup]) == "[de] hello"
+    assert router.provider(flaky)["opened_at"] is not None
+    
+    # While open, the flaky provider is skipped without being asked
+    requests = len(router.provider(flaky)["outcomes"])
+    router.translate(translate_with, [flaky, backup])
+    assert len(router.provider(flaky)["outcomes"]) == requests
+    
+    # After the cooldown one trial request closes the breaker again
+    server.failure_rate = 0.0
+    time.sleep(0.3)
+    router.translate(translate_with, [flaky, backup])
+    assert router.provider(flaky)["opened_at"] is None
+
+
+def test_latency_budget_is_enforced(stub_servers):
+    slow, _ = stub_servers(delay=1.0)
+    slower, _ = stub_servers(delay=1.0)
+    router = TranslationRouter(latency_budget=0.5, hedge_delay=0.1)
+    
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        router.translate(translate_with, [slow, slower])
+    assert time.perf_counter() - start < 0.8
+
+
+def test_hung_provider_trips_and_does_not_starve_others(stub_servers):
+    hung, _ = stub_servers(delay=30.0)
+    fast, _ = stub_servers()
+    router = TranslationRouter(latency_budget=0.5, hedge_delay=0.1, failure_threshold=3)
+    
+    # Every request is served by the hedge, however many calls are stuck on the hung provider
+    for _ in range(10):
+        assert router.translate(translate_with, [hung, fast]) == "[de] hello"
+    
+    # Calls still running after the budget count as failures and trip the breaker
+    time.sleep(0.6)
+    state = router.provider(hung)
+    assert state["opened_at"] is not None
+    assert not any(state["outcomes"])